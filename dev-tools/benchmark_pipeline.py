@@ -0,0 +1,488 @@
+"""
+Pipeline benchmark for limterm project.
+Drives ingest -> parse -> buffer -> render with synthetic data on the headless
+Agg backend and stores JSON results so runs can be compared.
+
+Usage:
+    python dev-tools/benchmark_pipeline.py [--quick] [--no-rc] [--output FILE]
+    python dev-tools/benchmark_pipeline.py --compare BASE.json NEW.json
+"""
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+RATES_HZ = [100, 1000, 10000]
+WINDOW_SIZES = [50, 500, 5000]
+OSC_WINDOW_SIZES = [25, 100]
+FRAME_RATE = 30
+BUFFER_SIZE = 10000
+SERIES_COUNT = 3
+# Rows the oscilloscope reads back per frame (osc_tab.TRIGGER_LOOKBACK)
+OSC_LOOKBACK = 200
+
+
+def synthetic_line(n):
+    """Build one whitespace-separated line like the synthetic generator does."""
+    t = n / 100.0
+    return (
+        f"{n} {t:.3f} {math.sin(t):.6f} {math.cos(t):.6f} "
+        f"{math.sin(3 * t) * 0.5:.6f} {(n % 50) / 50.0:.6f}"
+    )
+
+
+class LineSource:
+    """Endless deterministic stream of synthetic lines."""
+
+    def __init__(self):
+        self.n = 0
+
+    def take(self, count):
+        lines = [synthetic_line(self.n + i) for i in range(count)]
+        self.n += count
+        return lines
+
+
+class PipelineBenchmark:
+    def __init__(self, quick=False, rc_optimizations=True):
+        self.quick = quick
+        self.rc_optimizations = rc_optimizations
+        self.frames = 20 if quick else 60
+        self.memory_frames = 5 if quick else 15
+        self.results = []
+        self.tk_root = None
+        self.tk_error = None
+
+    def setup(self):
+        """Configure matplotlib and, when a display is available, a hidden Tk root."""
+        import matplotlib
+
+        if self.rc_optimizations:
+            from limterm.matplotlib_optimizations import (
+                configure_matplotlib_performance,
+            )
+
+            configure_matplotlib_performance("Agg")
+        else:
+            matplotlib.use("Agg")
+
+        try:
+            import tkinter as tk
+
+            self.tk_root = tk.Tk()
+            self.tk_root.withdraw()
+        except Exception as e:
+            self.tk_root = None
+            self.tk_error = str(e)
+
+    def teardown(self):
+        if self.tk_root is not None:
+            try:
+                self.tk_root.destroy()
+            except Exception:
+                pass
+            self.tk_root = None
+
+    def measure(self, name, params, make_step, iterations, unit_count):
+        """
+        Time a workload and record its peak traced memory.
+
+        make_step() returns a fresh step callable so the timed and the traced
+        runs start from the same state. unit_count is the number of lines one
+        step processes, used for the lines/s figure.
+        """
+        step = make_step()
+        durations = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            step()
+            durations.append(time.perf_counter() - start)
+
+        step = make_step()
+        tracemalloc.start()
+        try:
+            for _ in range(min(iterations, self.memory_frames)):
+                step()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        total = sum(durations)
+        sorted_ms = sorted(d * 1000 for d in durations)
+        metrics = {
+            "iterations": iterations,
+            "ms_per_frame": statistics.mean(sorted_ms),
+            "ms_p50": sorted_ms[len(sorted_ms) // 2],
+            "ms_p95": sorted_ms[min(len(sorted_ms) - 1, int(len(sorted_ms) * 0.95))],
+            "ms_max": sorted_ms[-1],
+            "lines_per_s": (unit_count * iterations / total) if total > 0 else None,
+            "peak_memory_kb": peak / 1024,
+        }
+        self.results.append({"benchmark": name, "params": params, "metrics": metrics})
+        self._print_result(name, params, metrics)
+
+    def skip(self, name, reason):
+        self.results.append({"benchmark": name, "skipped": reason})
+        print(f"  {name:<26} skipped: {reason}")
+
+    def _print_result(self, name, params, metrics):
+        label = " ".join(f"{k}={v}" for k, v in params.items())
+        lines_s = metrics["lines_per_s"]
+        lines_text = f"{lines_s:>12,.0f} lines/s" if lines_s else ""
+        print(
+            f"  {name:<26} {label:<28} {metrics['ms_per_frame']:>9.3f} ms/frame "
+            f"{lines_text} {metrics['peak_memory_kb']:>9.1f} KiB peak"
+        )
+
+    def bench_parser(self):
+        from limterm.utils import DataParser
+
+        for window in WINDOW_SIZES + [BUFFER_SIZE]:
+            lines = LineSource().take(window)
+
+            def make_step(lines=lines):
+                def step():
+                    DataParser.extract_columns(lines, 0, 2)
+
+                return step
+
+            self.measure(
+                "parser.extract_columns",
+                {"window": window},
+                make_step,
+                self.frames,
+                window,
+            )
+
+    def bench_data_tab(self):
+        if self.tk_root is None:
+            self.skip("data_tab.add_data", f"Tk unavailable ({self.tk_error})")
+            return
+
+        from limterm.gui.data_tab import DataTab
+
+        for preview in (False, True):
+            for rate in RATES_HZ:
+                batch = max(1, rate // FRAME_RATE)
+
+                def make_step(batch=batch, preview=preview):
+                    data_tab = DataTab(self.tk_root)
+                    data_tab.capture_enabled.set_value(False)
+                    data_tab._close_capture_file()
+                    data_tab.preview_enabled.set_value(preview)
+                    source = LineSource()
+
+                    def step():
+                        for line in source.take(batch):
+                            data_tab.add_data(line)
+
+                    return step
+
+                self.measure(
+                    "data_tab.add_data",
+                    {"rate_hz": rate, "preview": preview},
+                    make_step,
+                    self.frames,
+                    batch,
+                )
+
+    def bench_replay(self):
+        """Replay a timestamped capture at max speed through the transport loop."""
+        from limterm.core import CaptureReplay
+
+        count = 20000 if self.quick else 100000
+        path = os.path.abspath("bench_capture.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            for n, line in enumerate(LineSource().take(count)):
+                f.write(f"00:{n // 6000 % 60:02d}:{n % 6000 / 100:06.3f} {line}\n")
+
+        def make_step():
+            buffer = deque(maxlen=BUFFER_SIZE)
+
+            def step():
+                replay = CaptureReplay(
+                    path, data_callback=lambda line, t: buffer.append(line), speed=None
+                )
+                replay.connect(timeout=60.0)
+                while not replay.finished:
+                    time.sleep(0.001)
+                replay.disconnect()
+
+            return step
+
+        self.measure(
+            "replay.max_speed",
+            {"lines": count},
+            make_step,
+            3 if self.quick else 5,
+            count,
+        )
+
+    def _frame_driver(self, rate, render):
+        """Return a step that appends one frame's worth of lines, then renders."""
+        buffer = deque(maxlen=BUFFER_SIZE)
+        source = LineSource()
+        buffer.extend(source.take(BUFFER_SIZE))
+        batch = max(1, rate // FRAME_RATE)
+
+        def step():
+            buffer.extend(source.take(batch))
+            render(list(buffer))
+
+        return step
+
+    def _parsed_frame_driver(self, rate, render):
+        """Like _frame_driver, but render gets parsed rows from a ParseCache.
+
+        The buffer and cache are the ones DataTab uses, so each line is parsed
+        once, when it is first read, as in the application.
+        """
+        from limterm.core import LineBuffer, ParseCache
+
+        buffer = LineBuffer(BUFFER_SIZE)
+        parsed = ParseCache(BUFFER_SIZE, buffer.since)
+        source = LineSource()
+        buffer.extend(source.take(BUFFER_SIZE))
+        batch = max(1, rate // FRAME_RATE)
+
+        def step():
+            buffer.extend(source.take(batch))
+            render(parsed.tail(OSC_LOOKBACK))
+
+        return step
+
+    def bench_graph(self):
+        from limterm.core import GraphManager
+        from limterm.utils import DataParser
+
+        graph_manager = GraphManager()
+        colors = ["#1f77b4", "#d62728", "#2ca02c"]
+        settings_list = [
+            {"type": "line", "color": "blue", "marker": "o"},
+            {"type": "line", "color": "red", "marker": "o"},
+            {"type": "line", "color": "green", "marker": "o"},
+        ]
+
+        def extract(data_lines, window):
+            data_lines = data_lines[-window:]
+            x_data, _ = DataParser.extract_columns(data_lines, 1, 0)
+            y_series = [
+                DataParser.extract_columns(data_lines, 1, 2 + i)[1]
+                for i in range(SERIES_COUNT)
+            ]
+            return x_data, y_series
+
+        for rate in RATES_HZ:
+            for window in WINDOW_SIZES:
+
+                def make_multi(rate=rate, window=window):
+                    def render(data_lines):
+                        x_data, y_series = extract(data_lines, window)
+                        graph_manager.plot_multi_series(
+                            x_data, y_series, settings_list, x_col=1
+                        )
+
+                    return self._frame_driver(rate, render)
+
+                def make_stacked(rate=rate, window=window):
+                    def render(data_lines):
+                        x_data, y_series = extract(data_lines, window)
+                        y_series = [[abs(v) for v in y] for y in y_series]
+                        graph_manager.plot_stacked_series(
+                            x_data, y_series, colors, normalize_100=True
+                        )
+
+                    return self._frame_driver(rate, render)
+
+                params = {"rate_hz": rate, "window": window}
+                self.measure(
+                    "graph.plot_multi_series", params, make_multi, self.frames, window
+                )
+                self.measure(
+                    "graph.plot_stacked_series",
+                    params,
+                    make_stacked,
+                    self.frames,
+                    window,
+                )
+
+    def bench_osc(self):
+        from limterm.core import GraphManager
+        from limterm.gui.osc_trigger import (
+            extract_recent_values,
+            find_trigger_windows,
+        )
+
+        graph_manager = GraphManager()
+        trigger_level = 0.0
+
+        for rate in RATES_HZ:
+            for window in OSC_WINDOW_SIZES:
+
+                def make_step(rate=rate, window=window):
+                    trigger_sets = []
+
+                    def render(rows):
+                        values = extract_recent_values(rows, 2)
+                        trigger_indices, _ = find_trigger_windows(
+                            values, trigger_level, "rising", window
+                        )
+                        trigger_sets.extend(
+                            values[i : i + window] for i in trigger_indices
+                        )
+                        del trigger_sets[:-3]
+
+                        graph_manager.clear()
+                        for window_data in trigger_sets:
+                            graph_manager.plot_line(
+                                list(range(len(window_data))), window_data
+                            )
+                        graph_manager.plot_line(
+                            [0, window - 1], [trigger_level, trigger_level], "red"
+                        )
+                        graph_manager.update()
+
+                    return self._parsed_frame_driver(rate, render)
+
+                self.measure(
+                    "osc.trigger_frame",
+                    {"rate_hz": rate, "window": window},
+                    make_step,
+                    self.frames,
+                    max(1, rate // FRAME_RATE),
+                )
+
+    def run(self):
+        print("📊 Pipeline Benchmark")
+        print("=" * 50)
+        self.setup()
+        try:
+            self.bench_parser()
+            self.bench_data_tab()
+            self.bench_graph()
+            self.bench_osc()
+            self.bench_replay()
+        finally:
+            self.teardown()
+        return self.results
+
+    def metadata(self):
+        import matplotlib
+
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=ROOT_DIR,
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+        except Exception:
+            commit = None
+
+        return {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "commit": commit or None,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "matplotlib": matplotlib.__version__,
+            "backend": matplotlib.get_backend(),
+            "rc_optimizations": self.rc_optimizations,
+            "quick": self.quick,
+            "frame_rate": FRAME_RATE,
+            "buffer_size": BUFFER_SIZE,
+        }
+
+
+def result_key(entry):
+    params = entry.get("params", {})
+    return (entry["benchmark"],) + tuple(sorted(params.items()))
+
+
+def compare(base_path, new_path):
+    """Print per-benchmark ms/frame and lines/s ratios between two result files."""
+    with open(base_path, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    with open(new_path, "r", encoding="utf-8") as f:
+        new = json.load(f)
+
+    base_results = {
+        result_key(r): r["metrics"] for r in base["results"] if "metrics" in r
+    }
+
+    print(f"🔍 Comparing {base_path} -> {new_path}")
+    print("=" * 50)
+    for entry in new["results"]:
+        if "metrics" not in entry:
+            continue
+        old = base_results.get(result_key(entry))
+        if old is None:
+            continue
+        new_ms = entry["metrics"]["ms_per_frame"]
+        old_ms = old["ms_per_frame"]
+        speedup = old_ms / new_ms if new_ms > 0 else float("inf")
+        marker = "✅" if speedup >= 1.05 else "❌" if speedup <= 0.95 else "  "
+        label = " ".join(f"{k}={v}" for k, v in entry.get("params", {}).items())
+        print(
+            f"{marker} {entry['benchmark']:<26} {label:<28} "
+            f"{old_ms:>9.3f} -> {new_ms:>9.3f} ms/frame ({speedup:.2f}x)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="run fewer frames")
+    parser.add_argument(
+        "--no-rc",
+        action="store_true",
+        help="skip matplotlib_optimizations rcParams (baseline for comparison)",
+    )
+    parser.add_argument("--output", help="JSON results file")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    if args.output:
+        output_path = Path(args.output).resolve()
+    else:
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = Path("lim_benchmarks").resolve() / f"bench_{timestamp}.json"
+
+    benchmark = PipelineBenchmark(quick=args.quick, rc_optimizations=not args.no_rc)
+
+    # DataTab reads and writes lim_config/ in the working directory
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        try:
+            results = benchmark.run()
+        finally:
+            os.chdir(original_cwd)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump({"meta": benchmark.metadata(), "results": results}, f, indent=2)
+
+    print("\n" + "=" * 50)
+    print(f"✅ Results saved to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Parsing consistency checks for limterm project.
+Checks that every line parser returns one row per input line, blank and
+unparsable lines included, since the parse cache and the oscilloscope map
+rows back to line numbers by position, and that searches report the right
+line numbers across blank and missing lines.
+
+Usage:
+    python dev-tools/check_parsing.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from limterm.core.line_search import SearchQuery  # noqa: E402
+from limterm.utils.line_parsers import (  # noqa: E402
+    CsvParser,
+    JsonParser,
+    KeyValueParser,
+    WhitespaceParser,
+)
+
+PARSER_CASES = [
+    (WhitespaceParser, ["1 2 3", "", "4 5 6", "   ", "7 8 9"]),
+    (WhitespaceParser, ["", "1 2", ""]),
+    (WhitespaceParser, ["1 2", "x y", "", "3"]),
+    (CsvParser, ["1,2", "", "3,4"]),
+    (KeyValueParser, ["a=1 b=2", "", "b=3"]),
+    (JsonParser, ['{"a": 1}', "", '{"a": 2, "b": 3}']),
+]
+
+# None stands for a line no longer available (neither buffered nor on disk)
+SEARCH_CASES = [
+    ("c2 > 5", ["1 1 1", "1 9 1", None, "1 9 1"], [1, 3]),
+    ("c2 > 5", ["1 1 1", "", None, "1 9 1", "1 9 1"], [3, 4]),
+    ("c2 > 5", [None, None], []),
+    ("col1 == 1 and c3 < 2", ["", "1 2 1", None, "1 2 3", "1 2 1"], [1, 4]),
+    ("9", ["1 1 1", None, "", "1 9 1"], [3]),
+]
+
+
+class Checker:
+    def __init__(self):
+        self.failures = 0
+
+    def expect(self, name, actual, expected):
+        if actual == expected:
+            print(f"ok    {name}")
+        else:
+            self.failures += 1
+            print(f"FAIL  {name}: got {actual}, expected {expected}")
+
+    def check_parsers(self):
+        for parser_class, lines in PARSER_CASES:
+            values = parser_class().parse_lines(lines)
+            self.expect(
+                f"{parser_class.__name__} rows for {lines!r}", len(values), len(lines)
+            )
+            if len(values) != len(lines):
+                continue
+            # A blank line parses to a row of NaN wherever it sits
+            blank = [index for index, line in enumerate(lines) if not line.strip()]
+            self.expect(
+                f"{parser_class.__name__} blank rows for {lines!r}",
+                bool(np.isnan(values[blank]).all()) if values.shape[1] else True,
+                True,
+            )
+
+    def check_search(self):
+        for text, lines, expected in SEARCH_CASES:
+            found = SearchQuery(text).match(lines).tolist()
+            self.expect(f"search {text!r} in {lines!r}", found, expected)
+
+    def run(self):
+        self.check_parsers()
+        self.check_search()
+        print("\n" + "=" * 50)
+        if self.failures:
+            print(f"❌ {self.failures} check(s) FAILED")
+            return False
+        print("✅ All parsing checks passed!")
+        return True
+
+
+def main():
+    sys.exit(0 if Checker().run() else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,8 @@ DEFAULT_BAUDRATES = [
 DEFAULT_BAUDRATE = "9600"
 SERIAL_TIMEOUT = 1
 
+CAPTURE_DIR = "lim_captures"
+
 FIGURE_SIZE = (5, 4)
 FIGURE_DPI = 100
 DEFAULT_X_COLUMN = "2"
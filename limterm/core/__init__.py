@@ -1,4 +1,42 @@
 from .serial_manager import SerialManager
+from .device_hub import DeviceHub
+from .transports import Transport, get_transport_loop, open_transport
+from .replay import CaptureReplay
+from .pyramid import SamplePyramid, row_to_floats
+from .statistics import RollingStatistics
+from .line_buffer import LineBuffer
+from .line_index import LineIndex
+from .line_search import LineSearch, SearchQuery
+from .segment_store import SegmentStore
+from .export import ExportJob, export_format, read_chunks
+from .parse_cache import ParseCache
 from .graph_manager import GraphManager
+from .latency import LatencyTracker, get_latency_tracker
+from .metrics import MetricsRegistry, MetricsExporter, get_metrics
 
-__all__ = ["SerialManager", "GraphManager"]
+__all__ = [
+    "SerialManager",
+    "DeviceHub",
+    "Transport",
+    "get_transport_loop",
+    "open_transport",
+    "CaptureReplay",
+    "SamplePyramid",
+    "row_to_floats",
+    "RollingStatistics",
+    "LineBuffer",
+    "LineIndex",
+    "LineSearch",
+    "SearchQuery",
+    "SegmentStore",
+    "ExportJob",
+    "export_format",
+    "read_chunks",
+    "ParseCache",
+    "GraphManager",
+    "LatencyTracker",
+    "get_latency_tracker",
+    "MetricsRegistry",
+    "MetricsExporter",
+    "get_metrics",
+]
@@ -0,0 +1,110 @@
+"""
+Axis auto-ranging with hysteresis.
+
+AutoScale turns the data bounds of each frame into axis limits. Limits grow
+as soon as the data leaves them and are refitted only when the data shrinks
+to less than `shrink_below` of the axis span, so a signal wobbling inside
+the view leaves the axes still instead of rescaling them every frame.
+
+SweepExtents keeps the bounds of each stored sweep of a fixed ring of
+sweeps. A sweep's bounds are computed once, when it enters the ring, so the
+bounds of everything shown cost one comparison per slot per frame.
+column_bounds does the same per channel for multi-channel sweeps, whose
+offsets are only added when the bounds are combined.
+"""
+
+import numpy as np
+
+DEFAULT_MARGIN = 0.1
+SHRINK_BELOW = 0.5
+
+
+def data_bounds(*arrays):
+    """(low, high) over the finite values of the arrays, or None when there are none."""
+    low = high = None
+    for values in arrays:
+        if values is None:
+            continue
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if not values.size:
+            continue
+        array_low, array_high = values.min(), values.max()
+        low = array_low if low is None else min(low, array_low)
+        high = array_high if high is None else max(high, array_high)
+    return None if low is None else (float(low), float(high))
+
+
+def combine_bounds(*bounds):
+    """(low, high) spanning every (low, high) given; None entries are skipped."""
+    bounds = [b for b in bounds if b is not None]
+    if not bounds:
+        return None
+    return min(b[0] for b in bounds), max(b[1] for b in bounds)
+
+
+def column_bounds(values):
+    """(lows, highs) per column of a 2-D array over its finite values.
+
+    A column without finite values has an infinite low and a negative
+    infinite high, so it never widens combined bounds.
+    """
+    values = np.asarray(values, dtype=float)
+    finite = np.isfinite(values)
+    lows = np.where(finite, values, np.inf).min(axis=0, initial=np.inf)
+    highs = np.where(finite, values, -np.inf).max(axis=0, initial=-np.inf)
+    return lows, highs
+
+
+class AutoScale:
+    def __init__(
+        self, margin=DEFAULT_MARGIN, min_margin=0.1, shrink_below=SHRINK_BELOW
+    ):
+        self.margin = margin
+        self.min_margin = min_margin
+        self.shrink_below = shrink_below
+        self.limits = None
+
+    def reset(self):
+        self.limits = None
+
+    def update(self, low, high):
+        """Return the axis limits for data spanning [low, high]."""
+        if low is None or not np.isfinite(low) or not np.isfinite(high):
+            return self.limits
+        span = high - low
+        if self.limits is not None:
+            limit_low, limit_high = self.limits
+            inside = limit_low <= low and high <= limit_high
+            if inside and span >= (limit_high - limit_low) * self.shrink_below:
+                return self.limits
+        margin = max(span * self.margin, self.min_margin)
+        self.limits = (low - margin, high + margin)
+        return self.limits
+
+
+class SweepExtents:
+    """Bounds of the sweeps stored in a ring of `slots` entries."""
+
+    def __init__(self, slots):
+        self.slots = slots
+        self.reset()
+
+    def reset(self):
+        self._x = [None] * self.slots
+        self._y = [None] * self.slots
+
+    def set(self, slot, x_data, y_data):
+        """Record the sweep now stored in `slot`, replacing the one it evicted."""
+        self._x[slot] = data_bounds(x_data)
+        self._y[slot] = data_bounds(y_data)
+
+    def remove(self, slot):
+        self._x[slot] = None
+        self._y[slot] = None
+
+    def x_bounds(self, *extra):
+        return combine_bounds(*self._x, *extra)
+
+    def y_bounds(self, *extra):
+        return combine_bounds(*self._y, *extra)
@@ -0,0 +1,133 @@
+"""
+Several serial devices acquired in parallel and merged into one timeline.
+
+Every device gets its own SerialManager (and therefore its own reader
+thread) and parser. Each incoming line updates that device's latest
+columns and emits one merged line:
+
+    <seconds since connect> <device 1 columns> <device 2 columns> ...
+
+so the graph and oscilloscope tabs can plot columns of different devices
+together. Values a device has not refreshed are held from its previous line.
+"""
+
+import threading
+import time
+from ..utils import ParserSelector
+from .serial_manager import SerialManager
+
+
+class Device:
+    def __init__(self, port, baudrate, parser_mode="auto"):
+        self.port = port
+        self.baudrate = baudrate
+        self.latest = None
+        self.width = None
+        self.manager = None
+        self.parser = ParserSelector(parser_mode)
+
+
+class DeviceHub:
+    def __init__(
+        self,
+        data_callback=None,
+        error_callback=None,
+        layout_callback=None,
+    ):
+        self.data_callback = data_callback
+        self.error_callback = error_callback
+        self.layout_callback = layout_callback
+        self.protocol = None
+        self.parser_mode = "auto"
+        self.devices = []
+        self._lock = threading.Lock()
+        self._start_time = None
+        self._last_emitted = None
+        self._layout_ready = False
+
+    @property
+    def is_connected(self):
+        return any(d.manager and d.manager.is_connected for d in self.devices)
+
+    def connect(self, port_settings):
+        """Connect every (port, baudrate) pair; all or nothing."""
+        self.disconnect()
+
+        self.devices = [
+            Device(port, baudrate, self.parser_mode) for port, baudrate in port_settings
+        ]
+        self._start_time = time.perf_counter()
+        self._last_emitted = None
+        self._layout_ready = False
+
+        for index, device in enumerate(self.devices):
+            device.manager = SerialManager(
+                data_callback=lambda line, arrival_time=None, index=index: self._on_line(
+                    index, line, arrival_time
+                ),
+                error_callback=self._on_error,
+            )
+            device.manager.set_protocol(self.protocol)
+            if not device.manager.connect(device.port, device.baudrate):
+                self.disconnect()
+                return False
+
+        return True
+
+    def disconnect(self):
+        for device in self.devices:
+            if device.manager:
+                device.manager.disconnect()
+
+    def column_layout(self):
+        """Return [(first_column, last_column, port)] using 1-based columns."""
+        layout = []
+        column = 2
+        for device in self.devices:
+            width = device.width or 0
+            layout.append((column, column + width - 1, device.port))
+            column += width
+        return layout
+
+    def _on_error(self, message):
+        if self.error_callback:
+            self.error_callback(message)
+
+    def _on_line(self, index, line, arrival_time):
+        if arrival_time is None:
+            arrival_time = time.perf_counter()
+
+        device = self.devices[index]
+        device.parser.observe(line)
+        columns = device.parser.parse_line(line)
+        if not columns:
+            return
+
+        with self._lock:
+            if device.width is None:
+                device.width = len(columns)
+            # Keep column offsets stable when a device changes its line length
+            if len(columns) < device.width:
+                columns = columns + ["nan"] * (device.width - len(columns))
+            device.latest = columns[: device.width]
+
+            if not self._layout_ready:
+                if any(d.width is None for d in self.devices):
+                    return
+                self._layout_ready = True
+                if self.layout_callback:
+                    self.layout_callback(self.column_layout())
+
+            # Threads can lose the race for the lock by a few microseconds;
+            # clamp so the merged timeline stays monotonic.
+            if self._last_emitted is not None and arrival_time < self._last_emitted:
+                arrival_time = self._last_emitted
+            self._last_emitted = arrival_time
+
+            merged = [f"{arrival_time - self._start_time:.6f}"]
+            for other in self.devices:
+                merged.extend(other.latest)
+            merged_line = " ".join(merged)
+
+            if self.data_callback:
+                self.data_callback(merged_line, arrival_time)
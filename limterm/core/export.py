@@ -0,0 +1,210 @@
+"""
+Streaming export of received lines or parsed rows to TXT, CSV, NPZ or BIN.
+
+An ExportJob runs on a worker thread and pulls its data from a source one
+chunk at a time, so exporting a whole session never holds more than a chunk
+in memory. A chunk is a list of text lines (None marks a line that is no
+longer available and is skipped) or a 2-D float array.
+
+- TXT writes text lines as they are and array rows tab-separated.
+- BIN writes each chunk as it arrives: a magic header, then per chunk its
+  row and column counts and the float64 values (see read_chunks).
+- CSV and NPZ need the final column count before the first row, so parsed
+  chunks are first spooled to a temporary file, then copied out padded with
+  NaN to the widest chunk.
+
+The file is written under a temporary name and renamed once complete, so a
+cancelled or failed export leaves nothing behind.
+"""
+
+import os
+import struct
+import tempfile
+import threading
+import zipfile
+import numpy as np
+from numpy.lib import format as npy_format
+from ..utils import get_line_parser
+
+EXPORT_FORMATS = ("txt", "csv", "npz", "bin")
+SPOOLED_FORMATS = ("csv", "npz")
+BIN_MAGIC = b"LIMTBIN1"
+CHUNK_HEADER = struct.Struct("<II")
+
+
+def export_format(path):
+    """The export format of a file name, from its extension (TXT by default)."""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    return extension if extension in EXPORT_FORMATS else "txt"
+
+
+def read_chunks(path):
+    """Yield the 2-D float arrays of a BIN export, one per chunk."""
+    with open(path, "rb") as f:
+        if f.read(len(BIN_MAGIC)) != BIN_MAGIC:
+            raise ValueError(f"Not a chunked export: {path}")
+        while True:
+            header = f.read(CHUNK_HEADER.size)
+            if len(header) < CHUNK_HEADER.size:
+                return
+            rows, width = CHUNK_HEADER.unpack(header)
+            values = np.frombuffer(f.read(rows * width * 8), dtype="<f8")
+            yield values.reshape(rows, width)
+
+
+class _Cancelled(Exception):
+    pass
+
+
+class ExportJob:
+    def __init__(self, path, chunks, total, columns=None, prefix=""):
+        """
+        `chunks` is an iterable of chunks yielding `total` rows in all (used
+        for progress only). `columns` names the columns of CSV/NPZ/TXT
+        headers (c1, c2, ... by default) and `prefix` is written before
+        every text line of a TXT export.
+        """
+        self.path = path
+        self.format = export_format(path)
+        self.chunks = chunks
+        self.total = total
+        self.columns = columns
+        self.prefix = prefix
+        self.rows = 0
+        self.error = None
+        self.done = False
+        self._steps = max(1, total * (2 if self.format in SPOOLED_FORMATS else 1))
+        self._done_steps = 0
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def progress(self):
+        """Fraction of the work done, from 0 to 1."""
+        return 1.0 if self.done else min(1.0, self._done_steps / self._steps)
+
+    def start(self):
+        threading.Thread(target=self._run, name="export", daemon=True).start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def _run(self):
+        partial = self.path + ".part"
+        try:
+            with open(partial, "wb") as f:
+                getattr(self, f"_write_{self.format}")(f)
+            os.replace(partial, self.path)
+        except _Cancelled:
+            self._remove(partial)
+        except Exception as e:
+            self.error = str(e)
+            self._remove(partial)
+        finally:
+            self.done = True
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _chunks(self):
+        for chunk in self.chunks:
+            if self._cancel.is_set():
+                raise _Cancelled()
+            yield chunk
+
+    def _advance(self, steps, rows=0):
+        self._done_steps += steps
+        self.rows += rows
+
+    @staticmethod
+    def _values(chunk):
+        if isinstance(chunk, np.ndarray):
+            return np.asarray(chunk, dtype=float).reshape(len(chunk), -1)
+        lines = [line for line in chunk if line is not None]
+        values = get_line_parser().parse_lines(lines) if lines else None
+        if values is None or values.ndim != 2:
+            return np.empty((0, 0))
+        return values
+
+    def _column_names(self, width):
+        names = list(self.columns or [])[:width]
+        return names + [f"c{number}" for number in range(len(names) + 1, width + 1)]
+
+    def _write_txt(self, f):
+        header = self.columns is not None
+        for chunk in self._chunks():
+            if isinstance(chunk, np.ndarray):
+                values = self._values(chunk)
+                if header:
+                    names = self._column_names(values.shape[1])
+                    f.write(("# " + "\t".join(names) + "\n").encode("utf-8"))
+                    header = False
+                np.savetxt(f, values, fmt="%g", delimiter="\t")
+                self._advance(len(chunk), len(values))
+            else:
+                lines = [line for line in chunk if line is not None]
+                text = "".join(f"{self.prefix}{line}\n" for line in lines)
+                f.write(text.encode("utf-8"))
+                self._advance(len(chunk), len(lines))
+
+    def _write_bin(self, f):
+        f.write(BIN_MAGIC)
+        for chunk in self._chunks():
+            values = self._values(chunk)
+            if len(values):
+                f.write(CHUNK_HEADER.pack(*values.shape))
+                f.write(np.ascontiguousarray(values, dtype="<f8").tobytes())
+            self._advance(len(chunk), len(values))
+
+    def _spool(self, spool):
+        """Write every chunk's rows to `spool`; return their shapes."""
+        shapes = []
+        for chunk in self._chunks():
+            values = self._values(chunk)
+            if len(values):
+                spool.write(np.ascontiguousarray(values, dtype="<f8").tobytes())
+                shapes.append(values.shape)
+            self._advance(len(chunk))
+        return shapes
+
+    def _unspool(self, spool, shapes, width):
+        """Yield the spooled chunks again, padded with NaN to `width` columns."""
+        spool.seek(0)
+        for rows, columns in shapes:
+            if self._cancel.is_set():
+                raise _Cancelled()
+            values = np.frombuffer(spool.read(rows * columns * 8), dtype="<f8")
+            padded = np.full((rows, width), np.nan)
+            padded[:, :columns] = values.reshape(rows, columns)
+            yield padded
+            self._advance(rows, rows)
+
+    def _write_csv(self, f):
+        with tempfile.TemporaryFile() as spool:
+            shapes = self._spool(spool)
+            width = max((columns for _, columns in shapes), default=0)
+            f.write((",".join(self._column_names(width)) + "\n").encode("utf-8"))
+            for values in self._unspool(spool, shapes, width):
+                np.savetxt(f, values, fmt="%.10g", delimiter=",")
+
+    def _write_npz(self, f):
+        with tempfile.TemporaryFile() as spool:
+            shapes = self._spool(spool)
+            width = max((columns for _, columns in shapes), default=0)
+            rows = sum(count for count, _ in shapes)
+            header = {"descr": "<f8", "fortran_order": False, "shape": (rows, width)}
+            # The layout np.savez writes, with the array streamed into the member
+            with zipfile.ZipFile(f, "w", zipfile.ZIP_STORED, allowZip64=True) as npz:
+                with npz.open("values.npy", "w", force_zip64=True) as member:
+                    npy_format.write_array_header_1_0(member, header)
+                    for values in self._unspool(spool, shapes, width):
+                        member.write(values.astype("<f8", copy=False).tobytes())
+                with npz.open("columns.npy", "w") as member:
+                    npy_format.write_array(member, np.array(self._column_names(width)))
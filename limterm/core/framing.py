@@ -0,0 +1,252 @@
+"""
+Binary framed protocol decoding.
+
+Frames are delimited with COBS (0x00 terminator) or SLIP (0xC0 END) and may
+carry a trailing CRC over the payload. Each payload holds one or more fixed
+size records described by a struct format string such as "<Hff"; valid
+payloads are decoded in one numpy.frombuffer call per read.
+
+A frame longer than `max_frame_size` bytes (for example the stream of a
+device that never sends a delimiter) is dropped and counted in `overflows`;
+decoding resumes after the next delimiter.
+"""
+
+import binascii
+import struct
+import zlib
+import numpy as np
+
+FRAMINGS = ("cobs", "slip")
+CRC_TYPES = ("none", "crc16", "crc32")
+MAX_FRAME_SIZE = 65536
+
+SLIP_END = 0xC0
+SLIP_ESC = 0xDB
+SLIP_ESC_END = 0xDC
+SLIP_ESC_ESC = 0xDD
+
+_BYTE_ORDERS = {"<": "<", ">": ">", "!": ">", "=": "=", "@": "="}
+_NUMPY_CODES = {
+    "b": "i1",
+    "B": "u1",
+    "?": "?",
+    "h": "i2",
+    "H": "u2",
+    "i": "i4",
+    "I": "u4",
+    "l": "i4",
+    "L": "u4",
+    "q": "i8",
+    "Q": "u8",
+    "e": "f2",
+    "f": "f4",
+    "d": "f8",
+}
+
+
+def cobs_decode(data):
+    """Decode one COBS frame (without the 0x00 delimiter)."""
+    output = bytearray()
+    index = 0
+    length = len(data)
+    while index < length:
+        code = data[index]
+        if code == 0 or index + code > length:
+            raise ValueError("invalid COBS frame")
+        output += data[index + 1 : index + code]
+        index += code
+        if code < 0xFF and index < length:
+            output.append(0)
+    return bytes(output)
+
+
+def cobs_encode(data):
+    output = bytearray()
+    block = bytearray()
+    for byte in data:
+        if byte == 0:
+            output.append(len(block) + 1)
+            output += block
+            block = bytearray()
+        else:
+            block.append(byte)
+            if len(block) == 0xFE:
+                output.append(0xFF)
+                output += block
+                block = bytearray()
+    output.append(len(block) + 1)
+    output += block
+    return bytes(output)
+
+
+def slip_decode(data):
+    """Decode one SLIP frame (without the END delimiter)."""
+    output = bytearray()
+    escaped = False
+    for byte in data:
+        if escaped:
+            if byte == SLIP_ESC_END:
+                output.append(SLIP_END)
+            elif byte == SLIP_ESC_ESC:
+                output.append(SLIP_ESC)
+            else:
+                raise ValueError("invalid SLIP escape")
+            escaped = False
+        elif byte == SLIP_ESC:
+            escaped = True
+        else:
+            output.append(byte)
+    return bytes(output)
+
+
+def slip_encode(data):
+    output = bytearray()
+    for byte in data:
+        if byte == SLIP_END:
+            output += bytes((SLIP_ESC, SLIP_ESC_END))
+        elif byte == SLIP_ESC:
+            output += bytes((SLIP_ESC, SLIP_ESC_ESC))
+        else:
+            output.append(byte)
+    return bytes(output)
+
+
+def struct_to_dtype(record_format):
+    """Convert a struct format string into an equivalent numpy dtype."""
+    size = struct.calcsize(record_format)  # raises struct.error on bad formats
+
+    order = "="
+    if record_format and record_format[0] in _BYTE_ORDERS:
+        order = _BYTE_ORDERS[record_format[0]]
+        record_format = record_format[1:]
+
+    fields = []
+    count = ""
+    for char in record_format.replace(" ", ""):
+        if char.isdigit():
+            count += char
+            continue
+        if char == "x":
+            fields.append((f"pad{len(fields)}", "V1" if not count else f"V{count}"))
+        elif char in _NUMPY_CODES:
+            code = _NUMPY_CODES[char]
+            code = code if code in ("i1", "u1", "?") else order + code
+            for _ in range(int(count or 1)):
+                fields.append((f"f{len(fields)}", code))
+        else:
+            raise ValueError(f"unsupported record field '{char}'")
+        count = ""
+
+    dtype = np.dtype(fields)
+    if dtype.itemsize != size:
+        raise ValueError("native alignment is not supported, use '<', '>' or '='")
+    return dtype
+
+
+class FrameDecoder:
+    def __init__(
+        self, framing="cobs", record_format="<f", crc="none", max_frame_size=None
+    ):
+        if framing not in FRAMINGS:
+            raise ValueError(f"unknown framing '{framing}'")
+        if crc not in CRC_TYPES:
+            raise ValueError(f"unknown CRC '{crc}'")
+
+        self.framing = framing
+        self.crc = crc
+        self.dtype = struct_to_dtype(record_format)
+        self.value_fields = [n for n in self.dtype.names if not n.startswith("pad")]
+        self.delimiter = b"\x00" if framing == "cobs" else bytes((SLIP_END,))
+        self.crc_size = {"none": 0, "crc16": 2, "crc32": 4}[crc]
+        self.max_frame_size = max_frame_size or MAX_FRAME_SIZE
+        self.frames = 0
+        self.errors = 0
+        self.overflows = 0
+        # Bytes of the frame being received, before its delimiter
+        self._pending = bytearray()
+        # Set while skipping the rest of an oversized frame
+        self._discarding = False
+
+    def reset(self):
+        self._pending.clear()
+        self._discarding = False
+
+    def feed(self, data):
+        """Consume raw bytes and return the complete records as a 2-D float array."""
+        # The delimiter is one byte, so only the new bytes need searching
+        frames = []
+        start = 0
+        while True:
+            end = data.find(self.delimiter, start)
+            if end < 0:
+                break
+            if self._discarding:
+                self._discarding = False
+            elif self._pending:
+                self._pending += data[start:end]
+                frames.append(bytes(self._pending))
+                self._pending.clear()
+            else:
+                frames.append(data[start:end])
+            start = end + 1
+
+        if not self._discarding:
+            self._pending += data[start:]
+            if len(self._pending) > self.max_frame_size:
+                self.overflows += 1
+                self._pending.clear()
+                self._discarding = True
+
+        payloads = []
+        for frame in frames:
+            if not frame:
+                continue
+            if len(frame) > self.max_frame_size:
+                self.overflows += 1
+                continue
+            payload = self._check(frame)
+            if payload is None:
+                self.errors += 1
+                continue
+            self.frames += 1
+            payloads.append(payload)
+
+        if not payloads:
+            return np.empty((0, len(self.value_fields)))
+
+        records = np.frombuffer(b"".join(payloads), dtype=self.dtype)
+        columns = [records[name].astype(float) for name in self.value_fields]
+        return np.column_stack(columns)
+
+    def _check(self, frame):
+        try:
+            if self.framing == "cobs":
+                payload = cobs_decode(frame)
+            else:
+                payload = slip_decode(frame)
+        except ValueError:
+            return None
+
+        if self.crc_size:
+            payload, received = payload[: -self.crc_size], payload[-self.crc_size :]
+            if int.from_bytes(received, "little") != self.checksum(payload):
+                return None
+
+        if not payload or len(payload) % self.dtype.itemsize:
+            return None
+        return payload
+
+    def checksum(self, payload):
+        if self.crc == "crc16":
+            return binascii.crc_hqx(payload, 0xFFFF)
+        if self.crc == "crc32":
+            return zlib.crc32(payload) & 0xFFFFFFFF
+        return 0
+
+    def encode(self, payload):
+        """Frame a payload the way the decoder expects it (for devices and tests)."""
+        if self.crc_size:
+            payload += self.checksum(payload).to_bytes(self.crc_size, "little")
+        if self.framing == "cobs":
+            return cobs_encode(payload) + self.delimiter
+        return self.delimiter + slip_encode(payload) + self.delimiter
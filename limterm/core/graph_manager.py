@@ -1,15 +1,29 @@
+import time
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from ..config import FIGURE_SIZE, FIGURE_DPI
+from .autoscale import AutoScale, data_bounds
 from ..i18n import t
 from ..matplotlib_optimizations import get_optimized_figure_params
 
 
 class GraphManager:
-    def __init__(self, parent_widget):
+    def __init__(self, parent_widget=None):
+        """Create the figure; without a parent widget it renders off-screen (Agg)."""
         self.figure = plt.Figure(figsize=FIGURE_SIZE, dpi=FIGURE_DPI)
         self.ax = self.figure.add_subplot(111)
-        self.canvas = FigureCanvasTkAgg(self.figure, parent_widget)
+        if parent_widget is None:
+            self.canvas = FigureCanvasAgg(self.figure)
+        else:
+            self.canvas = FigureCanvasTkAgg(self.figure, parent_widget)
+
+        self.y_autoscale = AutoScale()
+        self.overlay_provider = None
+        self._overlay_text = None
+        self.build_started = None
+        self.draw_started = None
+        self.draw_finished = None
 
         params = get_optimized_figure_params()
         self.figure.patch.set_visible(params["patch_visible"])
@@ -23,6 +37,7 @@ class GraphManager:
         return self.canvas.get_tk_widget()
 
     def clear(self):
+        self.build_started = time.perf_counter()
         self.ax.clear()
 
     def plot_line(self, x_data, y_data, color="blue", marker="o"):
@@ -37,13 +52,67 @@ class GraphManager:
         if min_y is not None or max_y is not None:
             self.ax.set_ylim(min_y, max_y)
 
+    def autoscale_y(self, *arrays):
+        """Fit the Y axis to the data with hysteresis, so it does not jitter."""
+        self.autoscale_y_bounds(data_bounds(*arrays))
+
+    def autoscale_y_bounds(self, bounds):
+        """autoscale_y for data already reduced to (low, high), or None."""
+        limits = self.y_autoscale.update(*(bounds or (None, None)))
+        if limits is not None:
+            self.ax.set_ylim(*limits)
+
+    def _apply_y_limits(self, min_y, max_y, *arrays):
+        if min_y is None and max_y is None:
+            self.autoscale_y(*arrays)
+        else:
+            self.y_autoscale.reset()
+            self.set_limits(None, None, min_y, max_y)
+
     def set_labels(self, title="Graph", xlabel="X", ylabel="Y"):
         self.ax.set_title(title)
         self.ax.set_xlabel(xlabel)
         self.ax.set_ylabel(ylabel)
 
+    def plot_width(self):
+        """Width of the axes in pixels, used to pick an aggregation level."""
+        try:
+            return max(100, int(self.ax.get_window_extent().width))
+        except Exception:
+            return 1000
+
+    def set_overlay(self, provider):
+        """Set a callable returning text drawn over the axes on every update."""
+        self.overlay_provider = provider
+
+    def _draw_overlay(self):
+        text = self.overlay_provider()
+        # Views that update artists in place keep their axes, so reuse the text
+        if self._overlay_text is not None and self._overlay_text in self.ax.texts:
+            self._overlay_text.set_text(text or "")
+            return
+        if text:
+            self._overlay_text = self.ax.text(
+                0.01,
+                0.99,
+                text,
+                transform=self.ax.transAxes,
+                va="top",
+                ha="left",
+                family="monospace",
+                fontsize=8,
+                bbox={"facecolor": "white", "alpha": 0.8, "edgecolor": "gray"},
+                zorder=10,
+            )
+
     def update(self):
+        if self.overlay_provider is not None:
+            self._draw_overlay()
+        elif self._overlay_text is not None and self._overlay_text in self.ax.texts:
+            self._overlay_text.remove()
+        self.draw_started = time.perf_counter()
         self.canvas.draw()
+        self.draw_finished = time.perf_counter()
 
     def plot_from_settings(
         self,
@@ -96,7 +165,8 @@ class GraphManager:
         min_y = float(settings.get("min_y", "0")) if settings.get("min_y") else None
         max_y = float(settings.get("max_y", "0")) if settings.get("max_y") else None
 
-        self.set_limits(min_x, max_x, min_y, max_y)
+        self.set_limits(min_x, max_x)
+        self._apply_y_limits(min_y, max_y, y_data)
         self.set_labels(
             title=title or t("common.graph"),
             xlabel=xlabel or t("common.column", column=x_col + 1),
@@ -113,13 +183,16 @@ class GraphManager:
         title=None,
         xlabel=None,
         ylabel=None,
+        envelopes=None,
     ):
+        """envelopes optionally holds a (y_min, y_max) pair per series, drawn
+        as a band behind the line for aggregated history."""
         self.clear()
 
         plotted_series = 0
 
         for i, (y_data, settings) in enumerate(zip(y_series_data, settings_list)):
-            if not y_data:
+            if y_data is None or len(y_data) == 0:
                 continue
 
             graph_type = settings.get("type", "Line")
@@ -152,6 +225,12 @@ class GraphManager:
 
             series_label = f"Y{i+1}"
 
+            if envelopes and envelopes[i] is not None:
+                y_min, y_max = envelopes[i]
+                self.ax.fill_between(
+                    x_data, y_min, y_max, color=color, alpha=0.25, linewidth=0
+                )
+
             if graph_type in [t("ui.graph_types.line"), "Line", "line"]:
                 self.ax.plot(
                     x_data, y_data, color=color, marker=marker, label=series_label
@@ -183,7 +262,8 @@ class GraphManager:
                 if first_settings.get("max_y")
                 else None
             )
-            self.set_limits(None, None, min_y, max_y)
+            bands = [band for pair in envelopes or [] if pair for band in pair]
+            self._apply_y_limits(min_y, max_y, *y_series_data, *bands)
 
         self.set_labels(
             title=title or t("common.graph"),
@@ -0,0 +1,94 @@
+"""
+Incremental histogram of one channel.
+
+Each batch of new samples is binned with one numpy.bincount call and added to
+the running counts, so the cost of an update depends on the batch size only.
+With a fixed range, samples outside it are counted as under/overflow. With
+an auto range, the first batch sets the range and a sample outside it
+doubles the range towards that side; pairs of old bins merge exactly into
+the new ones, so no sample has to be binned again.
+
+In decaying mode the counts are multiplied by 0.5 every `half_life`
+samples, so the histogram follows the recent distribution.
+"""
+
+import numpy as np
+
+DEFAULT_BINS = 50
+AUTO_RANGE_MARGIN = 0.1
+
+
+class IncrementalHistogram:
+    def __init__(self, bins=DEFAULT_BINS, value_range=None, half_life=None):
+        # Auto range merges bins pairwise, so it needs an even count
+        self.bins = max(2, int(bins) + int(bins) % 2)
+        self.fixed_range = value_range
+        self.half_life = half_life
+        self.reset()
+
+    def reset(self):
+        self.counts = np.zeros(self.bins)
+        self.total = 0
+        self.underflow = 0.0
+        self.overflow = 0.0
+        if self.fixed_range is not None:
+            self.low, self.high = (float(v) for v in self.fixed_range)
+        else:
+            self.low = self.high = None
+
+    @property
+    def edges(self):
+        if self.low is None:
+            return None
+        return np.linspace(self.low, self.high, self.bins + 1)
+
+    def add(self, values):
+        """Bin a batch of samples; returns True when the bin edges changed."""
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return False
+
+        if self.half_life:
+            factor = 0.5 ** (len(values) / self.half_life)
+            self.counts *= factor
+            self.underflow *= factor
+            self.overflow *= factor
+        self.total += len(values)
+
+        edges_changed = False
+        if self.fixed_range is None:
+            edges_changed = self._fit_range(values.min(), values.max())
+        else:
+            self.underflow += np.count_nonzero(values < self.low)
+            self.overflow += np.count_nonzero(values > self.high)
+            values = values[(values >= self.low) & (values <= self.high)]
+
+        width = (self.high - self.low) / self.bins
+        indices = ((values - self.low) / width).astype(np.intp)
+        # The upper edge belongs to the last bin
+        np.clip(indices, 0, self.bins - 1, out=indices)
+        self.counts += np.bincount(indices, minlength=self.bins)
+        return edges_changed
+
+    def _fit_range(self, minimum, maximum):
+        if self.low is None:
+            span = maximum - minimum
+            margin = span * AUTO_RANGE_MARGIN if span else max(abs(minimum), 1.0)
+            self.low, self.high = minimum - margin, maximum + margin
+            return True
+
+        changed = False
+        half = self.bins // 2
+        while minimum < self.low or maximum > self.high:
+            span = self.high - self.low
+            merged = self.counts.reshape(half, 2).sum(axis=1)
+            self.counts = np.zeros(self.bins)
+            if maximum > self.high:
+                self.counts[:half] = merged
+                self.high += span
+            else:
+                self.counts[half:] = merged
+                self.low -= span
+            changed = True
+        return changed
@@ -0,0 +1,122 @@
+"""
+Per-stage timing for the byte-to-pixel pipeline.
+
+Ingest stages (read, decode, append) are recorded by the reader thread and
+the data tab; render stages (parse, plot, draw) and the end-to-end latency
+are recorded per tab after each frame, from the timestamps GraphManager
+keeps while building and drawing a figure.
+"""
+
+import threading
+import time
+from collections import deque
+from ..i18n import t
+
+INGEST_STAGES = ("read", "decode", "append")
+RENDER_STAGES = ("parse", "plot", "draw")
+
+
+class LatencyTracker:
+    def __init__(self, sample_size=500, frame_window=60):
+        self.enabled = False
+        self.sample_size = sample_size
+        self._samples = {}
+        self._frames = {}
+        self._last_arrival = {}
+        self._frame_window = frame_window
+        self._lock = threading.Lock()
+
+    def record(self, stage, seconds):
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.sample_size)
+            samples.append(seconds)
+
+    def record_frame(self, name, frame_start, graph_manager, arrival_time=None):
+        """Record one rendered frame of a tab from the GraphManager timestamps."""
+        if not self.enabled:
+            return
+
+        build = graph_manager.build_started
+        draw = graph_manager.draw_started
+        done = graph_manager.draw_finished
+        if build is None or draw is None or done is None or build < frame_start:
+            return
+
+        self.record(f"{name}.parse", build - frame_start)
+        self.record(f"{name}.plot", draw - build)
+        self.record(f"{name}.draw", done - draw)
+
+        # Only fresh data counts, a stale buffer would inflate the latency
+        if arrival_time is not None and arrival_time != self._last_arrival.get(name):
+            self._last_arrival[name] = arrival_time
+            self.record(f"{name}.latency", done - arrival_time)
+
+        with self._lock:
+            frames = self._frames.get(name)
+            if frames is None:
+                frames = self._frames[name] = deque(maxlen=self._frame_window)
+            frames.append(done)
+
+    def percentile(self, stage, pct):
+        with self._lock:
+            samples = sorted(self._samples.get(stage, ()))
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(round(pct / 100.0 * (len(samples) - 1))))
+        return samples[index]
+
+    def fps(self, name):
+        with self._lock:
+            frames = list(self._frames.get(name, ()))
+        if len(frames) < 2 or frames[-1] <= frames[0]:
+            return None
+        # A tab that stopped rendering has no current frame rate
+        if time.perf_counter() - frames[-1] > 2.0:
+            return None
+        return (len(frames) - 1) / (frames[-1] - frames[0])
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._frames.clear()
+            self._last_arrival.clear()
+
+    def format_hud(self, name):
+        """Return the overlay text for a tab."""
+
+        def ms(stage, pct=50):
+            value = self.percentile(stage, pct)
+            return "--" if value is None else f"{value * 1000:.1f}"
+
+        fps = self.fps(name)
+        summary = t(
+            "ui.latency_hud.summary",
+            fps="--" if fps is None else f"{fps:.1f}",
+            p50=ms(f"{name}.latency", 50),
+            p99=ms(f"{name}.latency", 99),
+        )
+        ingest = t(
+            "ui.latency_hud.ingest",
+            read=ms("read"),
+            decode=ms("decode"),
+            append=ms("append"),
+        )
+        render = t(
+            "ui.latency_hud.render",
+            parse=ms(f"{name}.parse"),
+            plot=ms(f"{name}.plot"),
+            draw=ms(f"{name}.draw"),
+        )
+        return f"{summary}\n{ingest}\n{render}"
+
+
+_latency_tracker = None
+
+
+def get_latency_tracker():
+    global _latency_tracker
+    if _latency_tracker is None:
+        _latency_tracker = LatencyTracker()
+    return _latency_tracker
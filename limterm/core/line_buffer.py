@@ -0,0 +1,118 @@
+"""
+Fixed-capacity buffer of received lines addressed by sequence number.
+
+Line n (counting from 0 for the first line of the session) is stored at
+slot n % maxlen of a plain list, so the newest lines, the lines after a
+given sequence number or any retained range come back as one or two list
+slices: a small copy of just the lines asked for, never the whole buffer.
+The reader thread appends while the Tk thread reads, so every access takes
+the buffer's lock; a slice and the sequence number it ends at are always
+taken together.
+
+The capacity can change while lines arrive (resize). Lines pushed out of
+the buffer are handed to an optional `spill(first_sequence, lines)`
+callback, inside the lock and before their slots are reused, so a reader
+that finds a line gone from the buffer finds it wherever it was spilled.
+"""
+
+import threading
+
+
+class LineBuffer:
+    def __init__(self, maxlen, spill=None):
+        self.maxlen = maxlen
+        self.spill = spill
+        self._lines = [None] * maxlen
+        self._lock = threading.Lock()
+        self.sequence = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return iter(self.tail(self.maxlen))
+
+    @property
+    def first(self):
+        """Sequence number of the oldest retained line."""
+        return self.sequence - self._count
+
+    def set_spill(self, spill):
+        """Replace the spill callback; None drops evicted lines."""
+        with self._lock:
+            self.spill = spill
+
+    def append(self, line):
+        with self._lock:
+            slot = self.sequence % self.maxlen
+            if self._count == self.maxlen:
+                if self.spill is not None:
+                    self.spill(self.sequence - self._count, [self._lines[slot]])
+            else:
+                self._count += 1
+            self._lines[slot] = line
+            self.sequence += 1
+
+    def extend(self, lines):
+        lines = list(lines)
+        with self._lock:
+            first = self.sequence - self._count
+            new_first = max(first, self.sequence + len(lines) - self.maxlen)
+            if new_first > first and self.spill is not None:
+                # Retained lines first, then new lines that would not fit
+                evicted = self._range(first, new_first)
+                evicted += lines[: max(0, new_first - self.sequence)]
+                self.spill(first, evicted)
+
+            # Lines that would be overwritten in the same call are skipped
+            kept = lines[-self.maxlen :]
+            self.sequence += len(lines) - len(kept)
+            start = self.sequence % self.maxlen
+            first_part = min(len(kept), self.maxlen - start)
+            self._lines[start : start + first_part] = kept[:first_part]
+            self._lines[: len(kept) - first_part] = kept[first_part:]
+            self.sequence += len(kept)
+            self._count = self.sequence - new_first
+
+    def resize(self, maxlen):
+        """Change the capacity, keeping the newest lines that still fit."""
+        with self._lock:
+            first = self.sequence - self._count
+            new_first = max(first, self.sequence - maxlen)
+            if new_first > first and self.spill is not None:
+                self.spill(first, self._range(first, new_first))
+            kept = self._range(new_first, self.sequence)
+            self.maxlen = maxlen
+            self._lines = [None] * maxlen
+            start = new_first % maxlen
+            first_part = min(len(kept), maxlen - start)
+            self._lines[start : start + first_part] = kept[:first_part]
+            self._lines[: len(kept) - first_part] = kept[first_part:]
+            self._count = len(kept)
+
+    def tail(self, count):
+        """The newest `count` lines, oldest first."""
+        with self._lock:
+            return self._range(self.sequence - count, self.sequence)
+
+    def since(self, sequence):
+        """Return (lines appended after `sequence`, current sequence number)."""
+        with self._lock:
+            return self._range(sequence, self.sequence), self.sequence
+
+    def range(self, start, end):
+        """Lines [start, end) by sequence number, clipped to what is retained."""
+        with self._lock:
+            return self._range(start, end)
+
+    def _range(self, start, end):
+        start = max(start, self.first)
+        end = min(end, self.sequence)
+        if end <= start:
+            return []
+        first = start % self.maxlen
+        last = first + end - start
+        if last <= self.maxlen:
+            return self._lines[first:last]
+        return self._lines[first:] + self._lines[: last - self.maxlen]
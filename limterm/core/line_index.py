@@ -0,0 +1,96 @@
+"""
+Sparse line index of a growing text file, read through mmap.
+
+Only the start offset of every `step`-th line is stored, so the index of a
+capture with millions of lines stays small. Reading line n seeks to the
+stored start of its block and skips at most `step - 1` lines with
+mmap.find, which keeps the cost of a read independent of the file size.
+New bytes are indexed incrementally, one vectorised newline search per
+update, and only complete lines are counted. Reads may come from other
+threads (a background search), so remapping and reading share a lock.
+"""
+
+import mmap
+import os
+import threading
+import numpy as np
+
+INDEX_STEP = 256
+SCAN_CHUNK = 1 << 24
+
+
+class LineIndex:
+    def __init__(self, path, start_offset=0, step=INDEX_STEP):
+        """Index the lines of `path` written from byte `start_offset` onwards."""
+        self.path = path
+        self.step = step
+        self.count = 0
+        self._starts = [start_offset]
+        self._scanned = start_offset
+        self._file = open(path, "rb")
+        self._map = None
+        self._lock = threading.Lock()
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
+
+    def update(self):
+        """Index the complete lines appended since the last update."""
+        with self._lock:
+            self._update()
+
+    def _update(self):
+        size = os.fstat(self._file.fileno()).st_size
+        if size <= self._scanned:
+            return
+        if self._map is None or len(self._map) < size:
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+
+        # Scanned in chunks so a large backlog needs little temporary memory
+        while self._scanned < size:
+            count = min(SCAN_CHUNK, size - self._scanned)
+            data = np.frombuffer(
+                self._map, dtype=np.uint8, count=count, offset=self._scanned
+            )
+            # Offsets just past each newline are the starts of the following lines
+            starts = np.flatnonzero(data == 10) + self._scanned + 1
+            del data
+            if not len(starts):
+                if count < SCAN_CHUNK:
+                    break
+                self._scanned += count
+                continue
+            numbers = np.arange(self.count + 1, self.count + 1 + len(starts))
+            self._starts.extend(starts[numbers % self.step == 0].tolist())
+            self.count += len(starts)
+            self._scanned = int(starts[-1])
+
+    def lines(self, start, end):
+        """Lines [start, end) as text, clipped to the indexed lines."""
+        with self._lock:
+            return self._lines(start, end)
+
+    def _lines(self, start, end):
+        start = max(0, start)
+        end = min(end, self.count)
+        if end <= start or self._map is None:
+            return []
+
+        position = self._starts[start // self.step]
+        for _ in range(start % self.step):
+            position = self._map.find(b"\n", position) + 1
+
+        lines = []
+        for _ in range(end - start):
+            line_end = self._map.find(b"\n", position)
+            lines.append(
+                self._map[position:line_end].decode("utf-8", "replace").rstrip("\r")
+            )
+            position = line_end + 1
+        return lines
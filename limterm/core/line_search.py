@@ -0,0 +1,233 @@
+"""
+Background search over the lines received this session.
+
+A query is either a regular expression matched against each line or a
+predicate over parsed columns, such as "c3 > 5.0" (columns may also be
+written col3, numbered from 1 like derived channels). Predicates are
+evaluated over the NumPy column arrays of a whole batch of lines with the
+interpreter derived channels use; `and`, `or`, `not` and chained comparisons
+are rewritten into element-wise operators first, and rows missing a
+referenced column never match.
+
+A search runs on a worker thread, batch by batch, and keeps following new
+lines until it is stopped; the UI reads the matches as they arrive. The
+matches of recent queries are kept with the number of lines already
+searched, so repeating a search only scans the lines received since.
+"""
+
+import ast
+import re
+import threading
+from collections import OrderedDict
+from functools import reduce
+import numpy as np
+from ..utils import DerivedChannel, get_line_parser
+
+SEARCH_BATCH = 20000
+MATCH_LIMIT = 100000
+CACHE_SIZE = 16
+FOLLOW_INTERVAL = 0.25
+
+COLUMN_ALIAS = re.compile(r"\bcol(\d+)\b")
+COLUMN_NAME = re.compile(r"c\d+")
+
+
+class _ElementWise(ast.NodeTransformer):
+    """Rewrite boolean logic so it applies row by row to column arrays."""
+
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        return reduce(lambda left, right: ast.BinOp(left, op, right), node.values)
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return ast.UnaryOp(ast.Invert(), node.operand)
+        return node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        if len(node.ops) == 1:
+            return node
+        operands = [node.left] + node.comparators
+        pairs = [
+            ast.Compare(operands[index], [op], [operands[index + 1]])
+            for index, op in enumerate(node.ops)
+        ]
+        return reduce(lambda left, right: ast.BinOp(left, ast.BitAnd(), right), pairs)
+
+
+def _predicate_source(text):
+    """The element-wise form of `text` when it is a column predicate, else None."""
+    try:
+        tree = ast.parse(COLUMN_ALIAS.sub(r"c\1", text.strip()), mode="eval")
+    except SyntaxError:
+        return None
+    nodes = list(ast.walk(tree))
+    compares = any(isinstance(node, ast.Compare) for node in nodes)
+    columns = any(
+        isinstance(node, ast.Name) and COLUMN_NAME.fullmatch(node.id) for node in nodes
+    )
+    if not (compares and columns):
+        return None
+    tree = ast.fix_missing_locations(_ElementWise().visit(tree))
+    return ast.unparse(tree)
+
+
+class SearchQuery:
+    def __init__(self, text):
+        """Compile `text`; raises ValueError when it is neither predicate nor regex."""
+        self.text = text.strip()
+        source = _predicate_source(self.text)
+        if source is not None:
+            self.kind = "predicate"
+            self.predicate = DerivedChannel(source)
+            # Catch type errors now rather than on the worker thread
+            width = max(self.predicate.columns, default=1)
+            self.predicate.evaluate(np.zeros((1, width)))
+        else:
+            self.kind = "regex"
+            try:
+                self.pattern = re.compile(self.text)
+            except re.error as e:
+                raise ValueError(str(e)) from None
+
+    @property
+    def key(self):
+        """Cache key: predicate results depend on the line format in use."""
+        if self.kind == "predicate":
+            return self.text, id(get_line_parser().parser)
+        return self.text, None
+
+    def match(self, lines):
+        """Indices of the matching lines; None entries are lines no longer available."""
+        if self.kind == "regex":
+            search = self.pattern.search
+            return np.array(
+                [
+                    index
+                    for index, line in enumerate(lines)
+                    if line is not None and search(line)
+                ],
+                dtype=np.int64,
+            )
+
+        # Parse only the lines still available, then map rows back to indices
+        present = np.array(
+            [index for index, line in enumerate(lines) if line is not None],
+            dtype=np.int64,
+        )
+        if not len(present):
+            return present
+        values = get_line_parser().parse_lines([lines[index] for index in present])
+        if values.ndim != 2 or len(values) != len(present):
+            return np.empty(0, dtype=np.int64)
+        result = self.predicate.evaluate(values)
+        if result is None:
+            return np.empty(0, dtype=np.int64)
+        columns = [number - 1 for number in self.predicate.columns]
+        matched = (np.nan_to_num(result) != 0) & np.isfinite(values[:, columns]).all(
+            axis=1
+        )
+        return present[matched]
+
+
+class SearchResult:
+    def __init__(self, start):
+        self.start = start
+        # Lines [start, end) have been searched
+        self.end = start
+        self.matches = []
+        self.truncated = False
+
+
+class LineSearch:
+    def __init__(self, fetch_lines, line_range, batch=SEARCH_BATCH):
+        """
+        `line_range()` returns the (first, end) line numbers available and
+        `fetch_lines(start, end)` the raw text of lines [start, end), with None
+        for lines that are no longer available. Both are called from the
+        worker thread.
+        """
+        self.fetch_lines = fetch_lines
+        self.line_range = line_range
+        self.batch = batch
+        self.query = None
+        self.result = None
+        self.error = None
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = None
+
+    @property
+    def searching(self):
+        """True while lines received before now are still being searched."""
+        result = self.result
+        if result is None or result.truncated or self.error:
+            return False
+        return result.end < self.line_range()[1]
+
+    def start(self, text):
+        """Search for `text` from the first available line and keep following."""
+        query = SearchQuery(text)
+        self.stop()
+        first = self.line_range()[0]
+        with self._lock:
+            result = self._results.pop(query.key, None)
+            if result is None or first < result.start:
+                result = SearchResult(first)
+            self._results[query.key] = result
+            while len(self._results) > CACHE_SIZE:
+                self._results.popitem(last=False)
+            self.query = query
+            self.result = result
+            self.error = None
+            self._stop = stop = threading.Event()
+
+        threading.Thread(
+            target=self._run,
+            args=(query, result, stop),
+            name="line-search",
+            daemon=True,
+        ).start()
+        return result
+
+    def stop(self):
+        """Stop the search and forget it; cached results are kept."""
+        with self._lock:
+            if self._stop is not None:
+                self._stop.set()
+            self._stop = None
+            self.query = None
+            self.result = None
+            self.error = None
+
+    def _run(self, query, result, stop):
+        while not stop.is_set():
+            first, end = self.line_range()
+            position = max(result.end, first)
+            if position >= end or result.truncated:
+                stop.wait(FOLLOW_INTERVAL)
+                continue
+
+            batch_end = min(end, position + self.batch)
+            try:
+                found = query.match(self.fetch_lines(position, batch_end))
+            except Exception as e:
+                with self._lock:
+                    if not stop.is_set():
+                        self.error = str(e)
+                return
+
+            # A search stopped meanwhile may share this result with a new one
+            with self._lock:
+                if stop.is_set():
+                    return
+                found = (found + position).tolist()
+                room = MATCH_LIMIT - len(result.matches)
+                if len(found) > room:
+                    found = found[:room]
+                    result.truncated = True
+                result.matches.extend(found)
+                result.end = batch_end
@@ -0,0 +1,204 @@
+"""
+Runtime counters and gauges with JSON-lines or Prometheus export.
+
+Producers call inc()/observe() on the shared registry from any thread; the
+exporter either samples the registry periodically into a rotating JSON-lines
+file or serves it as Prometheus text on a localhost HTTP endpoint.
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "limterm_"
+
+
+def _key(name, labels):
+    return (name, tuple(sorted(labels.items())))
+
+
+def _format_name(key):
+    name, labels = key
+    if not labels:
+        return name
+    label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+    return f"{name}{{{label_text}}}"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._counters = {}
+        self._gauges = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name, value=1, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        """Count one timed event as <name>_count and <name>_seconds_total."""
+        count_key = _key(f"{name}_count", labels)
+        sum_key = _key(f"{name}_seconds_total", labels)
+        with self._lock:
+            self._counters[count_key] = self._counters.get(count_key, 0) + 1
+            self._counters[sum_key] = self._counters.get(sum_key, 0.0) + seconds
+
+    def register_gauge(self, name, callback, **labels):
+        """Register a callable sampled whenever the registry is read."""
+        with self._lock:
+            self._gauges[_key(name, labels)] = callback
+
+    def unregister_gauge(self, name, **labels):
+        with self._lock:
+            self._gauges.pop(_key(name, labels), None)
+
+    def snapshot(self):
+        """Return ({counter_key: value}, {gauge_key: value})."""
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+
+        gauge_values = {}
+        for key, callback in gauges.items():
+            try:
+                gauge_values[key] = float(callback())
+            except Exception as e:
+                logger.debug(f"Gauge {key[0]} failed: {e}")
+        return counters, gauge_values
+
+    def to_prometheus(self):
+        counters, gauges = self.snapshot()
+        lines = []
+        for kind, values in (("counter", counters), ("gauge", gauges)):
+            declared = set()
+            for key in sorted(values):
+                name = METRIC_PREFIX + key[0]
+                if name not in declared:
+                    lines.append(f"# TYPE {name} {kind}")
+                    declared.add(name)
+                lines.append(f"{METRIC_PREFIX}{_format_name(key)} {values[key]:.6g}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """Export the registry as a rotating JSON-lines file or a Prometheus endpoint."""
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.mode = None
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._server = None
+        self._file_logger = None
+
+    @property
+    def is_running(self):
+        return self.mode is not None
+
+    def start_jsonl(self, path, interval=5.0, max_bytes=5 * 1024 * 1024, backups=5):
+        self.stop()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._file_logger = logging.getLogger(f"{__name__}.jsonl")
+        self._file_logger.handlers = [handler]
+        self._file_logger.propagate = False
+        self._file_logger.setLevel(logging.INFO)
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._sample_loop, args=(max(0.1, interval),), daemon=True
+        )
+        self._thread.start()
+        self.mode = "jsonl"
+
+    def start_prometheus(self, port, host="127.0.0.1"):
+        self.stop()
+
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, int(port)), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.mode = "prometheus"
+
+    def stop(self):
+        self._stop_event.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._file_logger is not None:
+            for handler in self._file_logger.handlers:
+                handler.close()
+            self._file_logger.handlers = []
+            self._file_logger = None
+        self.mode = None
+
+    def _sample_loop(self, interval):
+        previous = None
+        previous_time = None
+        while not self._stop_event.wait(interval):
+            now = time.time()
+            counters, gauges = self.registry.snapshot()
+
+            rates = {}
+            if previous is not None and now > previous_time:
+                elapsed = now - previous_time
+                for key, value in counters.items():
+                    rates[_format_name(key)] = (value - previous.get(key, 0)) / elapsed
+
+            record = {
+                "ts": round(now, 3),
+                "counters": {_format_name(k): v for k, v in counters.items()},
+                "gauges": {_format_name(k): v for k, v in gauges.items()},
+                "rates": rates,
+            }
+            try:
+                self._file_logger.info(json.dumps(record, sort_keys=True))
+            except Exception as e:
+                logger.error(f"Error writing metrics sample: {e}")
+
+            previous, previous_time = counters, now
+
+
+_metrics = None
+
+
+def get_metrics():
+    global _metrics
+    if _metrics is None:
+        _metrics = MetricsRegistry()
+    return _metrics
@@ -0,0 +1,97 @@
+"""
+Parsed columns of the line buffer, shared by every tab.
+
+The cache follows the buffer's sequence number (the number of lines ever
+appended) and, when asked for rows, parses only the lines appended since
+the previous request, in one batch. Rows are kept in a linear array twice
+the buffer capacity: new rows go at the end and the newest `capacity` rows
+are moved back to the start when it fills up, once per `capacity` rows, so
+any tail of the buffer is a contiguous slice returned without copying.
+"""
+
+import threading
+import numpy as np
+from ..utils import get_line_parser
+
+
+class ParseCache:
+    def __init__(self, capacity, snapshot):
+        """
+        `snapshot(sequence)` must return (lines, sequence): the lines appended
+        after the given sequence number (the newest ones when more than the
+        buffer holds) and the current sequence number, taken consistently.
+        """
+        self.capacity = capacity
+        self._snapshot = snapshot
+        self._lock = threading.Lock()
+        self.clear()
+
+    def resize(self, capacity):
+        """Follow a buffer resize; rows are parsed again on the next request."""
+        with self._lock:
+            self.capacity = capacity
+            self.clear()
+
+    def clear(self):
+        self.sequence = 0
+        self._parser = None
+        self._values = np.full((2 * self.capacity, 0), np.nan)
+        self._end = 0
+
+    def tail(self, count=None):
+        """
+        Rows of the newest `count` lines (all buffered lines when None).
+
+        The result is a read-only view that stays valid until the next call;
+        copy it to keep it longer or to hand it to another thread.
+        """
+        return self.tail_with_end(count)[0]
+
+    def tail_with_end(self, count=None):
+        """
+        (rows, end): tail(count) and the line number one past its last row,
+        read together so the rows can be matched to their line numbers.
+        """
+        with self._lock:
+            self._catch_up()
+            available = min(self._end, self.capacity)
+            if count is not None:
+                available = min(available, count)
+            view = self._values[self._end - available : self._end]
+            view.flags.writeable = False
+            return view, self.sequence
+
+    def _catch_up(self):
+        # A different line format turns the same text into different columns
+        parser = get_line_parser().parser
+        if parser is not self._parser:
+            self._parser = parser
+            self.sequence = 0
+            self._end = 0
+
+        lines, sequence = self._snapshot(self.sequence)
+        self.sequence = sequence
+        if not lines:
+            return
+        rows = get_line_parser().parse_lines(lines)
+        if rows.ndim != 2:
+            return
+        self._append(rows[-self.capacity :])
+
+    def _append(self, rows):
+        count, width = rows.shape
+        if width > self._values.shape[1]:
+            self._values = np.pad(
+                self._values,
+                ((0, 0), (0, width - self._values.shape[1])),
+                constant_values=np.nan,
+            )
+        if self._end + count > len(self._values):
+            keep = min(self._end, self.capacity - count)
+            self._values[:keep] = self._values[self._end - keep : self._end]
+            self._end = keep
+
+        target = self._values[self._end : self._end + count]
+        target[:, :width] = rows
+        target[:, width:] = np.nan
+        self._end += count
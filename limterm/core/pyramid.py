@@ -0,0 +1,255 @@
+"""
+Multi-resolution min/max/mean history of the parsed samples.
+
+Level 0 keeps the most recent raw rows; level k keeps one min/max/mean block
+per 2^k samples. Every level is a fixed-capacity ring, so coarse levels reach
+hours or days back at a bounded memory cost. New rows are collected and
+reduced level by level in vectorised batches, which keeps maintenance O(1)
+amortised per sample. A query for any sample range picks the finest level
+that still fits the requested number of points, so drawing an hour costs the
+same as drawing the last second.
+"""
+
+import threading
+import warnings
+import numpy as np
+
+RAW_CAPACITY = 1 << 17
+LEVEL_CAPACITY = 1 << 13
+LEVEL_COUNT = 16
+FLUSH_SIZE = 256
+
+
+class _Ring:
+    """Fixed-capacity ring of rows addressed by absolute index."""
+
+    def __init__(self, capacity, width, depth):
+        self.capacity = capacity
+        self.data = np.full((depth, capacity, width), np.nan)
+        self.total = 0
+
+    @property
+    def first(self):
+        return max(0, self.total - self.capacity)
+
+    def widen(self, width):
+        extra = width - self.data.shape[2]
+        if extra > 0:
+            self.data = np.pad(
+                self.data, ((0, 0), (0, 0), (0, extra)), constant_values=np.nan
+            )
+
+    def extend(self, blocks):
+        """Append a (depth, n, width) array."""
+        count = blocks.shape[1]
+        if count >= self.capacity:
+            blocks = blocks[:, -self.capacity :]
+            self.total += count - self.capacity
+            count = self.capacity
+        start = self.total % self.capacity
+        first_part = min(count, self.capacity - start)
+        self.data[:, start : start + first_part] = blocks[:, :first_part]
+        self.data[:, : count - first_part] = blocks[:, first_part:]
+        self.total += count
+
+    def get(self, start, end):
+        """Return rows [start, end) clipped to what is retained."""
+        start = max(start, self.first)
+        end = min(end, self.total)
+        if end <= start:
+            return start, self.data[:, :0]
+        indices = np.arange(start, end) % self.capacity
+        return start, self.data[:, indices]
+
+
+class SamplePyramid:
+    def __init__(
+        self,
+        raw_capacity=RAW_CAPACITY,
+        level_capacity=LEVEL_CAPACITY,
+        levels=LEVEL_COUNT,
+    ):
+        self.raw_capacity = raw_capacity
+        self.level_capacity = level_capacity
+        self.level_count = levels
+        self.width = 0
+        self._raw = None
+        self._levels = []
+        self._carry = []
+        self._pending = []
+        self._lock = threading.Lock()
+
+    @property
+    def total(self):
+        """Number of samples appended so far."""
+        with self._lock:
+            pending = len(self._pending)
+            return (self._raw.total if self._raw else 0) + pending
+
+    def clear(self):
+        with self._lock:
+            self.width = 0
+            self._raw = None
+            self._levels = []
+            self._carry = []
+            self._pending = []
+
+    def append(self, values):
+        """Queue one row of floats; it is reduced with the next batch."""
+        with self._lock:
+            self._pending.append(values)
+            if len(self._pending) >= FLUSH_SIZE:
+                self._flush()
+
+    def extend(self, rows):
+        with self._lock:
+            self._pending.extend(rows)
+            self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+
+        try:
+            rows = np.array(self._pending, dtype=float, ndmin=2)
+        except ValueError:
+            # Ragged rows are padded with NaN
+            width = max(len(row) for row in self._pending)
+            rows = np.full((len(self._pending), width), np.nan)
+            for index, row in enumerate(self._pending):
+                rows[index, : len(row)] = row
+        self._pending = []
+        width = rows.shape[1]
+
+        if self._raw is None or width > self.width:
+            self._widen(max(width, self.width, 1))
+        if width < self.width:
+            rows = np.pad(
+                rows, ((0, 0), (0, self.width - width)), constant_values=np.nan
+            )
+
+        self._raw.extend(rows[np.newaxis])
+        # Level k+1 is reduced from the completed blocks of level k
+        blocks = np.stack([rows, rows, rows])
+        for level in range(self.level_count):
+            if self._carry[level] is not None:
+                blocks = np.concatenate([self._carry[level], blocks], axis=1)
+            pairs = blocks.shape[1] // 2
+            self._carry[level] = blocks[:, pairs * 2 :] if blocks.shape[1] % 2 else None
+            if not pairs:
+                break
+            blocks = self._reduce(blocks[:, : pairs * 2])
+            self._levels[level].extend(blocks)
+
+    @staticmethod
+    def _reduce(blocks):
+        depth, count, width = blocks.shape
+        pairs = blocks.reshape(depth, count // 2, 2, width)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return np.stack(
+                [
+                    np.nanmin(pairs[0], axis=1),
+                    np.nanmax(pairs[1], axis=1),
+                    np.nanmean(pairs[2], axis=1),
+                ]
+            )
+
+    def _widen(self, width):
+        if self._raw is None:
+            self._raw = _Ring(self.raw_capacity, width, 1)
+            self._levels = [
+                _Ring(self.level_capacity, width, 3) for _ in range(self.level_count)
+            ]
+            self._carry = [None] * self.level_count
+        else:
+            self._raw.widen(width)
+            for ring in self._levels:
+                ring.widen(width)
+            self._carry = [
+                (
+                    None
+                    if carry is None
+                    else np.pad(
+                        carry,
+                        ((0, 0), (0, 0), (0, width - carry.shape[2])),
+                        constant_values=np.nan,
+                    )
+                )
+                for carry in self._carry
+            ]
+        self.width = width
+
+    def retained_range(self):
+        """Return the (first, end) sample indices still available at some level."""
+        with self._lock:
+            self._flush()
+            if self._raw is None:
+                return 0, 0
+            first = self._raw.first
+            for level, ring in enumerate(self._levels, start=1):
+                if ring.total:
+                    first = min(first, ring.first << level)
+            return first, self._raw.total
+
+    def query(self, start, end, max_points):
+        """
+        Return (level, x_first, values) for samples [start, end).
+
+        values has shape (3, points, width) holding min, max and mean per point;
+        at level 0 the three rows are the raw samples. x_first is the sample
+        index of the first point and each point spans 2^level samples.
+        """
+        with self._lock:
+            self._flush()
+            if self._raw is None or end <= start:
+                return 0, start, np.empty((3, 0, self.width))
+
+            span = end - start
+            level = 0
+            while level < self.level_count and (
+                span >> level > max_points
+                or (level == 0 and start < self._raw.first)
+                or (level > 0 and start >> level < self._levels[level - 1].first)
+            ):
+                level += 1
+
+            if level == 0:
+                first, rows = self._raw.get(start, end)
+                return 0, first, np.repeat(rows, 3, axis=0)
+
+            level = min(level, self.level_count)
+            ring = self._levels[level - 1]
+            first, blocks = ring.get(start >> level, -(-end >> level))
+
+            # Samples of a block that is not complete yet come from level 0
+            tail_start = max(ring.total << level, start)
+            if end > tail_start:
+                _, tail = self._raw.get(tail_start, end)
+                if tail.shape[1]:
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore", RuntimeWarning)
+                        tail_block = np.stack(
+                            [
+                                np.nanmin(tail[0], axis=0),
+                                np.nanmax(tail[0], axis=0),
+                                np.nanmean(tail[0], axis=0),
+                            ]
+                        )[:, np.newaxis]
+                    blocks = np.concatenate([blocks, tail_block], axis=1)
+            return level, first << level, blocks
+
+
+def row_to_floats(tokens):
+    """Convert parsed column tokens to floats, NaN where not numeric."""
+    values = []
+    for token in tokens:
+        try:
+            values.append(float(token))
+        except (TypeError, ValueError):
+            values.append(np.nan)
+    return values
@@ -0,0 +1,207 @@
+"""
+Capture replay through the live ingest pipeline.
+
+Text captures are indexed once (line offsets and the "HH:MM:SS.mmm " prefix
+the data tab writes when timestamps are enabled), then streamed at the
+recorded pace scaled by a speed factor, or as fast as possible. Lines
+without a timestamp are paced at a fixed rate. Binary captures are decoded
+with the selected framing protocol and paced the same way.
+"""
+
+import asyncio
+import re
+import time
+import numpy as np
+from .framing import FrameDecoder
+from .transports import Transport, get_transport_loop
+
+TIMESTAMP_PATTERN = re.compile(rb"^(\d+):(\d{2}):(\d{2}(?:\.\d+)?) ")
+MAX_SPEED_BATCH = 2000
+MAX_SLEEP = 0.05
+
+
+class CaptureReplay(Transport):
+    scheme = "replay"
+
+    def __init__(
+        self,
+        path,
+        data_callback=None,
+        error_callback=None,
+        protocol=None,
+        speed=1.0,
+        rate=100.0,
+    ):
+        super().__init__(data_callback, error_callback, protocol=None)
+        self.path = path
+        self.url = path
+        self.protocol = protocol
+        self.speed = speed
+        self.rate = rate
+        self.position = 0
+        self.paused = False
+        self._timestamps = np.empty(0)
+        self._offsets = None
+        self._lines = None
+        self._file = None
+        self._wake = None
+        self._anchor = None
+
+    @property
+    def count(self):
+        return len(self._timestamps)
+
+    @property
+    def duration(self):
+        if not self.count:
+            return 0.0
+        return float(self._timestamps[-1] - self._timestamps[0])
+
+    @property
+    def elapsed(self):
+        """Capture time of the next line, relative to the first one."""
+        if not self.count:
+            return 0.0
+        index = min(self.position, self.count - 1)
+        return float(self._timestamps[index] - self._timestamps[0])
+
+    @property
+    def finished(self):
+        """True once every line has been replayed (playback then pauses)."""
+        return self.position >= self.count
+
+    def set_speed(self, speed):
+        """Set the playback speed factor; None replays as fast as possible."""
+        get_transport_loop().call_soon(self._apply, "speed", speed)
+
+    def pause(self):
+        get_transport_loop().call_soon(self._apply, "paused", True)
+
+    def resume(self):
+        get_transport_loop().call_soon(self._apply, "paused", False)
+
+    def seek(self, seconds):
+        """Continue from the first line recorded at or after `seconds`."""
+        target = self._timestamps[0] + seconds if self.count else 0.0
+        position = int(np.searchsorted(self._timestamps, target, side="left"))
+        get_transport_loop().call_soon(self._apply, "position", position)
+
+    def _apply(self, name, value):
+        setattr(self, name, value)
+        # Playback is re-anchored so pacing continues from the new state
+        self._anchor = None
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _open(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._index)
+        self._wake = asyncio.Event()
+
+    def _index(self):
+        if self.protocol:
+            with open(self.path, "rb") as f:
+                records = FrameDecoder(**self.protocol).feed(f.read())
+            self._lines = [" ".join(f"{v:.9g}" for v in record) for record in records]
+            self._timestamps = np.arange(len(self._lines)) / self.rate
+            return
+
+        offsets = []
+        timestamps = []
+        has_timestamps = False
+        offset = 0
+        last = 0.0
+        recorded = 0.0
+        base = 0.0
+        with open(self.path, "rb") as f:
+            for raw in f:
+                match = TIMESTAMP_PATTERN.match(raw)
+                if match:
+                    hours, minutes, seconds = match.groups()
+                    value = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+                    # A timestamp reset during capture continues the timeline
+                    if value < recorded:
+                        base += recorded - value
+                    recorded = value
+                    last = base + value
+                    has_timestamps = True
+                if raw.strip():
+                    offsets.append(offset)
+                    timestamps.append(last)
+                offset += len(raw)
+        offsets.append(offset)
+
+        self._offsets = np.array(offsets, dtype=np.int64)
+        if has_timestamps:
+            self._timestamps = np.array(timestamps)
+        else:
+            self._timestamps = np.arange(len(timestamps)) / self.rate
+        self._file = open(self.path, "rb")
+
+    def _read_lines(self, start, end):
+        if self._lines is not None:
+            return self._lines[start:end]
+
+        self._file.seek(self._offsets[start])
+        data = self._file.read(int(self._offsets[end] - self._offsets[start]))
+        lines = []
+        for raw in data.splitlines():
+            match = TIMESTAMP_PATTERN.match(raw)
+            if match:
+                raw = raw[match.end() :]
+            try:
+                line = raw.decode("utf-8").strip()
+            except UnicodeDecodeError:
+                self._metrics.inc("transport_dropped_lines_total", source=self.scheme)
+                continue
+            if line:
+                lines.append(line)
+        return lines
+
+    def _emit(self, end):
+        lines = self._read_lines(self.position, end)
+        self.position = end
+        if lines and self.data_callback:
+            arrival_time = time.perf_counter()
+            self._metrics.inc("transport_lines_total", len(lines), source=self.scheme)
+            for line in lines:
+                self.data_callback(line, arrival_time)
+
+    async def _run(self):
+        while True:
+            # Stay open at the end so the capture can still be seeked back
+            if self.finished:
+                self.paused = True
+            if self.paused:
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+
+            if self.speed is None:
+                self._emit(min(self.count, self.position + MAX_SPEED_BATCH))
+                await asyncio.sleep(0)
+                continue
+
+            now = time.perf_counter()
+            if self._anchor is None:
+                self._anchor = (now, self._timestamps[self.position])
+            start_wall, start_ts = self._anchor
+            due_ts = start_ts + (now - start_wall) * self.speed
+
+            end = int(np.searchsorted(self._timestamps, due_ts, side="right"))
+            if end > self.position:
+                self._emit(end)
+                continue
+
+            # Sleep until the next line is due, or a control change wakes us up
+            delay = (self._timestamps[self.position] - due_ts) / self.speed
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), min(delay, MAX_SLEEP))
+            except asyncio.TimeoutError:
+                pass
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
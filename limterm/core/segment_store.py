@@ -0,0 +1,125 @@
+"""
+On-disk store for the lines pushed out of the in-memory line buffer.
+
+Spilled lines are appended, oldest first, to a series of segment files in a
+temporary directory, `segment_lines` lines per segment, and read back
+through one LineIndex per segment. Writes go through an ordinary buffered
+file and are flushed only when the store is read, so spilling costs the
+reader thread a memory copy per line. When the store grows past its disk
+limit the oldest segments are deleted. The directory is removed on close.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+from bisect import bisect_right
+from .line_index import LineIndex
+
+SEGMENT_LINES = 1 << 18
+
+
+class _Segment:
+    def __init__(self, path, first):
+        self.path = path
+        self.first = first
+        self.file = open(path, "wb")
+        self.index = LineIndex(path)
+        self.bytes = 0
+
+    def close(self):
+        self.file.close()
+        self.index.close()
+
+
+class SegmentStore:
+    def __init__(self, segment_lines=SEGMENT_LINES, disk_limit=None, directory=None):
+        """`disk_limit` is in bytes; None keeps every segment."""
+        self.segment_lines = segment_lines
+        self.disk_limit = disk_limit
+        self.directory = tempfile.mkdtemp(prefix="limterm-spill-", dir=directory)
+        # Line numbers of the oldest stored line and one past the newest
+        self.first = None
+        self.end = None
+        self.bytes = 0
+        self._segments = []
+        self._firsts = []
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return 0 if self.first is None else self.end - self.first
+
+    def extend(self, first, lines):
+        """Store `lines`, the first of which is line number `first`."""
+        with self._lock:
+            if self.end != first:
+                # Not contiguous with what is stored (e.g. the first call)
+                self._remove_segments(len(self._segments))
+                self.first = self.end = first
+            for line in lines:
+                if (
+                    not self._segments
+                    or self.end - self._segments[-1].first >= self.segment_lines
+                ):
+                    self._add_segment()
+                segment = self._segments[-1]
+                count = segment.file.write((line + "\n").encode("utf-8"))
+                segment.bytes += count
+                self.bytes += count
+                self.end += 1
+            self._dirty = True
+            if self.disk_limit is not None:
+                while len(self._segments) > 1 and self.bytes > self.disk_limit:
+                    self._remove_segments(1)
+
+    def lines(self, start, end):
+        """Lines [start, end) by line number, clipped to what is stored."""
+        with self._lock:
+            if self.first is None:
+                return []
+            start = max(start, self.first)
+            end = min(end, self.end)
+            if end <= start:
+                return []
+            if self._dirty:
+                for segment in self._segments:
+                    segment.file.flush()
+                self._dirty = False
+
+            lines = []
+            number = bisect_right(self._firsts, start) - 1
+            while start < end:
+                segment = self._segments[number]
+                segment.index.update()
+                stop = min(end, segment.first + self.segment_lines)
+                lines.extend(
+                    segment.index.lines(start - segment.first, stop - segment.first)
+                )
+                start = stop
+                number += 1
+            return lines
+
+    def close(self):
+        with self._lock:
+            self._remove_segments(len(self._segments))
+            self.first = self.end = None
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _add_segment(self):
+        path = os.path.join(self.directory, f"segment_{self.end:012d}.txt")
+        self._segments.append(_Segment(path, self.end))
+        self._firsts.append(self.end)
+
+    def _remove_segments(self, count):
+        for segment in self._segments[:count]:
+            segment.close()
+            self.bytes -= segment.bytes
+            try:
+                os.remove(segment.path)
+            except OSError:
+                pass
+        del self._segments[:count]
+        del self._firsts[:count]
+        if self._segments:
+            self.first = self._segments[0].first
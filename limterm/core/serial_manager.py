@@ -1,7 +1,11 @@
 import threading
+import time
 from ..utils import SerialPortManager
 from ..config import SERIAL_TIMEOUT
 from ..i18n import t
+from .latency import get_latency_tracker
+from .metrics import get_metrics
+from .framing import FrameDecoder
 
 
 class SerialManager:
@@ -11,6 +15,14 @@ class SerialManager:
         self.error_callback = error_callback
         self.is_connected = False
         self._stop_reading = False
+        self.protocol = None
+
+    def set_protocol(self, protocol):
+        """Select the wire format: None for text lines, or a dict with
+        framing ("cobs"/"slip"), record_format (struct layout) and crc."""
+        if protocol:
+            FrameDecoder(**protocol)  # validate before connecting
+        self.protocol = protocol
 
     def connect(self, port, baudrate):
         try:
@@ -20,7 +32,13 @@ class SerialManager:
             self.is_connected = True
             self._stop_reading = False
 
-            threading.Thread(target=self._read_data, daemon=True).start()
+            if self.protocol:
+                decoder = FrameDecoder(**self.protocol)
+                threading.Thread(
+                    target=self._read_frames, args=(decoder,), daemon=True
+                ).start()
+            else:
+                threading.Thread(target=self._read_data, daemon=True).start()
             return True
 
         except Exception as e:
@@ -35,11 +53,70 @@ class SerialManager:
         self.is_connected = False
 
     def _read_data(self):
+        tracker = get_latency_tracker()
+        metrics = get_metrics()
         while self.serial_port and self.serial_port.is_open and not self._stop_reading:
             try:
-                line = self.serial_port.readline().decode("utf-8").strip()
+                read_start = time.perf_counter()
+                raw = self.serial_port.readline()
+                arrival_time = time.perf_counter()
+                if not raw:
+                    continue
+                metrics.inc("serial_bytes_total", len(raw))
+
+                try:
+                    line = raw.decode("utf-8").strip()
+                except UnicodeDecodeError:
+                    metrics.inc("serial_dropped_lines_total")
+                    continue
+
+                if tracker.enabled:
+                    tracker.record("read", arrival_time - read_start)
+                    tracker.record("decode", time.perf_counter() - arrival_time)
                 if line and self.data_callback:
-                    self.data_callback(line)
+                    metrics.inc("serial_lines_total")
+                    self.data_callback(line, arrival_time)
+
+            except Exception as e:
+                if self.error_callback:
+                    self.error_callback(t("errors.data_read_error", error=str(e)))
+                break
+
+    def _read_frames(self, decoder):
+        tracker = get_latency_tracker()
+        metrics = get_metrics()
+        frames, errors, overflows = 0, 0, 0
+        while self.serial_port and self.serial_port.is_open and not self._stop_reading:
+            try:
+                read_start = time.perf_counter()
+                raw = self.serial_port.read(max(1, self.serial_port.in_waiting))
+                arrival_time = time.perf_counter()
+                if not raw:
+                    continue
+                metrics.inc("serial_bytes_total", len(raw))
+
+                records = decoder.feed(raw)
+
+                metrics.inc("serial_frames_total", decoder.frames - frames)
+                metrics.inc("serial_crc_errors_total", decoder.errors - errors)
+                metrics.inc(
+                    "serial_frame_overflows_total", decoder.overflows - overflows
+                )
+                frames, errors = decoder.frames, decoder.errors
+                overflows = decoder.overflows
+
+                if tracker.enabled:
+                    tracker.record("read", arrival_time - read_start)
+                    tracker.record("decode", time.perf_counter() - arrival_time)
+
+                # The buffer and every consumer are line based, so records
+                # are handed over as whitespace-separated lines
+                if len(records) and self.data_callback:
+                    metrics.inc("serial_lines_total", len(records))
+                    for record in records:
+                        self.data_callback(
+                            " ".join(f"{value:.9g}" for value in record), arrival_time
+                        )
 
             except Exception as e:
                 if self.error_callback:
@@ -0,0 +1,263 @@
+"""
+Amplitude spectra of sample blocks for the oscilloscope spectrum view.
+
+A block has its mean removed, is multiplied by a window function and goes
+through numpy.fft.rfft. Magnitudes are scaled by the window's coherent gain,
+so a sine of amplitude A reads as A whatever the window and block length.
+Successive sweeps are combined by SpectrumAverager, and SpectrumWorker runs
+the whole computation on a background thread so the Tk thread only has to
+update the result line.
+"""
+
+import threading
+from collections import deque
+from functools import lru_cache
+import numpy as np
+
+# ISO 18431-2 flat-top coefficients: best amplitude accuracy, wide main lobe
+FLATTOP_COEFFICIENTS = (
+    0.21557895,
+    0.41663158,
+    0.277263158,
+    0.083578947,
+    0.006947368,
+)
+AVERAGING_MODES = ("none", "linear", "rms", "peak")
+DB_FLOOR = 1e-12
+WATERFALL_COLUMNS = 300
+
+
+def _flattop(size):
+    phase = 2 * np.pi * np.arange(size) / max(size - 1, 1)
+    return sum(
+        (-1) ** k * coefficient * np.cos(k * phase)
+        for k, coefficient in enumerate(FLATTOP_COEFFICIENTS)
+    )
+
+
+WINDOW_FUNCTIONS = {
+    "hann": np.hanning,
+    "hamming": np.hamming,
+    "flattop": _flattop,
+    "rectangular": np.ones,
+}
+
+
+@lru_cache(maxsize=32)
+def window_function(name, size):
+    window = WINDOW_FUNCTIONS.get(name, np.hanning)(size)
+    window.setflags(write=False)
+    return window
+
+
+def _amplitudes(blocks, window):
+    """Amplitude spectra along the last axis of one or more blocks."""
+    size = blocks.shape[-1]
+    weights = window_function(window, size)
+    centered = blocks - blocks.mean(axis=-1, keepdims=True)
+    spectrum = np.abs(np.fft.rfft(centered * weights, axis=-1))
+    spectrum *= 2.0 / weights.sum()
+    # DC (and Nyquist for even lengths) have no mirrored half to fold in
+    spectrum[..., 0] /= 2.0
+    if size % 2 == 0:
+        spectrum[..., -1] /= 2.0
+    return spectrum
+
+
+def amplitude_spectrum(samples, window="hann"):
+    """Return the single-sided amplitude spectrum of a block of samples."""
+    samples = np.asarray(samples, dtype=float)
+    samples = samples[~np.isnan(samples)]
+    if len(samples) < 2:
+        return np.empty(0)
+    return _amplitudes(samples, window)
+
+
+def frequency_axis(size, sample_rate=1.0):
+    """Bin frequencies for a block of `size` samples."""
+    return np.fft.rfftfreq(size, d=1.0 / sample_rate)
+
+
+def to_db(magnitude):
+    return 20.0 * np.log10(np.maximum(magnitude, DB_FLOOR))
+
+
+class SpectrumAverager:
+    """Combine successive sweeps: linear mean, RMS (power) mean or peak hold."""
+
+    def __init__(self, mode="linear", count=8):
+        self.mode = mode if mode in AVERAGING_MODES else "linear"
+        self.count = max(1, int(count))
+        self.reset()
+
+    def reset(self):
+        self.sweeps = 0
+        self._history = deque()
+        self._sum = None
+        self._peak = None
+
+    def add(self, magnitude):
+        """Add one sweep and return the averaged spectrum."""
+        # A different block length starts a new average
+        previous = self._peak if self._sum is None else self._sum
+        if previous is not None and len(previous) != len(magnitude):
+            self.reset()
+        self.sweeps += 1
+
+        if self.mode == "none":
+            return magnitude
+        if self.mode == "peak":
+            if self._peak is None:
+                self._peak = magnitude.copy()
+            else:
+                np.maximum(self._peak, magnitude, out=self._peak)
+            return self._peak.copy()
+
+        # Running sum over the last `count` sweeps: add the new, drop the oldest
+        value = magnitude * magnitude if self.mode == "rms" else magnitude
+        if self._sum is None:
+            self._sum = np.zeros_like(value)
+        self._sum += value
+        self._history.append(value)
+        if len(self._history) > self.count:
+            self._sum -= self._history.popleft()
+        average = np.maximum(self._sum, 0.0) / len(self._history)
+        return np.sqrt(average) if self.mode == "rms" else average
+
+
+class SpectrumWorker:
+    """Background thread computing averaged spectra; the newest block wins."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._queue = deque()
+        self._result = None
+        self._averager = SpectrumAverager()
+        self._reset = False
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="spectrum-worker", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        samples,
+        sample_rate=1.0,
+        window="hann",
+        averaging="linear",
+        averages=8,
+        scale="db",
+    ):
+        job = (samples, sample_rate, window, averaging, averages, scale)
+        with self._lock:
+            self._queue.append(job)
+            # Bounded backlog: sweeps older than one averaging run are skipped
+            while len(self._queue) > max(1, averages):
+                self._queue.popleft()
+        self._wake.set()
+
+    def reset(self):
+        """Restart averaging with the next sweep."""
+        with self._lock:
+            self._queue.clear()
+            self._result = None
+            self._reset = True
+
+    def result(self):
+        """Return and consume the newest (frequencies, values, sweeps), or None."""
+        with self._lock:
+            result, self._result = self._result, None
+            return result
+
+    def stop(self):
+        self._running = False
+        self._wake.set()
+
+    def _run(self):
+        while self._running:
+            self._wake.wait()
+            self._wake.clear()
+            while self._running:
+                with self._lock:
+                    if not self._queue:
+                        break
+                    job = self._queue.popleft()
+                    if self._reset:
+                        self._averager.reset()
+                        self._reset = False
+                result = self._compute(*job)
+                if result is not None:
+                    with self._lock:
+                        self._result = result
+
+    def _compute(self, samples, sample_rate, window, averaging, averages, scale):
+        averager = self._averager
+        if averager.mode != averaging or averager.count != averages:
+            self._averager = averager = SpectrumAverager(averaging, averages)
+
+        samples = np.asarray(samples, dtype=float)
+        samples = samples[~np.isnan(samples)]
+        magnitude = amplitude_spectrum(samples, window)
+        if not len(magnitude):
+            return None
+        averaged = averager.add(magnitude)
+        frequencies = frequency_axis(len(samples), sample_rate)
+        values = to_db(averaged) if scale == "db" else averaged
+        return frequencies, values, averager.sweeps
+
+
+class Spectrogram:
+    """
+    Short-time spectra computed incrementally into a fixed-size ring image.
+
+    Samples are fed as they arrive; every complete block (advancing by `hop`
+    samples) becomes one column of dB values written over the oldest one, so
+    memory and the cost of a frame do not grow with the session length.
+    """
+
+    def __init__(
+        self, block_size=1024, columns=WATERFALL_COLUMNS, window="hann", hop=None
+    ):
+        self.block_size = max(2, int(block_size))
+        self.hop = max(1, int(hop or self.block_size // 2))
+        self.columns = columns
+        self.window = window
+        self.bins = self.block_size // 2 + 1
+        self.count = 0
+        self._ring = np.full((self.bins, columns), np.nan)
+        self._image = np.full((self.bins, columns), np.nan)
+        self._pending = np.empty(0)
+
+    def feed(self, samples):
+        """Add samples; returns the number of new columns."""
+        samples = np.asarray(samples, dtype=float)
+        data = np.concatenate([self._pending, samples[~np.isnan(samples)]])
+        if len(data) < self.block_size:
+            self._pending = data
+            return 0
+
+        blocks = (len(data) - self.block_size) // self.hop + 1
+        consumed = blocks * self.hop
+        # Columns that would be overwritten in the same call are skipped
+        skipped = max(0, blocks - self.columns)
+        start = skipped * self.hop
+        frames = np.lib.stride_tricks.sliding_window_view(
+            data[start:], self.block_size
+        )[:: self.hop][: blocks - skipped]
+        spectra = to_db(_amplitudes(frames, self.window))
+
+        positions = np.arange(self.count + skipped, self.count + blocks) % self.columns
+        self._ring[:, positions] = spectra.T
+        self.count += blocks
+        self._pending = data[consumed:]
+        return blocks
+
+    def image(self):
+        """The ring ordered oldest column first, in a preallocated array."""
+        split = self.count % self.columns
+        tail = self.columns - split
+        self._image[:, :tail] = self._ring[:, split:]
+        self._image[:, tail:] = self._ring[:, :split]
+        return self._image
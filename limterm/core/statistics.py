@@ -0,0 +1,266 @@
+"""
+Streaming per-column statistics over the whole session and a sliding window.
+
+Rows are queued as they arrive and folded in batches, so reading the panel
+never rescans the buffer:
+
+- Session mean and variance use Welford's update, merged batch-wise with
+  Chan's formula; min and max are running extremes.
+- Window mean and variance use running sums of the values shifted by the
+  first sample, adding the new rows and subtracting the rows that leave the
+  window. The sums are recomputed exactly once per window of rows so
+  rounding drift cannot build up.
+- Window min and max use monotonic deques, O(1) amortised per sample.
+
+RMS is derived from the mean and variance, so no extra sums are needed.
+"""
+
+import threading
+from collections import deque
+import numpy as np
+
+DEFAULT_WINDOW = 10000
+FLUSH_SIZE = 256
+STAT_NAMES = ("count", "mean", "std", "min", "max", "rms")
+
+
+class RollingStatistics:
+    def __init__(self, window=DEFAULT_WINDOW):
+        self._lock = threading.Lock()
+        self.window = max(1, int(window))
+        self.total = 0
+        self.width = 0
+        self._pending = []
+        self._reset_session()
+        self._reset_window()
+
+    def _reset_session(self):
+        self._count = np.zeros(self.width)
+        self._mean = np.zeros(self.width)
+        self._m2 = np.zeros(self.width)
+        self._min = np.full(self.width, np.inf)
+        self._max = np.full(self.width, -np.inf)
+        self._shift = np.full(self.width, np.nan)
+
+    def _reset_window(self):
+        self._ring = np.full((self.window, self.width), np.nan)
+        self._win_count = np.zeros(self.width)
+        self._win_sum = np.zeros(self.width)
+        self._win_sumsq = np.zeros(self.width)
+        self._win_min = [deque() for _ in range(self.width)]
+        self._win_max = [deque() for _ in range(self.width)]
+        self._since_exact = 0
+
+    def clear(self):
+        with self._lock:
+            self.total = 0
+            self.width = 0
+            self._pending = []
+            self._reset_session()
+            self._reset_window()
+
+    def set_window(self, window, recent_rows=None):
+        """Change the window length, reseeding it from the newest rows if given."""
+        window = max(1, int(window))
+        with self._lock:
+            self._flush()
+            if window == self.window:
+                return
+            self.window = window
+            self._reset_window()
+            if recent_rows is not None and len(recent_rows):
+                rows = self._as_array(recent_rows)[-window:]
+                self._widen(rows.shape[1])
+                self._fill_window(rows, self.total - len(rows))
+
+    def append(self, values):
+        with self._lock:
+            self._pending.append(values)
+            if len(self._pending) >= FLUSH_SIZE:
+                self._flush()
+
+    def extend(self, rows):
+        with self._lock:
+            self._pending.extend(rows)
+            self._flush()
+
+    def snapshot(self):
+        """Return {"session": {...}, "window": {...}} with one array per statistic."""
+        with self._lock:
+            self._flush()
+            session = self._describe(
+                self._count,
+                self._mean,
+                self._m2,
+                np.where(self._count > 0, self._min, np.nan),
+                np.where(self._count > 0, self._max, np.nan),
+            )
+            count = self._win_count
+            with np.errstate(invalid="ignore", divide="ignore"):
+                shifted_mean = self._win_sum / count
+                m2 = np.maximum(self._win_sumsq - self._win_sum * shifted_mean, 0.0)
+            window = self._describe(
+                count,
+                np.where(np.isnan(self._shift), 0.0, self._shift) + shifted_mean,
+                m2,
+                np.array([q[0][1] if q else np.nan for q in self._win_min]),
+                np.array([q[0][1] if q else np.nan for q in self._win_max]),
+            )
+            return {"session": session, "window": window}
+
+    @staticmethod
+    def _describe(count, mean, m2, minimum, maximum):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            valid = count > 0
+            mean = np.where(valid, mean, np.nan)
+            std = np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+            rms = np.where(valid, np.sqrt(m2 / count + mean * mean), np.nan)
+        return {
+            "count": count.astype(int),
+            "mean": mean,
+            "std": std,
+            "min": minimum,
+            "max": maximum,
+            "rms": rms,
+        }
+
+    @staticmethod
+    def _as_array(rows):
+        try:
+            return np.array(rows, dtype=float, ndmin=2)
+        except ValueError:
+            # Ragged rows are padded with NaN
+            width = max(len(row) for row in rows)
+            values = np.full((len(rows), width), np.nan)
+            for index, row in enumerate(rows):
+                values[index, : len(row)] = row
+            return values
+
+    def _widen(self, width):
+        extra = width - self.width
+        if extra <= 0:
+            return
+        self._count = np.concatenate([self._count, np.zeros(extra)])
+        self._mean = np.concatenate([self._mean, np.zeros(extra)])
+        self._m2 = np.concatenate([self._m2, np.zeros(extra)])
+        self._min = np.concatenate([self._min, np.full(extra, np.inf)])
+        self._max = np.concatenate([self._max, np.full(extra, -np.inf)])
+        self._shift = np.concatenate([self._shift, np.full(extra, np.nan)])
+        self._ring = np.pad(self._ring, ((0, 0), (0, extra)), constant_values=np.nan)
+        self._win_count = np.concatenate([self._win_count, np.zeros(extra)])
+        self._win_sum = np.concatenate([self._win_sum, np.zeros(extra)])
+        self._win_sumsq = np.concatenate([self._win_sumsq, np.zeros(extra)])
+        self._win_min.extend(deque() for _ in range(extra))
+        self._win_max.extend(deque() for _ in range(extra))
+        self.width = width
+
+    def _flush(self):
+        if not self._pending:
+            return
+        rows = self._as_array(self._pending)
+        self._pending = []
+        self._widen(rows.shape[1])
+        if rows.shape[1] < self.width:
+            rows = np.pad(
+                rows,
+                ((0, 0), (0, self.width - rows.shape[1])),
+                constant_values=np.nan,
+            )
+
+        self._update_session(rows)
+        first_index = self.total
+        self.total += len(rows)
+        if len(rows) >= self.window:
+            self._reset_window()
+            self._fill_window(rows[-self.window :], self.total - self.window)
+        else:
+            self._update_window(rows, first_index)
+
+    def _update_session(self, rows):
+        finite = ~np.isnan(rows)
+        batch_count = finite.sum(axis=0)
+        seen = batch_count > 0
+        if not seen.any():
+            return
+
+        # The first value of a column anchors its shifted window sums
+        unset = np.isnan(self._shift) & seen
+        if unset.any():
+            first = np.argmax(finite, axis=0)
+            self._shift[unset] = rows[first[unset], np.flatnonzero(unset)]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            batch_mean = np.where(seen, np.nansum(rows, axis=0) / batch_count, 0.0)
+            batch_m2 = np.nansum(np.where(finite, rows - batch_mean, 0.0) ** 2, axis=0)
+            count = self._count + batch_count
+            delta = batch_mean - self._mean
+            ratio = np.where(seen, batch_count / np.maximum(count, 1), 0.0)
+            self._mean = self._mean + delta * ratio
+            self._m2 = self._m2 + batch_m2 + delta * delta * self._count * ratio
+        self._count = count
+        self._min = np.fmin(
+            self._min, np.nanmin(np.where(finite, rows, np.inf), axis=0)
+        )
+        self._max = np.fmax(
+            self._max, np.nanmax(np.where(finite, rows, -np.inf), axis=0)
+        )
+
+    def _shifted_sums(self, rows):
+        shifted = rows - np.where(np.isnan(self._shift), 0.0, self._shift)
+        finite = ~np.isnan(shifted)
+        shifted = np.where(finite, shifted, 0.0)
+        return finite.sum(axis=0), shifted.sum(axis=0), (shifted * shifted).sum(axis=0)
+
+    def _fill_window(self, rows, first_index):
+        """Rebuild the window from rows [first_index, first_index + len(rows))."""
+        positions = np.arange(first_index, first_index + len(rows)) % self.window
+        self._ring[:] = np.nan
+        self._ring[positions] = rows
+        self._win_count, self._win_sum, self._win_sumsq = self._shifted_sums(rows)
+        for column in range(self.width):
+            self._win_min[column].clear()
+            self._win_max[column].clear()
+        self._push_extremes(rows, first_index)
+        self._since_exact = 0
+
+    def _update_window(self, rows, first_index):
+        positions = np.arange(first_index, first_index + len(rows)) % self.window
+        evicted = self._ring[positions]
+        # Rows that never entered the window are NaN, so they subtract nothing
+        count, total, squares = self._shifted_sums(evicted)
+        self._win_count -= count
+        self._win_sum -= total
+        self._win_sumsq -= squares
+        self._ring[positions] = rows
+        count, total, squares = self._shifted_sums(rows)
+        self._win_count += count
+        self._win_sum += total
+        self._win_sumsq += squares
+
+        self._push_extremes(rows, first_index)
+
+        self._since_exact += len(rows)
+        if self._since_exact >= self.window:
+            self._win_count, self._win_sum, self._win_sumsq = self._shifted_sums(
+                self._ring
+            )
+            self._since_exact = 0
+
+    def _push_extremes(self, rows, first_index):
+        oldest = self.total - self.window
+        for column in range(rows.shape[1]):
+            lows = self._win_min[column]
+            highs = self._win_max[column]
+            for index, value in enumerate(rows[:, column].tolist(), first_index):
+                if value != value:
+                    continue
+                while lows and lows[-1][1] >= value:
+                    lows.pop()
+                lows.append((index, value))
+                while highs and highs[-1][1] <= value:
+                    highs.pop()
+                highs.append((index, value))
+            while lows and lows[0][0] < oldest:
+                lows.popleft()
+            while highs and highs[0][0] < oldest:
+                highs.popleft()
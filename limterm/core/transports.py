@@ -0,0 +1,395 @@
+"""
+Asyncio based data sources that feed the same ingest callback as SerialManager.
+
+All transports share one event loop running on a background thread, so any
+number of TCP, UDP, named pipe, file and serial sources are served without a
+thread per source. A source is described by a URL:
+
+    tcp://host:port              connect to an instrument as a TCP client
+    udp://host:port              listen for datagrams on a local address
+    pipe:///path/to/fifo         read a named pipe, reopened for each writer
+    file:///path/to/capture.txt  read a capture file as fast as possible
+    serial:///dev/ttyUSB0?baudrate=115200
+
+Received bytes are split into text lines, or into binary records when a
+framing protocol is set (see framing.FrameDecoder).
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from urllib.parse import parse_qs, urlsplit
+from ..config import DEFAULT_BAUDRATE
+from ..i18n import t
+from .framing import FrameDecoder
+from .metrics import get_metrics
+
+READ_SIZE = 65536
+
+
+class TransportLoop:
+    """One asyncio event loop on a daemon thread, shared by all transports."""
+
+    def __init__(self):
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="transport-loop", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def call_soon(self, callback, *args):
+        self.loop.call_soon_threadsafe(callback, *args)
+
+
+_transport_loop = None
+
+
+def get_transport_loop():
+    global _transport_loop
+    if _transport_loop is None:
+        _transport_loop = TransportLoop()
+    return _transport_loop
+
+
+class Transport(ABC):
+    scheme = None
+
+    def __init__(self, data_callback=None, error_callback=None, protocol=None):
+        self.data_callback = data_callback
+        self.error_callback = error_callback
+        self.is_connected = False
+        self.url = None
+        self._decoder = FrameDecoder(**protocol) if protocol else None
+        self._pending = b""
+        self._task = None
+        self._metrics = get_metrics()
+
+    def connect(self, timeout=5.0):
+        """Open the source and start reading; returns False on failure."""
+        transport_loop = get_transport_loop()
+        try:
+            transport_loop.submit(self._open()).result(timeout)
+        except Exception as e:
+            self._report(t("errors.connection_error", error=str(e)))
+            return False
+
+        self.is_connected = True
+        self._task = transport_loop.submit(self._run())
+        self._task.add_done_callback(self._on_finished)
+        return True
+
+    def disconnect(self):
+        if not self.is_connected:
+            return
+        self.is_connected = False
+        if self._task is not None:
+            self._task.cancel()
+        get_transport_loop().call_soon(self._close)
+
+    @abstractmethod
+    async def _open(self):
+        """Open the source; runs on the transport loop."""
+
+    @abstractmethod
+    async def _run(self):
+        """Read until the source ends or the task is cancelled."""
+
+    def _close(self):
+        pass
+
+    def _on_finished(self, future):
+        self.is_connected = False
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self._report(t("errors.data_read_error", error=str(error)))
+        else:
+            self._report(t("errors.transport_closed", source=self.url or self.scheme))
+        get_transport_loop().call_soon(self._close)
+
+    def _report(self, message):
+        if self.error_callback:
+            self.error_callback(message)
+
+    def _feed(self, data, arrival_time=None):
+        """Split received bytes into lines or records and hand them over."""
+        if not data:
+            return
+        if arrival_time is None:
+            arrival_time = time.perf_counter()
+        self._metrics.inc("transport_bytes_total", len(data), source=self.scheme)
+
+        if self._decoder is not None:
+            lines = [
+                " ".join(f"{value:.9g}" for value in record)
+                for record in self._decoder.feed(data)
+            ]
+        else:
+            *raw_lines, self._pending = (self._pending + data).split(b"\n")
+            lines = []
+            for raw in raw_lines:
+                try:
+                    line = raw.decode("utf-8").strip()
+                except UnicodeDecodeError:
+                    self._metrics.inc(
+                        "transport_dropped_lines_total", source=self.scheme
+                    )
+                    continue
+                if line:
+                    lines.append(line)
+
+        if lines and self.data_callback:
+            self._metrics.inc("transport_lines_total", len(lines), source=self.scheme)
+            for line in lines:
+                self.data_callback(line, arrival_time)
+
+
+class StreamTransport(Transport):
+    """Base for sources read through an asyncio.StreamReader."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reader = None
+        self._writer = None
+
+    async def _run(self):
+        while True:
+            data = await self._reader.read(READ_SIZE)
+            if not data:
+                break
+            self._feed(data)
+
+    def _close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class TcpTransport(StreamTransport):
+    scheme = "tcp"
+
+    def __init__(self, host, port, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.host = host
+        self.port = int(port)
+
+    async def _open(self):
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+
+class UdpTransport(Transport):
+    scheme = "udp"
+
+    def __init__(self, host, port, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.host = host or "0.0.0.0"
+        self.port = int(port)
+        self._endpoint = None
+        self._closed = None
+
+    async def _open(self):
+        transport = self
+
+        class Protocol(asyncio.DatagramProtocol):
+            def datagram_received(self, data, addr):
+                # A datagram always ends a line
+                if transport._decoder is None and not data.endswith(b"\n"):
+                    data += b"\n"
+                transport._feed(data)
+
+            def error_received(self, exc):
+                transport._report(t("errors.data_read_error", error=str(exc)))
+
+        loop = asyncio.get_running_loop()
+        self._closed = loop.create_future()
+        self._endpoint, _ = await loop.create_datagram_endpoint(
+            Protocol, local_addr=(self.host, self.port)
+        )
+
+    async def _run(self):
+        await self._closed
+
+    def _close(self):
+        if self._endpoint is not None:
+            self._endpoint.close()
+            self._endpoint = None
+        if self._closed is not None and not self._closed.done():
+            self._closed.set_result(None)
+
+
+class FileTransport(Transport):
+    """Read a file in chunks on the loop, yielding between chunks."""
+
+    scheme = "file"
+
+    def __init__(self, path, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.path = path
+        self._file = None
+
+    async def _open(self):
+        self._file = open(self.path, "rb")
+
+    async def _run(self):
+        while True:
+            data = self._file.read(READ_SIZE)
+            if not data:
+                break
+            self._feed(data)
+            await asyncio.sleep(0)
+        self._feed(b"\n")
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class PipeTransport(StreamTransport):
+    """Read a named pipe; on POSIX it is reopened whenever a writer closes it."""
+
+    scheme = "pipe"
+
+    def __init__(self, path, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.path = path
+
+    async def _open(self):
+        if sys.platform == "win32":
+            self._pipe = open(self.path, "rb", buffering=0)
+            return
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(self.path)
+        await self._connect_pipe()
+
+    async def _connect_pipe(self):
+        # O_NONBLOCK so opening does not wait for a writer
+        fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+        loop = asyncio.get_running_loop()
+        self._reader = asyncio.StreamReader(limit=READ_SIZE)
+        self._writer, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(self._reader),
+            os.fdopen(fd, "rb", buffering=0),
+        )
+
+    async def _run(self):
+        if sys.platform == "win32":
+            loop = asyncio.get_running_loop()
+            while True:
+                data = await loop.run_in_executor(None, self._pipe.read, READ_SIZE)
+                if not data:
+                    break
+                self._feed(data)
+            return
+
+        while True:
+            await super()._run()
+            self._close()
+            await asyncio.sleep(0.2)
+            await self._connect_pipe()
+
+    def _close(self):
+        if sys.platform == "win32":
+            if getattr(self, "_pipe", None) is not None:
+                self._pipe.close()
+                self._pipe = None
+        else:
+            super()._close()
+
+
+class SerialTransport(Transport):
+    """pyserial port watched by the event loop (polled in an executor on Windows)."""
+
+    scheme = "serial"
+
+    def __init__(self, port, baudrate, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.port = port
+        self.baudrate = baudrate
+        self._serial = None
+        self._closed = None
+
+    async def _open(self):
+        from ..utils import SerialPortManager
+
+        self._serial = SerialPortManager.create_connection(
+            self.port, self.baudrate, timeout=0
+        )
+        loop = asyncio.get_running_loop()
+        self._closed = loop.create_future()
+        if sys.platform != "win32":
+            loop.add_reader(self._serial.fileno(), self._on_readable)
+
+    def _on_readable(self):
+        try:
+            data = self._serial.read(max(1, self._serial.in_waiting))
+        except Exception as e:
+            if not self._closed.done():
+                self._closed.set_exception(e)
+            return
+        self._feed(data)
+
+    async def _run(self):
+        if sys.platform == "win32":
+            self._serial.timeout = 0.1
+            loop = asyncio.get_running_loop()
+            while self._serial is not None and self._serial.is_open:
+                data = await loop.run_in_executor(
+                    None, self._serial.read, max(1, self._serial.in_waiting)
+                )
+                self._feed(data)
+            return
+        await self._closed
+
+    def _close(self):
+        if self._serial is not None:
+            if sys.platform != "win32":
+                asyncio.get_running_loop().remove_reader(self._serial.fileno())
+            self._serial.close()
+            self._serial = None
+
+
+def open_transport(url, data_callback=None, error_callback=None, protocol=None):
+    """Create the transport for a source URL (not yet connected)."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    kwargs = {
+        "data_callback": data_callback,
+        "error_callback": error_callback,
+        "protocol": protocol,
+    }
+
+    if scheme in ("tcp", "udp"):
+        if parts.port is None:
+            raise ValueError(t("errors.transport_missing_port", url=url))
+        transport_class = TcpTransport if scheme == "tcp" else UdpTransport
+        transport = transport_class(parts.hostname, parts.port, **kwargs)
+    elif scheme == "file":
+        transport = FileTransport(parts.netloc + parts.path, **kwargs)
+    elif scheme == "pipe":
+        transport = PipeTransport(parts.netloc + parts.path, **kwargs)
+    elif scheme == "serial":
+        query = parse_qs(parts.query)
+        baudrate = query.get("baudrate", [DEFAULT_BAUDRATE])[0]
+        transport = SerialTransport(parts.netloc + parts.path, int(baudrate), **kwargs)
+    else:
+        raise ValueError(t("errors.transport_unknown_scheme", url=url))
+
+    transport.url = url.strip()
+    return transport
@@ -4,6 +4,7 @@ from .data_tab import DataTab
 from .graph_tab import GraphTab
 from .graph_options import GraphOptionsWindow
 from .osc_tab import OscTab
+from .histogram_tab import HistogramTab
 
 __all__ = [
     "MainWindow",
@@ -12,4 +13,5 @@ __all__ = [
     "GraphTab",
     "GraphOptionsWindow",
     "OscTab",
+    "HistogramTab",
 ]
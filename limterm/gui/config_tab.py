@@ -1,25 +1,31 @@
 import tkinter as tk
-from tkinter import ttk
-from ..config import DEFAULT_BAUDRATES, DEFAULT_BAUDRATE
-from ..utils import SyntheticDataGenerator
+from tkinter import ttk, filedialog
+from ..config import DEFAULT_BAUDRATES, DEFAULT_BAUDRATE, CAPTURE_DIR
+from ..core import CaptureReplay, MetricsExporter, get_metrics, open_transport
+from ..utils import SyntheticDataGenerator, get_line_parser
 from ..i18n import t, get_config_manager
-from .preference_widgets import PrefCombobox
+from .preference_widgets import PrefCheckbutton, PrefCombobox, PrefEntry
+import os
 import platform
 import math
 
 
 class ConfigTab:
-    def __init__(self, parent, serial_manager, signal_handler=None):
+    def __init__(self, parent, serial_manager, signal_handler=None, device_hub=None):
         self.frame = ttk.Frame(parent)
         self.serial_manager = serial_manager
+        self.device_hub = device_hub
         self.signal_handler = signal_handler
         self.synthetic_generator = None
+        self.stream_source = None
         self.config_manager = get_config_manager()
         self.equation_entries = {}
+        self.metrics_exporter = MetricsExporter(get_metrics())
 
         self._create_widgets()
         self._update_ports()
         self._load_preferences()
+        self._apply_metrics_settings()
 
     def _create_widgets(self):
         toggle_frame = ttk.Frame(self.frame)
@@ -49,6 +55,28 @@ class ConfigTab:
         )
         self.status_label.pack(padx=10, pady=5)
 
+        self.replay_controls = ttk.Frame(self.info_frame)
+        self.replay_pause_button = ttk.Button(
+            self.replay_controls,
+            text=t("ui.config_tab.replay_pause"),
+            command=self._toggle_replay_pause,
+        )
+        self.replay_pause_button.pack(side="left", padx=(0, 5))
+        self.replay_position = tk.DoubleVar(value=0.0)
+        self.replay_scale = ttk.Scale(
+            self.replay_controls,
+            orient="horizontal",
+            from_=0.0,
+            to=1.0,
+            variable=self.replay_position,
+        )
+        self.replay_scale.pack(side="left", fill="x", expand=True)
+        self.replay_scale.bind("<ButtonPress-1>", self._on_replay_scale_press)
+        self.replay_scale.bind("<ButtonRelease-1>", self._on_replay_scale_release)
+        self.replay_time_label = ttk.Label(self.replay_controls, text="")
+        self.replay_time_label.pack(side="left", padx=(5, 0))
+        self._replay_dragging = False
+
         self.settings_frame = ttk.Frame(self.frame)
         self.settings_frame.grid(column=0, row=2, padx=10, pady=5, sticky="ew")
 
@@ -70,10 +98,17 @@ class ConfigTab:
             pref_key="config.mode",
             default_value="hardware",
             state="readonly",
-            values=[t("common.hardware"), t("common.synthetic")],
+            values=[
+                t("common.hardware"),
+                t("common.synthetic"),
+                t("common.stream"),
+                t("common.replay"),
+            ],
             value_mapping={
                 t("common.hardware"): "hardware",
                 t("common.synthetic"): "synthetic",
+                t("common.stream"): "stream",
+                t("common.replay"): "replay",
             },
             on_change=self._on_mode_changed,
         )
@@ -107,6 +142,108 @@ class ConfigTab:
         self.baudrate_combobox.set(DEFAULT_BAUDRATE)
         self.baudrate_combobox.bind("<<ComboboxSelected>>", self._on_preference_changed)
 
+        self.devices_label = ttk.Label(
+            self.mode_frame, text=t("ui.config_tab.devices_label")
+        )
+        self.devices_label.grid(column=0, row=3, padx=10, pady=10, sticky="nw")
+
+        devices_frame = ttk.Frame(self.mode_frame)
+        devices_frame.grid(column=1, row=3, padx=10, pady=10, sticky="w")
+
+        self.devices_listbox = tk.Listbox(devices_frame, height=3, width=30)
+        self.devices_listbox.grid(column=0, row=0, rowspan=2, sticky="w")
+
+        self.add_device_button = ttk.Button(
+            devices_frame,
+            text=t("ui.config_tab.add_device"),
+            command=self._add_device,
+        )
+        self.add_device_button.grid(column=1, row=0, padx=(5, 0), sticky="ew")
+
+        self.remove_device_button = ttk.Button(
+            devices_frame,
+            text=t("ui.config_tab.remove_device"),
+            command=self._remove_device,
+        )
+        self.remove_device_button.grid(column=1, row=1, padx=(5, 0), sticky="ew")
+
+        self.source_url_label = ttk.Label(
+            self.mode_frame, text=t("ui.config_tab.source_url_label")
+        )
+        self.source_url_label.grid(column=0, row=4, padx=10, pady=10, sticky="w")
+        self.source_url_entry = PrefEntry(
+            self.mode_frame,
+            pref_key="config.stream.url",
+            default_value="tcp://127.0.0.1:5000",
+            width=40,
+        )
+        self.source_url_entry.grid(column=1, row=4, padx=10, pady=10, sticky="w")
+        self.source_url_hint = ttk.Label(
+            self.mode_frame, text=t("ui.config_tab.source_url_hint")
+        )
+        self.source_url_hint.grid(
+            column=0, row=5, columnspan=2, padx=10, pady=(0, 10), sticky="w"
+        )
+
+        self.replay_file_label = ttk.Label(
+            self.mode_frame, text=t("ui.config_tab.replay_file_label")
+        )
+        self.replay_file_label.grid(column=0, row=6, padx=10, pady=10, sticky="w")
+
+        replay_file_frame = ttk.Frame(self.mode_frame)
+        replay_file_frame.grid(column=1, row=6, padx=10, pady=10, sticky="w")
+
+        self.replay_file_entry = PrefEntry(
+            replay_file_frame,
+            pref_key="config.replay.file",
+            default_value="",
+            width=36,
+        )
+        self.replay_file_entry.grid(column=0, row=0, sticky="w")
+
+        self.replay_browse_button = ttk.Button(
+            replay_file_frame, text="📂", width=3, command=self._browse_replay_file
+        )
+        self.replay_browse_button.grid(column=1, row=0, padx=(5, 0))
+
+        self.replay_speed_label = ttk.Label(
+            self.mode_frame, text=t("ui.config_tab.replay_speed_label")
+        )
+        self.replay_speed_label.grid(column=0, row=7, padx=10, pady=10, sticky="w")
+
+        replay_speed_frame = ttk.Frame(self.mode_frame)
+        replay_speed_frame.grid(column=1, row=7, padx=10, pady=10, sticky="w")
+
+        self.replay_speed_combobox = PrefCombobox(
+            replay_speed_frame,
+            pref_key="config.replay.speed",
+            default_value="1",
+            state="readonly",
+            values=["0.5×", "1×", "2×", "5×", "10×", t("ui.config_tab.replay_max")],
+            value_mapping={
+                "0.5×": "0.5",
+                "1×": "1",
+                "2×": "2",
+                "5×": "5",
+                "10×": "10",
+                t("ui.config_tab.replay_max"): "max",
+            },
+            width=8,
+            on_change=self._on_replay_speed_changed,
+        )
+        self.replay_speed_combobox.grid(column=0, row=0, sticky="w")
+
+        ttk.Label(replay_speed_frame, text=t("ui.config_tab.replay_rate_label")).grid(
+            column=1, row=0, padx=(10, 5), sticky="w"
+        )
+        self.replay_rate_entry = PrefEntry(
+            replay_speed_frame,
+            pref_key="config.replay.rate",
+            default_value="100",
+            width=8,
+        )
+        self.replay_rate_entry.grid(column=2, row=0, sticky="w")
+
         self.mode_frame.columnconfigure(1, weight=1)
 
         self.synthetic_frame = ttk.LabelFrame(
@@ -177,6 +314,9 @@ class ConfigTab:
         connection_settings_frame.columnconfigure(0, weight=1)
         self.settings_frame.columnconfigure(0, weight=1)
 
+        self._create_metrics_widgets()
+        self._create_protocol_widgets()
+
         self.settings_visible = self.config_manager.load_setting(
             "config.ui.settings_visible", False
         )
@@ -211,12 +351,247 @@ class ConfigTab:
         )
         self.win_simul_info.grid_remove()
 
+    def _create_metrics_widgets(self):
+        metrics_frame = ttk.LabelFrame(
+            self.settings_frame, text=t("ui.config_tab.metrics")
+        )
+        metrics_frame.grid(column=0, row=1, sticky="ew", padx=5, pady=5)
+
+        self.metrics_enabled = PrefCheckbutton(
+            metrics_frame,
+            pref_key="config.metrics.enabled",
+            default_value=False,
+            text=t("ui.config_tab.metrics_enabled"),
+            on_change=self._apply_metrics_settings,
+        )
+        self.metrics_enabled.grid(column=0, row=0, padx=5, pady=5, sticky="w")
+
+        ttk.Label(metrics_frame, text=t("ui.config_tab.metrics_output_label")).grid(
+            column=1, row=0, padx=5, pady=5, sticky="w"
+        )
+        self.metrics_output = PrefCombobox(
+            metrics_frame,
+            pref_key="config.metrics.output",
+            default_value="jsonl",
+            state="readonly",
+            values=[
+                t("ui.config_tab.metrics_outputs.jsonl"),
+                t("ui.config_tab.metrics_outputs.prometheus"),
+            ],
+            value_mapping={
+                t("ui.config_tab.metrics_outputs.jsonl"): "jsonl",
+                t("ui.config_tab.metrics_outputs.prometheus"): "prometheus",
+            },
+            width=20,
+            on_change=self._apply_metrics_settings,
+        )
+        self.metrics_output.grid(column=2, row=0, padx=5, pady=5, sticky="w")
+
+        ttk.Label(metrics_frame, text=t("ui.config_tab.metrics_interval_label")).grid(
+            column=3, row=0, padx=5, pady=5, sticky="w"
+        )
+        self.metrics_interval = PrefEntry(
+            metrics_frame,
+            pref_key="config.metrics.interval",
+            default_value="5",
+            width=6,
+        )
+        self.metrics_interval.grid(column=4, row=0, padx=5, pady=5, sticky="w")
+
+        ttk.Label(metrics_frame, text=t("ui.config_tab.metrics_port_label")).grid(
+            column=5, row=0, padx=5, pady=5, sticky="w"
+        )
+        self.metrics_port = PrefEntry(
+            metrics_frame,
+            pref_key="config.metrics.port",
+            default_value="9108",
+            width=6,
+        )
+        self.metrics_port.grid(column=6, row=0, padx=5, pady=5, sticky="w")
+
+        # Restarting the exporter on every keystroke would rebind the port
+        for entry in (self.metrics_interval, self.metrics_port):
+            entry.bind("<Return>", lambda e: self._apply_metrics_settings(), add="+")
+            entry.bind("<FocusOut>", lambda e: self._apply_metrics_settings(), add="+")
+
+        self.metrics_status_label = ttk.Label(metrics_frame, text="")
+        self.metrics_status_label.grid(
+            column=0, row=1, columnspan=7, padx=5, pady=(0, 5), sticky="w"
+        )
+
+    def _create_protocol_widgets(self):
+        protocol_frame = ttk.LabelFrame(
+            self.settings_frame, text=t("ui.config_tab.protocol")
+        )
+        protocol_frame.grid(column=0, row=2, sticky="ew", padx=5, pady=5)
+
+        ttk.Label(protocol_frame, text=t("ui.config_tab.protocol_label")).grid(
+            column=0, row=0, padx=5, pady=5, sticky="w"
+        )
+        self.protocol_combobox = PrefCombobox(
+            protocol_frame,
+            pref_key="config.protocol.framing",
+            default_value="text",
+            state="readonly",
+            values=[
+                t("ui.config_tab.protocols.text"),
+                t("ui.config_tab.protocols.cobs"),
+                t("ui.config_tab.protocols.slip"),
+            ],
+            value_mapping={
+                t("ui.config_tab.protocols.text"): "text",
+                t("ui.config_tab.protocols.cobs"): "cobs",
+                t("ui.config_tab.protocols.slip"): "slip",
+            },
+            width=16,
+        )
+        self.protocol_combobox.grid(column=1, row=0, padx=5, pady=5, sticky="w")
+
+        ttk.Label(protocol_frame, text=t("ui.config_tab.record_format_label")).grid(
+            column=2, row=0, padx=5, pady=5, sticky="w"
+        )
+        self.record_format_entry = PrefEntry(
+            protocol_frame,
+            pref_key="config.protocol.record_format",
+            default_value="<f",
+            width=12,
+        )
+        self.record_format_entry.grid(column=3, row=0, padx=5, pady=5, sticky="w")
+
+        ttk.Label(protocol_frame, text=t("ui.config_tab.crc_label")).grid(
+            column=4, row=0, padx=5, pady=5, sticky="w"
+        )
+        self.crc_combobox = PrefCombobox(
+            protocol_frame,
+            pref_key="config.protocol.crc",
+            default_value="none",
+            state="readonly",
+            values=[t("ui.config_tab.crc_none"), "CRC-16/CCITT", "CRC-32"],
+            value_mapping={
+                t("ui.config_tab.crc_none"): "none",
+                "CRC-16/CCITT": "crc16",
+                "CRC-32": "crc32",
+            },
+            width=14,
+        )
+        self.crc_combobox.grid(column=5, row=0, padx=5, pady=5, sticky="w")
+
+        ttk.Label(protocol_frame, text=t("ui.config_tab.record_format_hint")).grid(
+            column=0, row=1, columnspan=6, padx=5, pady=(0, 5), sticky="w"
+        )
+
+        ttk.Label(protocol_frame, text=t("ui.config_tab.line_format_label")).grid(
+            column=0, row=2, padx=5, pady=5, sticky="w"
+        )
+        self.line_format_combobox = PrefCombobox(
+            protocol_frame,
+            pref_key="config.protocol.line_format",
+            default_value="auto",
+            state="readonly",
+            values=[
+                t("ui.config_tab.line_formats.auto"),
+                t("ui.config_tab.line_formats.whitespace"),
+                t("ui.config_tab.line_formats.csv"),
+                t("ui.config_tab.line_formats.keyvalue"),
+                t("ui.config_tab.line_formats.json"),
+            ],
+            value_mapping={
+                t("ui.config_tab.line_formats.auto"): "auto",
+                t("ui.config_tab.line_formats.whitespace"): "whitespace",
+                t("ui.config_tab.line_formats.csv"): "csv",
+                t("ui.config_tab.line_formats.keyvalue"): "keyvalue",
+                t("ui.config_tab.line_formats.json"): "json",
+            },
+            width=16,
+        )
+        self.line_format_combobox.grid(column=1, row=2, padx=5, pady=5, sticky="w")
+
+    def _get_protocol(self):
+        """Return the binary protocol settings, or None for text lines."""
+        framing = self.protocol_combobox.get_value()
+        if framing == "text":
+            return None
+        return {
+            "framing": framing,
+            "record_format": self.record_format_entry.get_value().strip(),
+            "crc": self.crc_combobox.get_value(),
+        }
+
+    def _apply_protocol(self, merged=False):
+        try:
+            protocol = self._get_protocol()
+            self.serial_manager.set_protocol(protocol)
+
+            line_format = (
+                "whitespace" if protocol else self.line_format_combobox.get_value()
+            )
+            if self.device_hub:
+                self.device_hub.protocol = protocol
+                self.device_hub.parser_mode = line_format
+            # Merged multi-device lines are always whitespace separated
+            get_line_parser().set_mode("whitespace" if merged else line_format)
+            return True
+        except Exception as e:
+            self.status_label.config(
+                text=t("ui.config_tab.protocol_error", error=str(e)), foreground="red"
+            )
+            return False
+
+    def _apply_metrics_settings(self):
+        """Restart the metrics exporter to match the current settings."""
+        enabled = self.metrics_enabled.get_value()
+        output = self.metrics_output.get_value()
+        try:
+            interval = float(self.metrics_interval.get_value())
+            port = int(self.metrics_port.get_value())
+        except ValueError as e:
+            self.metrics_status_label.config(
+                text=t("ui.config_tab.metrics_error", error=str(e)), foreground="red"
+            )
+            return
+
+        current = (enabled, output, interval, port)
+        if current == getattr(self, "_metrics_settings", None):
+            return
+        self._metrics_settings = current
+
+        self.metrics_exporter.stop()
+        if not enabled:
+            self.metrics_status_label.config(text="")
+            return
+
+        try:
+            if output == "prometheus":
+                self.metrics_exporter.start_prometheus(port)
+                status = t(
+                    "ui.config_tab.metrics_serving",
+                    url=f"http://127.0.0.1:{port}/metrics",
+                )
+            else:
+                path = os.path.join(CAPTURE_DIR, "metrics.jsonl")
+                self.metrics_exporter.start_jsonl(path, interval)
+                status = t("ui.config_tab.metrics_writing", path=path)
+            self.metrics_status_label.config(text=status, foreground="black")
+        except Exception as e:
+            self._metrics_settings = None
+            self.metrics_status_label.config(
+                text=t("ui.config_tab.metrics_error", error=str(e)), foreground="red"
+            )
+
+    def cleanup(self):
+        self.metrics_exporter.stop()
+        if self.stream_source:
+            self.stream_source.disconnect()
+
     def _on_mode_changed(self, event=None):
         mode = self.mode_combobox.get_value()
         if mode == "synthetic":
             self.port_combobox.config(state="disabled")
             self.baudrate_combobox.config(state="disabled")
             self.refresh_button.config(state="disabled")
+            self._set_device_widgets_state("disabled")
+            self.source_url_entry.config(state="disabled")
+            self._set_replay_widgets_state("disabled")
             self.port_combobox.set("")
             self.baudrate_combobox.set("")
 
@@ -231,9 +606,6 @@ class ConfigTab:
                 text=t("ui.config_tab.start_synthetic"), state="normal"
             )
         else:
-            self.port_combobox.config(state="readonly")
-            self.baudrate_combobox.config(state="readonly")
-            self.refresh_button.config(state="normal")
             self.win_simul_info.grid_remove()
 
             self.synthetic_frame.grid_remove()
@@ -243,6 +615,20 @@ class ConfigTab:
             self.connect_button.config(text=t("ui.config_tab.connect"), state="normal")
             self.connect_button.config(state="normal")
 
+            hardware_state = "normal" if mode == "hardware" else "disabled"
+            self.port_combobox.config(
+                state="readonly" if mode == "hardware" else "disabled"
+            )
+            self.baudrate_combobox.config(
+                state="readonly" if mode == "hardware" else "disabled"
+            )
+            self.refresh_button.config(state=hardware_state)
+            self._set_device_widgets_state(hardware_state)
+            self.source_url_entry.config(
+                state="normal" if mode == "stream" else "disabled"
+            )
+            self._set_replay_widgets_state("normal" if mode == "replay" else "disabled")
+
             if not self.baudrate_combobox.get():
                 if hasattr(self.baudrate_combobox, "config"):
                     self.baudrate_combobox.set(DEFAULT_BAUDRATES[0])
@@ -265,12 +651,23 @@ class ConfigTab:
     def _connect(self):
         mode = self.mode_combobox.get_value()
 
-        if self.serial_manager.is_connected or self.synthetic_generator:
+        if (
+            self.serial_manager.is_connected
+            or self.synthetic_generator
+            or self.stream_source
+            or (self.device_hub and self.device_hub.is_connected)
+        ):
 
             if self.signal_handler:
                 self.signal_handler.set_busy(False)
 
             self.serial_manager.disconnect()
+            if self.device_hub:
+                self.device_hub.disconnect()
+            if self.stream_source:
+                self.stream_source.disconnect()
+                self.stream_source = None
+            self.replay_controls.pack_forget()
             if self.synthetic_generator:
                 self.synthetic_generator.stop_data_generation()
                 self.synthetic_generator = None
@@ -283,6 +680,16 @@ class ConfigTab:
             return
 
         if mode == "hardware":
+            devices = self._get_devices()
+            merged = len(devices) > 1 and self.device_hub is not None
+            if not self._apply_protocol(merged):
+                return
+
+            if merged:
+                self._connect_devices(devices)
+                return
+
+            # A single listed device does not replace the selected port
             port = self.port_combobox.get()
             baudrate = self.baudrate_combobox.get()
 
@@ -307,6 +714,7 @@ class ConfigTab:
             try:
                 equations = self._get_equations_from_ui()
                 fps = int(self.fps_pref_combobox.get())
+                get_line_parser().set_mode("whitespace")
                 self.synthetic_generator = SyntheticDataGenerator(
                     data_callback=self.serial_manager.data_callback,
                     equations=equations,
@@ -327,9 +735,200 @@ class ConfigTab:
             except Exception as e:
                 print(t("ui.config_tab.mode_synthetic_start_error").format(error=e))
 
+        elif mode == "stream":
+            self._connect_stream()
+
+        elif mode == "replay":
+            self._connect_replay()
+
         else:
             print(t("ui.config_tab.mode_unknown_error").format(mode=mode))
 
+    def _connect_stream(self):
+        """Connect a TCP, UDP, pipe, file or serial source given by URL."""
+        if not self._apply_protocol():
+            return
+
+        url = self.source_url_entry.get_value().strip()
+        try:
+            source = open_transport(
+                url,
+                data_callback=self.serial_manager.data_callback,
+                error_callback=self.serial_manager.error_callback,
+                protocol=self._get_protocol(),
+            )
+        except ValueError as e:
+            self.status_label.config(text=f"🔴 {e}", foreground="red")
+            return
+
+        if not source.connect():
+            return
+        self.stream_source = source
+
+        if self.signal_handler:
+            self.signal_handler.set_busy(True)
+
+        self.connect_button.config(text=t("ui.config_tab.disconnect"))
+        status_text = t("ui.config_tab.connected_stream_status", url=url)
+        self.status_label.config(text=status_text, foreground="black")
+        self._show_connection_info("stream", url, "N/A")
+
+    def _connect_replay(self):
+        """Stream a capture file through the pipeline at the chosen speed."""
+        if not self._apply_protocol():
+            return
+
+        path = self.replay_file_entry.get_value().strip()
+        if not path:
+            return
+        try:
+            rate = float(self.replay_rate_entry.get_value())
+            if rate <= 0:
+                raise ValueError(rate)
+        except ValueError:
+            rate = 100.0
+
+        source = CaptureReplay(
+            path,
+            data_callback=self.serial_manager.data_callback,
+            error_callback=self.serial_manager.error_callback,
+            protocol=self._get_protocol(),
+            speed=self._get_replay_speed(),
+            rate=rate,
+        )
+        if not source.connect(timeout=60.0):
+            return
+        self.stream_source = source
+
+        if self.signal_handler:
+            self.signal_handler.set_busy(True)
+
+        self.connect_button.config(text=t("ui.config_tab.disconnect"))
+        status_text = t(
+            "ui.config_tab.connected_replay_status",
+            file=os.path.basename(path),
+            lines=source.count,
+        )
+        self.status_label.config(text=status_text, foreground="black")
+        self._show_connection_info("replay", path, "N/A")
+
+        self.replay_scale.config(to=max(source.duration, 0.001))
+        self.replay_pause_button.config(text=t("ui.config_tab.replay_pause"))
+        self.replay_controls.pack(fill="x", padx=10, pady=(0, 5))
+        self._update_replay_controls()
+
+    def _get_replay_speed(self):
+        speed = self.replay_speed_combobox.get_value()
+        return None if speed == "max" else float(speed)
+
+    def _on_replay_speed_changed(self):
+        if isinstance(self.stream_source, CaptureReplay):
+            self.stream_source.set_speed(self._get_replay_speed())
+
+    def _browse_replay_file(self):
+        path = filedialog.askopenfilename(
+            initialdir=CAPTURE_DIR if os.path.isdir(CAPTURE_DIR) else None,
+            filetypes=[
+                (t("dialogs.text_files"), "*.txt"),
+                (t("dialogs.all_files"), "*.*"),
+            ],
+            title=t("ui.config_tab.replay_file_label"),
+        )
+        if path:
+            self.replay_file_entry.set_value(path)
+
+    def _toggle_replay_pause(self):
+        replay = self.stream_source
+        if not isinstance(replay, CaptureReplay):
+            return
+        if replay.paused:
+            if replay.finished:
+                replay.seek(0.0)
+            replay.resume()
+            self.replay_pause_button.config(text=t("ui.config_tab.replay_pause"))
+        else:
+            replay.pause()
+            self.replay_pause_button.config(text=t("ui.config_tab.replay_resume"))
+
+    def _on_replay_scale_press(self, event=None):
+        self._replay_dragging = True
+
+    def _on_replay_scale_release(self, event=None):
+        self._replay_dragging = False
+        if isinstance(self.stream_source, CaptureReplay):
+            self.stream_source.seek(self.replay_position.get())
+
+    def _update_replay_controls(self):
+        replay = self.stream_source
+        if not isinstance(replay, CaptureReplay):
+            return
+
+        if not self._replay_dragging:
+            self.replay_position.set(replay.elapsed)
+        if replay.paused:
+            self.replay_pause_button.config(text=t("ui.config_tab.replay_resume"))
+        self.replay_time_label.config(
+            text=f"{self._format_replay_time(replay.elapsed)} / "
+            f"{self._format_replay_time(replay.duration)}"
+        )
+        self.frame.after(200, self._update_replay_controls)
+
+    @staticmethod
+    def _format_replay_time(seconds):
+        minutes, seconds = divmod(seconds, 60)
+        return f"{int(minutes):02d}:{seconds:04.1f}"
+
+    def _set_replay_widgets_state(self, state):
+        self.replay_file_entry.config(state=state)
+        self.replay_browse_button.config(state=state)
+        self.replay_rate_entry.config(state=state)
+
+    def _connect_devices(self, devices):
+        """Connect several ports at once, merged into one timeline."""
+        if not self.device_hub.connect(devices):
+            return
+
+        if self.signal_handler:
+            self.signal_handler.set_busy(True)
+
+        self.connect_button.config(text=t("ui.config_tab.disconnect"))
+        ports = ", ".join(port for port, _ in devices)
+        status_text = t(
+            "ui.config_tab.connected_devices_status", count=len(devices), ports=ports
+        )
+        self.status_label.config(text=status_text, foreground="black")
+        self._show_connection_info("hardware", ports, "N/A")
+
+    def _get_devices(self):
+        """Return the device list as [(port, baudrate)]."""
+        devices = []
+        for entry in self.devices_listbox.get(0, tk.END):
+            port, _, baudrate = entry.rpartition("@")
+            devices.append((port, baudrate))
+        return devices
+
+    def _add_device(self):
+        port = self.port_combobox.get()
+        baudrate = self.baudrate_combobox.get()
+        if not port or not baudrate:
+            return
+
+        if any(existing == port for existing, _ in self._get_devices()):
+            return
+
+        self.devices_listbox.insert(tk.END, f"{port}@{baudrate}")
+        self._save_preferences()
+
+    def _remove_device(self):
+        for index in reversed(self.devices_listbox.curselection()):
+            self.devices_listbox.delete(index)
+        self._save_preferences()
+
+    def _set_device_widgets_state(self, state):
+        self.devices_listbox.config(state=state)
+        self.add_device_button.config(state=state)
+        self.remove_device_button.config(state=state)
+
     def _set_connection_widgets_state(self, state):
         """Enable or disable connection-related widgets"""
         try:
@@ -348,6 +947,15 @@ class ConfigTab:
             if hasattr(self, "refresh_button"):
                 self.refresh_button.config(state=state)
 
+            if hasattr(self, "devices_listbox"):
+                self._set_device_widgets_state(state)
+
+            if hasattr(self, "source_url_entry"):
+                self.source_url_entry.config(state=state)
+
+            if hasattr(self, "replay_file_entry"):
+                self._set_replay_widgets_state(state)
+
         except Exception as e:
             print(f"Error setting widget state: {e}")
 
@@ -375,6 +983,9 @@ class ConfigTab:
         else:
             self._preferred_port = None
 
+        for entry in self.config_manager.load_tab_setting("config", "devices", []):
+            self.devices_listbox.insert(tk.END, entry)
+
         equations = self.config_manager.load_setting("equations", {})
         if equations:
             self._load_equations_to_ui(equations)
@@ -389,6 +1000,9 @@ class ConfigTab:
         self.config_manager.save_tab_setting(
             "config", "baudrate", self.baudrate_combobox.get()
         )
+        self.config_manager.save_tab_setting(
+            "config", "devices", list(self.devices_listbox.get(0, tk.END))
+        )
 
         equations = self._get_equations_from_ui()
         self.config_manager.save_setting("equations", equations)
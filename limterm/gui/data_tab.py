@@ -1,30 +1,101 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from ..utils import FileManager
+from ..config import CAPTURE_DIR
+from ..core import (
+    ExportJob,
+    LineBuffer,
+    LineIndex,
+    LineSearch,
+    ParseCache,
+    RollingStatistics,
+    SamplePyramid,
+    SegmentStore,
+    get_latency_tracker,
+    get_metrics,
+    row_to_floats,
+)
+from ..utils import DataParser, FileManager, get_line_parser
 from ..i18n import t, get_config_manager
+from .export_window import ExportWindow, ask_export_path
+from .line_view import VirtualLineView
 from .preference_widgets import PrefCheckbutton, PrefCombobox, PrefEntry
 import logging
 import os
+import re
 import datetime
 import time
+from bisect import bisect_left
 from collections import deque
 
 logger = logging.getLogger(__name__)
 
+PREVIEW_REFRESH_MS = 100
+MESSAGE_LIMIT = 1000
+BUDGET_CHECK_MS = 5000
+BUFFER_SETTING_DELAY_MS = 1000
+MIN_BUFFER_LINES = 1000
+# Bytes per buffered line besides its text: string header, ring slot and
+# arrival time, plus per column the parse cache and statistics window rows
+LINE_OVERHEAD = 89
+COLUMN_BYTES = 24
+DEFAULT_LINE_LENGTH = 32
+DEFAULT_COLUMNS = 4
+EXPORT_CHUNK = 50000
+JUMP_LIST_LIMIT = 1000
+JUMP_LIST_BATCH = 200
+CAPTURE_TIMESTAMP = re.compile(r"^\d+:\d{2}:\d{2}(?:\.\d+)? ")
+
 
 class DataTab:
     def __init__(self, parent):
         self.frame = ttk.Frame(parent)
         self.config_manager = get_config_manager()
 
-        self.data_buffer = deque(maxlen=10000)
+        # Resized to the memory budget once the settings are loaded
+        self.data_buffer = LineBuffer(10000)
+        self.arrival_times = deque(maxlen=10000)
+        self.parsed = ParseCache(self.data_buffer.maxlen, self.data_buffer.since)
+        self.history = SamplePyramid()
+        self.statistics = RollingStatistics(self.data_buffer.maxlen)
         self.capture_file = None
         self.capture_filename = None
-        self.preview_offset = 0
+        # Lines pushed out of the buffer, kept on disk for the whole session
+        self.spill_store = None
+        self.budget_timer_id = None
+        self._buffer_settings_id = None
+        # Lines captured this session stay browsable after leaving the buffer
+        self.capture_index = None
+        self.capture_base = 0
+        self.preview_start = 0
         self.preview_paused = False
+        self.preview_timer_id = None
+        # (lines received, text) per message, shown after that line
+        self.messages = deque(maxlen=MESSAGE_LIMIT)
+        self._message_count = 0
+        self._messages_shown = 0
+        self.is_tab_active = False
         self.timestamp_start = None
+        self.search = LineSearch(self._search_lines, self._preview_range)
+        self._search_result = None
+        self._jump_count = 0
 
         self._create_widgets()
+        self._register_metrics()
+        self._apply_buffer_settings()
+        self._budget_tick()
+
+    def _register_metrics(self):
+        metrics = get_metrics()
+        metrics.register_gauge("buffer_lines", lambda: len(self.data_buffer))
+        metrics.register_gauge("buffer_capacity", lambda: self.data_buffer.maxlen)
+        metrics.register_gauge(
+            "buffer_spilled_lines",
+            lambda: len(self.spill_store) if self.spill_store else 0,
+        )
+        metrics.register_gauge(
+            "buffer_spill_bytes",
+            lambda: self.spill_store.bytes if self.spill_store else 0,
+        )
 
     def _create_widgets(self):
 
@@ -63,6 +134,13 @@ class DataTab:
         )
         self.reset_timestamp_button.pack(side="left", padx=(0, 10))
 
+        ttk.Label(button_container, text=t("ui.data_tab.goto_line")).pack(
+            side="left", padx=(0, 5)
+        )
+        self.goto_entry = ttk.Entry(button_container, width=10)
+        self.goto_entry.pack(side="left", padx=(0, 10))
+        self.goto_entry.bind("<Return>", self._goto_line)
+
         self.toggle_settings_button = ttk.Button(
             toolbar_frame,
             text=t("ui.data_tab.show_settings"),
@@ -70,6 +148,28 @@ class DataTab:
         )
         self.toggle_settings_button.pack(side="right")
 
+        search_frame = ttk.Frame(self.frame)
+        search_frame.pack(fill="x", padx=10, pady=(5, 0))
+
+        ttk.Label(search_frame, text=t("ui.data_tab.search_label")).pack(
+            side="left", padx=(0, 5)
+        )
+        self.search_entry = ttk.Entry(search_frame, width=30)
+        self.search_entry.pack(side="left", padx=(0, 10))
+        self.search_entry.bind("<Return>", self._start_search)
+        self.search_entry.bind("<Escape>", self._clear_search)
+
+        self.search_filter = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            search_frame,
+            text=t("ui.data_tab.search_filter"),
+            variable=self.search_filter,
+            command=self._on_search_filter_change,
+        ).pack(side="left", padx=(0, 10))
+
+        self.search_status = ttk.Label(search_frame, text=t("ui.data_tab.search_hint"))
+        self.search_status.pack(side="left")
+
         self.data_settings_frame = ttk.LabelFrame(
             self.frame, text=t("ui.data_tab.data_settings")
         )
@@ -147,6 +247,49 @@ class DataTab:
         )
         self.file_mode.grid(column=1, row=3, padx=5, pady=2, sticky="w")
 
+        buffer_frame = ttk.LabelFrame(settings_container, text=t("ui.data_tab.buffer"))
+        buffer_frame.pack(side="left", fill="both", expand=True, padx=5)
+
+        ttk.Label(buffer_frame, text=t("ui.data_tab.memory_budget_label")).grid(
+            column=0, row=0, padx=5, pady=2, sticky="w"
+        )
+        self.memory_budget = PrefEntry(
+            buffer_frame,
+            pref_key="data_buffer.memory_mb",
+            default_value="32",
+            width=8,
+            on_change=self._on_buffer_setting_change,
+        )
+        self.memory_budget.grid(column=1, row=0, padx=5, pady=2, sticky="w")
+
+        self.spill_enabled = PrefCheckbutton(
+            buffer_frame,
+            pref_key="data_buffer.spill_enabled",
+            default_value=True,
+            text=t("ui.data_tab.spill_enabled"),
+            on_change=self._on_buffer_setting_change,
+        )
+        self.spill_enabled.grid(
+            column=0, row=1, columnspan=2, padx=5, pady=2, sticky="w"
+        )
+
+        ttk.Label(buffer_frame, text=t("ui.data_tab.disk_limit_label")).grid(
+            column=0, row=2, padx=5, pady=2, sticky="w"
+        )
+        self.disk_limit = PrefEntry(
+            buffer_frame,
+            pref_key="data_buffer.disk_limit_mb",
+            default_value="1024",
+            width=8,
+            on_change=self._on_buffer_setting_change,
+        )
+        self.disk_limit.grid(column=1, row=2, padx=5, pady=2, sticky="w")
+
+        self.buffer_status = ttk.Label(buffer_frame, text="")
+        self.buffer_status.grid(
+            column=0, row=3, columnspan=2, padx=5, pady=2, sticky="w"
+        )
+
         preview_frame = ttk.LabelFrame(
             settings_container, text=t("ui.data_tab.preview")
         )
@@ -163,20 +306,6 @@ class DataTab:
             column=0, row=0, columnspan=2, padx=5, pady=2, sticky="w"
         )
 
-        ttk.Label(preview_frame, text=t("ui.data_tab.preview_limit_label")).grid(
-            column=0, row=1, padx=5, pady=2, sticky="w"
-        )
-        self.preview_limit = PrefCombobox(
-            preview_frame,
-            pref_key="data_preview.limit",
-            default_value="50",
-            state="readonly",
-            values=["10", "25", "50", "100", "200", "500"],
-            width=12,
-            on_change=self._on_preview_limit_change,
-        )
-        self.preview_limit.grid(column=1, row=1, padx=5, pady=2, sticky="w")
-
         self.timestamp_enabled = PrefCheckbutton(
             preview_frame,
             pref_key="data_preview.timestamp_enabled",
@@ -185,17 +314,26 @@ class DataTab:
             on_change=self._on_timestamp_enabled_change,
         )
         self.timestamp_enabled.grid(
-            column=0, row=2, columnspan=2, padx=5, pady=2, sticky="w"
+            column=0, row=1, columnspan=2, padx=5, pady=2, sticky="w"
         )
 
         self.text_frame = ttk.Frame(self.frame)
         self.text_frame.pack(expand=1, fill="both", padx=10, pady=5)
 
-        self.text_widget = tk.Text(self.text_frame, wrap="word", height=15)
-        self.scrollbar = tk.Scrollbar(
-            self.text_frame, orient="vertical", command=self.text_widget.yview
+        # Matches of the current search; selecting one shows it in the preview
+        self.jump_frame = ttk.Frame(self.text_frame)
+        self.jump_list = tk.Listbox(self.jump_frame, width=40, activestyle="none")
+        jump_scrollbar = ttk.Scrollbar(
+            self.jump_frame, orient="vertical", command=self.jump_list.yview
+        )
+        self.jump_list.config(yscrollcommand=jump_scrollbar.set)
+        self.jump_list.pack(side="left", expand=1, fill="both")
+        jump_scrollbar.pack(side="right", fill="y")
+        self.jump_list.bind("<<ListboxSelect>>", self._on_jump_select)
+
+        self.preview = VirtualLineView(
+            self.text_frame, self._view_range, self._preview_rows
         )
-        self.text_widget.config(yscrollcommand=self.scrollbar.set)
 
         self._update_widget_states()
         self._setup_initial_capture_state()
@@ -212,12 +350,10 @@ class DataTab:
 
         preview_enabled = self.preview_enabled.get_value()
         if preview_enabled:
-            self.preview_limit.config(state="readonly")
             self.timestamp_enabled.config(state="normal")
             self.pause_button.config(state="normal")
             self.reset_timestamp_button.config(state="normal")
         else:
-            self.preview_limit.config(state="disabled")
             self.timestamp_enabled.config(state="disabled")
             self.pause_button.config(state="disabled")
             self.reset_timestamp_button.config(state="disabled")
@@ -229,11 +365,9 @@ class DataTab:
 
     def _update_preview_visibility(self):
         if self.preview_enabled.get_value():
-            self.text_widget.pack(side="left", expand=1, fill="both")
-            self.scrollbar.pack(side="right", fill="y")
+            self.preview.pack(expand=1, fill="both")
         else:
-            self.text_widget.pack_forget()
-            self.scrollbar.pack_forget()
+            self.preview.pack_forget()
 
     def _setup_initial_capture_state(self):
         if self.capture_enabled.get_value():
@@ -271,15 +405,11 @@ class DataTab:
         self._update_widget_states()
         self._update_preview_visibility()
         if self.preview_enabled.get_value():
-            self._refresh_preview()
-
-    def _on_preview_limit_change(self):
-        if self.preview_enabled.get_value():
-            self._refresh_preview()
+            self._update_preview(force=True)
 
     def _setup_capture_file(self):
         try:
-            capture_dir = "lim_captures"
+            capture_dir = CAPTURE_DIR
             if not os.path.exists(capture_dir):
                 os.makedirs(capture_dir)
 
@@ -298,6 +428,7 @@ class DataTab:
             mode = "a" if file_mode == "append" else "w"
 
             self.capture_file = open(self.capture_filename, mode, encoding="utf-8")
+            self._open_capture_index()
 
             self._add_message(
                 t("ui.data_tab.capture_enabled_msg").format(
@@ -325,45 +456,104 @@ class DataTab:
             finally:
                 self.capture_file = None
                 self.capture_filename = None
+                self._close_capture_index()
+
+    def _on_buffer_setting_change(self):
+        # Entries report every keystroke; apply once typing pauses
+        if self._buffer_settings_id:
+            self.frame.after_cancel(self._buffer_settings_id)
+        self._buffer_settings_id = self.frame.after(
+            BUFFER_SETTING_DELAY_MS, self._apply_buffer_settings
+        )
 
-    def _refresh_preview(self):
-        """Refresh the entire preview with timestamps if enabled."""
-        if not self.preview_enabled.get_value():
+    @staticmethod
+    def _megabytes(entry):
+        """Bytes for a size in MB typed in `entry`, or None when not a positive number."""
+        try:
+            value = float(entry.get_value())
+        except ValueError:
+            return None
+        return int(value * 1024 * 1024) if value > 0 else None
+
+    def _apply_buffer_settings(self):
+        self._buffer_settings_id = None
+        if self.spill_enabled.get_value():
+            disk_limit = self._megabytes(self.disk_limit)
+            if self.spill_store is None:
+                try:
+                    self.spill_store = SegmentStore(disk_limit=disk_limit)
+                    self.data_buffer.set_spill(self.spill_store.extend)
+                except OSError as e:
+                    self.spill_enabled.set_value(False)
+                    self._add_message(t("ui.data_tab.spill_error").format(error=e))
+                    logger.error(f"Error creating spill store: {e}")
+            else:
+                self.spill_store.disk_limit = disk_limit
+        else:
+            self._close_spill_store()
+        self._fit_buffer(force=True)
+
+    def _close_spill_store(self):
+        if self.spill_store is not None:
+            self.data_buffer.set_spill(None)
+            self.spill_store.close()
+            self.spill_store = None
+
+    def _buffer_capacity(self):
+        """Lines that fit the memory budget at the current line size and width."""
+        budget = self._megabytes(self.memory_budget)
+        if budget is None:
+            return self.data_buffer.maxlen
+        sample = self.data_buffer.tail(1000)
+        length = sum(map(len, sample)) / len(sample) if sample else DEFAULT_LINE_LENGTH
+        width = self.statistics.width or DEFAULT_COLUMNS
+        line_bytes = LINE_OVERHEAD + length + COLUMN_BYTES * width
+        return max(MIN_BUFFER_LINES, int(budget / line_bytes))
+
+    def _fit_buffer(self, force=False):
+        """Resize the buffer to the budget when it is off by more than a quarter."""
+        capacity = self._buffer_capacity()
+        maxlen = self.data_buffer.maxlen
+        if capacity == maxlen or (not force and abs(capacity - maxlen) < maxlen / 4):
             return
-
+        self.data_buffer.resize(capacity)
+        self.parsed.resize(capacity)
+        # arrival_times follows on the next append (see _arrival_log)
+        logger.info(f"Data buffer resized to {capacity} lines")
+
+    def _budget_tick(self):
+        self._fit_buffer()
+        spilled = len(self.spill_store) if self.spill_store else 0
+        self.buffer_status.config(
+            text=t("ui.data_tab.buffer_status").format(
+                lines=len(self.data_buffer), spilled=spilled
+            )
+        )
         try:
-            limit = int(self.preview_limit.get_value())
-            self.text_widget.delete("1.0", "end")
-
-            buffer_list = list(self.data_buffer)
-            start_idx = max(0, len(buffer_list) - limit + self.preview_offset)
-            end_idx = min(len(buffer_list), start_idx + limit)
-
-            for line in buffer_list[start_idx:end_idx]:
-                if (
-                    self.timestamp_enabled.get_value()
-                    and self.timestamp_start is not None
-                ):
-                    elapsed = time.time() - self.timestamp_start
-                    hours = int(elapsed // 3600)
-                    minutes = int((elapsed % 3600) // 60)
-                    seconds = elapsed % 60
-                    timestamp = f"{hours:02d}:{minutes:02d}:{seconds:06.3f} "
-                    self.text_widget.insert("end", timestamp + line + "\n")
-                else:
-                    self.text_widget.insert("end", line + "\n")
-
-            self.text_widget.see("end")
+            self.budget_timer_id = self.frame.after(BUDGET_CHECK_MS, self._budget_tick)
         except tk.TclError:
-            pass
+            self.budget_timer_id = None
+
+    def _open_capture_index(self):
+        """Index the lines this capture file receives from now on."""
+        self._close_capture_index()
+        try:
+            capture_index = LineIndex(self.capture_filename, self.capture_file.tell())
+            # The search thread reads the base whenever the index is set
+            self.capture_base = self.lines_total
+            self.capture_index = capture_index
+        except OSError as e:
+            logger.error(f"Error indexing capture file: {e}")
+
+    def _close_capture_index(self):
+        if self.capture_index is not None:
+            self.capture_index.close()
+            self.capture_index = None
 
     def _add_message(self, message):
-        if self.preview_enabled.get_value() and hasattr(self, "text_widget"):
-            try:
-                self.text_widget.insert("end", f"[MSG] {message}\n")
-                self.text_widget.see("end")
-            except tk.TclError:
-                pass
+        # Shown by the preview's next refresh, after the newest line
+        self.messages.append((self.lines_total, f"[MSG] {message}"))
+        self._message_count += 1
 
     def _load_data(self):
         if self.data_buffer:
@@ -389,8 +579,16 @@ class DataTab:
                 with open(file_path, "r", encoding="utf-8") as f:
                     lines = f.read().splitlines()
                 self._clear_data()
-                for line in lines:
-                    self.data_buffer.append(line)
+                loaded_at = time.perf_counter()
+                parser = get_line_parser()
+                parser.reset()
+                for line in lines[: parser.sample_size]:
+                    parser.observe(line)
+                self.data_buffer.extend(lines)
+                self._arrival_log().extend([loaded_at] * len(lines))
+                rows = [row_to_floats(DataParser.parse_line(line)) for line in lines]
+                self.history.extend(rows)
+                self.statistics.extend(rows)
 
                 self._update_preview()
                 self._add_message(t("ui.data_tab.data_loaded").format(path=file_path))
@@ -403,7 +601,7 @@ class DataTab:
             self._reset_timestamp()
 
         if self.preview_enabled.get_value():
-            self._refresh_preview()
+            self._update_preview(force=True)
 
     def _toggle_preview_pause(self):
         self.preview_paused = not self.preview_paused
@@ -416,49 +614,129 @@ class DataTab:
 
     def _clear_data(self):
         """Clear only the preview, not the data buffer."""
-        if hasattr(self, "text_widget"):
-            self.text_widget.delete(1.0, "end")
+        self.preview_start = self.lines_total
+        self.messages.clear()
+        if hasattr(self, "preview"):
+            self.preview.follow()
+
+    def _goto_line(self, event=None):
+        value = self.goto_entry.get().strip()
+        if not value:
+            self.preview.follow()
+        elif value.isdigit():
+            line = int(value) - 1
+            if self._filtering():
+                # The first match at or after the line
+                line = bisect_left(self._search_result.matches, line)
+            self.preview.goto(line)
+
+    def _start_search(self, event=None):
+        text = self.search_entry.get().strip()
+        if not text:
+            self._clear_search()
+            return
+        try:
+            self._search_result = self.search.start(text)
+        except ValueError as e:
+            self._clear_search()
+            self.search_status.config(
+                text=t("ui.data_tab.search_error").format(error=e)
+            )
+            return
+        self._jump_count = 0
+        self.jump_list.delete(0, "end")
+        if not self.jump_frame.winfo_manager():
+            # Packed ahead of the preview so the preview does not take its space
+            before = {"before": self.preview} if self.preview.winfo_manager() else {}
+            self.jump_frame.pack(side="right", fill="y", padx=(5, 0), **before)
+        self._poll_search()
+        self.preview.follow()
+
+    def _clear_search(self, event=None):
+        self.search.stop()
+        self._search_result = None
+        self._jump_count = 0
+        self.jump_list.delete(0, "end")
+        self.jump_frame.pack_forget()
+        self.search_status.config(text=t("ui.data_tab.search_hint"))
+        self.preview.follow()
+
+    def _on_search_filter_change(self):
+        self.preview.follow()
+
+    def _filtering(self):
+        return self._search_result is not None and self.search_filter.get()
+
+    def _poll_search(self):
+        """Show the matches found since the last poll and the search progress."""
+        result = self._search_result
+        if result is None:
+            return
+        if self.search.error:
+            self.search_status.config(
+                text=t("ui.data_tab.search_error").format(error=self.search.error)
+            )
+            return
+
+        count = len(result.matches)
+        if self.search.searching:
+            first, end = self._preview_range()
+            start = max(result.start, first)
+            percent = 100 * (result.end - start) // max(1, end - start)
+            status = t("ui.data_tab.search_progress").format(
+                count=count, percent=max(0, percent)
+            )
+        elif result.truncated:
+            status = t("ui.data_tab.search_limit").format(count=count)
+        else:
+            status = t("ui.data_tab.search_matches").format(count=count)
+        self.search_status.config(text=status)
+
+        # The jump list lists the first matches, a batch per poll
+        end = min(count, JUMP_LIST_LIMIT, self._jump_count + JUMP_LIST_BATCH)
+        for line in result.matches[self._jump_count : end]:
+            text = self._search_lines(line, line + 1)[0] or ""
+            self.jump_list.insert("end", f"{line + 1}: {text[:80]}")
+        self._jump_count = max(self._jump_count, end)
+
+    def _on_jump_select(self, event=None):
+        selection = self.jump_list.curselection()
+        if not selection or self._search_result is None:
+            return
+        index = selection[0]
+        if self._filtering():
+            self.preview.goto(index)
+        else:
+            self.preview.goto(self._search_result.matches[index])
 
     def _save_data(self):
-        buffer_lines = list(self.data_buffer)
-        if buffer_lines:
-            capture_dir = "lim_captures"
-            if not os.path.exists(capture_dir):
-                os.makedirs(capture_dir)
+        """Export every line the preview can reach: buffer, spill store and capture."""
+        self.export_lines(*self._preview_range())
 
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_filename = f"manual_save_{timestamp}.txt"
+    def export_lines(self, start, end):
+        """Ask for a file and export lines [start, end) in the background."""
+        start = max(start, self._preview_range()[0])
+        if end <= start:
+            return
+        capture_dir = CAPTURE_DIR
+        if not os.path.exists(capture_dir):
+            os.makedirs(capture_dir)
 
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".txt",
-                filetypes=[(t("dialogs.text_files"), "*.txt")],
-                initialdir=capture_dir,
-                initialfile=default_filename,
-            )
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        file_path = ask_export_path(capture_dir, f"manual_save_{timestamp}.txt")
+        if not file_path:
+            return
+        # One timestamp for the export, as when it was added line by line
+        prefix = self._format_line("")
+        job = ExportJob(
+            file_path, self._export_chunks(start, end), end - start, prefix=prefix
+        )
+        ExportWindow(self.frame, job, self.add_message)
 
-            if file_path:
-                try:
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        for line in buffer_lines:
-                            if (
-                                self.timestamp_enabled.get_value()
-                                and self.timestamp_start is not None
-                            ):
-                                elapsed = time.time() - self.timestamp_start
-                                hours = int(elapsed // 3600)
-                                minutes = int((elapsed % 3600) // 60)
-                                seconds = elapsed % 60
-                                timestamp_str = (
-                                    f"{hours:02d}:{minutes:02d}:{seconds:06.3f} "
-                                )
-                                f.write(timestamp_str + line + "\n")
-                            else:
-                                f.write(line + "\n")
-                    self._add_message(
-                        t("ui.data_tab.data_saved").format(path=file_path)
-                    )
-                except Exception as e:
-                    self._add_message(t("ui.data_tab.error_saving").format(error=e))
+    def _export_chunks(self, start, end):
+        # Pulled by the export thread, one chunk of lines at a time
+        for position in range(start, end, EXPORT_CHUNK):
+            yield self._search_lines(position, min(end, position + EXPORT_CHUNK))
 
     def _save_buffer_to_file(self, file_manager):
         """Save the current data buffer to file."""
@@ -491,8 +769,32 @@ class DataTab:
             print(f"Error saving data buffer: {e}")
             return False
 
-    def add_data(self, line):
+    def _arrival_log(self):
+        """arrival_times, first resized to the buffer if _fit_buffer changed it.
+
+        Only the thread appending lines rebinds it, so no arrival is lost to
+        an append into the deque being replaced.
+        """
+        arrival_times = self.arrival_times
+        if arrival_times.maxlen != self.data_buffer.maxlen:
+            arrival_times = deque(arrival_times, maxlen=self.data_buffer.maxlen)
+            self.arrival_times = arrival_times
+        return arrival_times
+
+    def add_data(self, line, arrival_time=None):
+        append_start = time.perf_counter()
+        metrics = get_metrics()
+        if len(self.data_buffer) == self.data_buffer.maxlen:
+            metrics.inc("buffer_evicted_lines_total")
+        metrics.inc("buffer_lines_total")
+        get_line_parser().observe(line)
         self.data_buffer.append(line)
+        row = row_to_floats(DataParser.parse_line(line))
+        self.history.append(row)
+        self.statistics.append(row)
+        self._arrival_log().append(
+            append_start if arrival_time is None else arrival_time
+        )
 
         if self.timestamp_enabled.get_value() and self.timestamp_start is None:
             self.timestamp_start = time.time()
@@ -509,70 +811,207 @@ class DataTab:
                     minutes = int((elapsed % 3600) // 60)
                     seconds = elapsed % 60
                     timestamp = f"{hours:02d}:{minutes:02d}:{seconds:06.3f} "
-                    self.capture_file.write(timestamp + line + "\n")
+                    record = timestamp + line + "\n"
                 else:
-                    self.capture_file.write(line + "\n")
+                    record = line + "\n"
+                self.capture_file.write(record)
                 self.capture_file.flush()
+                metrics.inc("capture_bytes_total", len(record.encode("utf-8")))
             except Exception as e:
                 logger.error(f"Error writing to capture file: {e}")
                 self._add_message(t("ui.data_tab.capture_error").format(error=str(e)))
 
-        preview_enabled = self.preview_enabled.get_value()
-        has_widget = hasattr(self, "text_widget")
-
-        if preview_enabled and not self.preview_paused and has_widget:
-            try:
-                self._update_preview()
-            except Exception as e:
-                logger.error(f"Error in auto preview update: {e}")
+        tracker = get_latency_tracker()
+        if tracker.enabled:
+            tracker.record("append", time.perf_counter() - append_start)
+
+    def _format_line(self, line):
+        if self.timestamp_enabled.get_value() and self.timestamp_start is not None:
+            elapsed = time.time() - self.timestamp_start
+            hours = int(elapsed // 3600)
+            minutes = int((elapsed % 3600) // 60)
+            seconds = elapsed % 60
+            return f"{hours:02d}:{minutes:02d}:{seconds:06.3f} " + line
+        return line
+
+    def _preview_range(self):
+        """(first, end) line numbers the preview can show."""
+        first = self.data_buffer.first
+        spill_store = self.spill_store
+        store_first = spill_store.first if spill_store is not None else None
+        if store_first is not None:
+            first = min(first, store_first)
+        if self.capture_index is not None:
+            first = min(first, self.capture_base)
+        return max(first, self.preview_start), self.lines_total
+
+    def _view_range(self):
+        if self._filtering():
+            return self._filter_range()
+        return self._preview_range()
+
+    def _older_lines(self, start, end):
+        """Raw text of lines [start, end) that left the buffer, None where gone.
+
+        Spilled lines come from the segment store; lines older than the store
+        from the capture file.
+        """
+        lines = [None] * max(0, end - start)
+        spill_store = self.spill_store
+        capture_index, capture_base = self.capture_index, self.capture_base
+        disk_end = end
+        store_first = spill_store.first if spill_store is not None else None
+        if store_first is not None:
+            begin = max(start, store_first)
+            stored = spill_store.lines(begin, end)
+            lines[begin - start : begin - start + len(stored)] = stored
+            disk_end = min(end, begin)
+        if capture_index is not None and start < disk_end:
+            begin = max(start, capture_base)
+            captured = capture_index.lines(
+                begin - capture_base, disk_end - capture_base
+            )
+            # Capture files carry the timestamp prefix when it was enabled
+            lines[begin - start : begin - start + len(captured)] = [
+                CAPTURE_TIMESTAMP.sub("", line, count=1) for line in captured
+            ]
+        return lines
+
+    def _search_lines(self, start, end):
+        """Raw text of lines [start, end), None where a line is gone; any thread."""
+        end = min(end, self.lines_total)
+        recent = self.data_buffer.range(max(start, self.data_buffer.first), end)
+        # Lines evicted after reading `first` were spilled before they left
+        lines = self._older_lines(start, max(start, end - len(recent)))
+        lines.extend(recent)
+        return lines
+
+    def _filter_range(self):
+        """(first, end) rows of the filtered preview: matches still available."""
+        matches = self._search_result.matches
+        return bisect_left(matches, self._preview_range()[0]), len(matches)
+
+    def _filter_rows(self, start, end):
+        rows = []
+        for line in self._search_result.matches[start:end]:
+            text = self._search_lines(line, line + 1)[0]
+            rows.append(f"{line + 1}: {text or ''}")
+        return rows
+
+    def _preview_rows(self, start, end):
+        """Text of lines [start, end): older lines come from disk."""
+        if self._filtering():
+            return self._filter_rows(start, end)
+        end = min(end, self.lines_total)
+        recent = self.data_buffer.range(max(start, self.data_buffer.first), end)
+        rows = [
+            line or ""
+            for line in self._older_lines(start, max(start, end - len(recent)))
+        ]
+        rows.extend(self._format_line(line) for line in recent)
+
+        # Messages go after the line they followed; early ones before the first
+        leading = []
+        at_first_line = start == self._preview_range()[0]
+        for position, message in list(self.messages):
+            if start < position <= start + len(rows):
+                rows[position - start - 1] += "\n" + message
+            elif position <= start and at_first_line:
+                leading.append(message)
+        if leading:
+            if rows:
+                rows[0] = "\n".join(leading + [rows[0]])
+            else:
+                rows = ["\n".join(leading)]
+        return rows
 
-    def _update_preview(self):
-        """Update the preview widget with current buffer data."""
-        if not hasattr(self, "text_widget") or not self.preview_enabled.get_value():
+    def _update_preview(self, force=False):
+        """Redraw the visible preview rows."""
+        if not hasattr(self, "preview") or not self.preview_enabled.get_value():
             return
-
         try:
-            limit = int(self.preview_limit.get_value())
+            if self.capture_index is not None:
+                self.capture_index.update()
+            # Messages and render-time timestamps change rows already shown
+            messages = self._message_count
+            force = force or messages != self._messages_shown
+            force = force or bool(self.timestamp_enabled.get_value())
+            self._messages_shown = messages
+            self.preview.refresh(force=force)
+        except Exception as e:
+            logger.error(f"Error updating preview: {e}")
 
-            buffer_lines = list(self.data_buffer)
-            lines_to_show = (
-                buffer_lines[-limit:] if len(buffer_lines) > limit else buffer_lines
+    def _preview_tick(self):
+        self._poll_search()
+        if not self.preview_paused:
+            self._update_preview()
+        try:
+            self.preview_timer_id = self.frame.after(
+                PREVIEW_REFRESH_MS, self._preview_tick
             )
+        except tk.TclError:
+            self.preview_timer_id = None
 
-            formatted_lines = []
-            for line in lines_to_show:
-                if (
-                    self.timestamp_enabled.get_value()
-                    and self.timestamp_start is not None
-                ):
-                    elapsed = time.time() - self.timestamp_start
-                    hours = int(elapsed // 3600)
-                    minutes = int((elapsed % 3600) // 60)
-                    seconds = elapsed % 60
-                    timestamp = f"{hours:02d}:{minutes:02d}:{seconds:06.3f} "
-                    formatted_lines.append(timestamp + line)
-                else:
-                    formatted_lines.append(line)
-
-            self.text_widget.delete("1.0", "end")
-            if formatted_lines:
-                content = "\n".join(formatted_lines)
-                self.text_widget.insert("1.0", content)
-            self.text_widget.see("end")
-
-        except Exception as e:
-            logger.error(f"Error updating preview: {e}")
+    def _stop_preview_timer(self):
+        if self.preview_timer_id:
+            try:
+                self.frame.after_cancel(self.preview_timer_id)
+            except tk.TclError:
+                pass
+            self.preview_timer_id = None
 
     def add_message(self, message):
         self._add_message(message)
 
+    def set_tab_active(self, is_active):
+        """Update the preview only while visible, catching up when shown."""
+        self.is_tab_active = is_active
+        self._stop_preview_timer()
+        if is_active:
+            self._preview_tick()
+
     def get_frame(self):
         return self.frame
 
+    @property
+    def lines_total(self):
+        """Number of lines received this session; the buffer's sequence number."""
+        return self.data_buffer.sequence
+
     def get_data(self):
-        return list(self.data_buffer)
+        """Copy of every buffered line; data_buffer.tail/since/range copy less."""
+        return self.data_buffer.tail(self.data_buffer.maxlen)
+
+    def get_values(self, count=None):
+        """Parsed rows of the newest `count` buffered lines, oldest first.
+
+        Every tab reads the shared parse cache, so each line is parsed once.
+        """
+        return self.parsed.tail(count)
+
+    def get_values_with_end(self, count=None):
+        """get_values(count) and the line number one past its last row."""
+        return self.parsed.tail_with_end(count)
+
+    @property
+    def last_arrival_time(self):
+        """perf_counter() timestamp of the newest line, or None when empty."""
+        try:
+            return self.arrival_times[-1]
+        except IndexError:
+            return None
 
     def cleanup(self):
+        self._stop_preview_timer()
+        for timer_id in (self.budget_timer_id, self._buffer_settings_id):
+            if timer_id:
+                try:
+                    self.frame.after_cancel(timer_id)
+                except tk.TclError:
+                    pass
+        self.search.stop()
+        self._close_spill_store()
+        self._close_capture_index()
         if self.capture_file:
             try:
                 self.capture_file.close()
@@ -0,0 +1,72 @@
+import os
+import tkinter as tk
+from tkinter import ttk, filedialog
+from ..i18n import t
+
+POLL_MS = 100
+
+
+def ask_export_path(initialdir=None, initialfile=None):
+    """Ask where to export; the extension chosen selects the format."""
+    return filedialog.asksaveasfilename(
+        defaultextension=".txt",
+        filetypes=[
+            (t("dialogs.text_files"), "*.txt"),
+            (t("dialogs.csv_files"), "*.csv"),
+            (t("dialogs.npz_files"), "*.npz"),
+            (t("dialogs.binary_files"), "*.bin"),
+        ],
+        initialdir=initialdir,
+        initialfile=initialfile,
+    )
+
+
+class ExportWindow:
+    """Progress of a background export, with a Cancel button.
+
+    Starts the job, follows it until it finishes and reports the outcome
+    through `report` (a message callback such as DataTab.add_message).
+    """
+
+    def __init__(self, parent, job, report):
+        self.job = job
+        self.report = report
+        self.window = tk.Toplevel(parent)
+        self.window.title(t("ui.export.title"))
+        self.window.resizable(False, False)
+        self.window.protocol("WM_DELETE_WINDOW", self._cancel)
+
+        ttk.Label(self.window, text=os.path.basename(job.path)).pack(
+            anchor="w", padx=10, pady=(10, 5)
+        )
+        self.progress_bar = ttk.Progressbar(self.window, length=300, maximum=100)
+        self.progress_bar.pack(fill="x", padx=10, pady=5)
+        self.status_label = ttk.Label(self.window, text="")
+        self.status_label.pack(anchor="w", padx=10)
+        self.cancel_button = ttk.Button(
+            self.window, text=t("common.cancel"), command=self._cancel
+        )
+        self.cancel_button.pack(anchor="e", padx=10, pady=10)
+
+        job.start()
+        self._poll()
+
+    def _poll(self):
+        job = self.job
+        if job.done:
+            self.window.destroy()
+            if job.error:
+                self.report(t("ui.data_tab.error_saving").format(error=job.error))
+            elif job.cancelled:
+                self.report(t("ui.export.cancelled").format(path=job.path))
+            else:
+                self.report(t("ui.data_tab.data_saved").format(path=job.path))
+            return
+
+        self.progress_bar["value"] = 100 * job.progress
+        self.status_label.config(text=t("ui.export.progress").format(rows=job.rows))
+        self.window.after(POLL_MS, self._poll)
+
+    def _cancel(self):
+        self.job.cancel()
+        self.cancel_button.config(state="disabled")
@@ -1,11 +1,18 @@
 import tkinter as tk
 from tkinter import ttk
-from ..core import GraphManager
-from ..utils import DataParser, FileManager
+import time
+import numpy as np
+from ..core import GraphManager, get_latency_tracker, get_metrics
+from ..core.statistics import STAT_NAMES
+from ..utils import DataParser, get_derived_channels, is_expression
 from ..config import DEFAULT_X_COLUMN, DEFAULT_Y_COLUMN, MARKER_MAPPING
 from ..i18n import t, get_config_manager
 from .preference_widgets import PrefEntry, PrefCombobox, PrefCheckbutton
 
+MIN_VIEW_SPAN = 10
+ZOOM_STEP = 0.8
+STATS_INTERVAL = 0.5
+
 
 class GraphTab:
     def __init__(self, parent, data_tab, open_options_callback):
@@ -17,12 +24,24 @@ class GraphTab:
         self.is_paused = False
 
         self.refresh_rate_ms = 33
-        self.refresh_timer_id = None
         self.refresh_counter = 0
         self.debug_refresh = False
         self.last_render_time = 0
+        self.is_tab_active = False
+        # lines_total of the last frame drawn; None forces the next frame
+        self._rendered_sequence = None
         self.series_widgets = []
 
+        # Zoom/pan state in sample indices: None span uses the data window,
+        # None end follows the newest sample
+        self.view_span = None
+        self.view_end = None
+        self._drag = None
+        self._view_redraw_id = None
+        self._expression_errors = set()
+        # Key of the rows being drawn for the derived-channel result cache
+        self._values_generation = None
+
         self._create_widgets()
 
     def _create_widgets(self):
@@ -55,6 +74,18 @@ class GraphTab:
         )
         self.save_data_button.pack(side="left", padx=(0, 10))
 
+        self.live_button = ttk.Button(
+            button_container, text=t("ui.graph_tab.live"), command=self._reset_view
+        )
+        self.live_button.pack(side="left", padx=(0, 10))
+
+        self.stats_button = ttk.Button(
+            button_container,
+            text=t("ui.graph_tab.show_statistics"),
+            command=self._toggle_statistics,
+        )
+        self.stats_button.pack(side="left", padx=(0, 10))
+
         self.options_button = ttk.Button(
             toolbar_frame,
             text=t("ui.graph_tab.show_settings"),
@@ -98,6 +129,8 @@ class GraphTab:
         separator.grid(column=1, row=1, sticky="ns", padx=10)
 
         self.y_entries = []
+        # Expressions as last committed with Return or focus-out
+        self.y_expressions = []
         for i in range(1, 6):
             y_frame = ttk.Frame(self.axis_columns_frame)
             y_frame.grid(column=i + 1, row=1, padx=5, pady=5, sticky="w")
@@ -108,12 +141,26 @@ class GraphTab:
                 y_frame,
                 pref_key=f"graph.general.y{i}_column",
                 default_value="",
-                width=8,
+                width=12,
                 justify="center",
                 on_change=self._on_setting_change,
             )
             y_entry.pack(side="top")
+            for sequence in ("<Return>", "<FocusOut>"):
+                y_entry.bind(
+                    sequence,
+                    lambda event, index=i - 1: self._commit_expression(index),
+                    add="+",
+                )
             self.y_entries.append(y_entry)
+            self.y_expressions.append(y_entry.get_value().strip())
+
+        expression_hint = ttk.Label(
+            self.axis_columns_frame,
+            text=t("ui.graph_tab.expression_hint"),
+            foreground="gray",
+        )
+        expression_hint.grid(column=0, row=2, columnspan=7, padx=5, sticky="w")
 
         self.options_frame = ttk.Frame(self.graph_settings_frame)
         self.options_frame.grid(column=0, row=1, sticky="ew", padx=5, pady=5)
@@ -131,9 +178,37 @@ class GraphTab:
         chart_frame = ttk.Frame(self.frame)
         chart_frame.grid(column=0, row=3, columnspan=4, padx=10, pady=10, sticky="nsew")
 
+        self.view_scrollbar = ttk.Scrollbar(
+            chart_frame, orient="horizontal", command=self._on_view_scroll
+        )
+        self.view_scrollbar.pack(side="bottom", fill="x")
+
         self.graph_manager = GraphManager(chart_frame)
         self.graph_manager.get_widget().pack(fill="both", expand=True)
 
+        canvas = self.graph_manager.canvas
+        canvas.mpl_connect("scroll_event", self._on_view_zoom)
+        canvas.mpl_connect("button_press_event", self._on_view_press)
+        canvas.mpl_connect("motion_notify_event", self._on_view_drag)
+        canvas.mpl_connect("button_release_event", self._on_view_release)
+
+        self.stats_frame = ttk.LabelFrame(self.frame, text=t("ui.graph_tab.statistics"))
+        stats_columns = ("column", "scope") + STAT_NAMES
+        self.stats_tree = ttk.Treeview(
+            self.stats_frame, columns=stats_columns, show="headings", height=6
+        )
+        for name in stats_columns:
+            self.stats_tree.heading(name, text=t(f"ui.graph_tab.stats.{name}"))
+            self.stats_tree.column(name, width=90, anchor="e")
+        stats_scrollbar = ttk.Scrollbar(
+            self.stats_frame, orient="vertical", command=self.stats_tree.yview
+        )
+        self.stats_tree.configure(yscrollcommand=stats_scrollbar.set)
+        self.stats_tree.pack(side="left", fill="both", expand=True)
+        stats_scrollbar.pack(side="right", fill="y")
+        self.stats_visible = False
+        self.stats_updated = 0
+
         self.frame.rowconfigure(3, weight=1)
         self.frame.columnconfigure(0, weight=1)
 
@@ -332,6 +407,54 @@ class GraphTab:
             self.options_button.config(text=t("ui.graph_tab.hide_settings"))
             self.options_visible = True
 
+    def _toggle_statistics(self):
+        if self.stats_visible:
+            self.stats_frame.grid_remove()
+            self.stats_button.config(text=t("ui.graph_tab.show_statistics"))
+            self.stats_visible = False
+        else:
+            self.stats_frame.grid(
+                column=0, row=4, columnspan=4, padx=10, pady=(0, 10), sticky="ew"
+            )
+            self.stats_button.config(text=t("ui.graph_tab.hide_statistics"))
+            self.stats_visible = True
+            self._update_statistics()
+
+    def _update_statistics(self):
+        """Refresh the statistics table from the streaming accumulators."""
+        statistics = self.data_tab.statistics
+        data_window_str = self.data_window_entry.get_value()
+        window = int(data_window_str) if data_window_str.isdigit() else 0
+        window = window or self.data_tab.data_buffer.maxlen
+        if window != statistics.window:
+            # Reseed the new window from the newest full-resolution samples
+            history = self.data_tab.history
+            level, _, values = history.query(
+                max(0, history.total - window), history.total, window
+            )
+            statistics.set_window(window, values[2] if level == 0 else None)
+
+        snapshot = statistics.snapshot()
+        for column in range(statistics.width):
+            for scope in ("session", "window"):
+                stats = snapshot[scope]
+                values = [str(column + 1), t(f"ui.graph_tab.stats.{scope}")]
+                values.append(str(stats["count"][column]))
+                values.extend(
+                    self._format_statistic(stats[name][column])
+                    for name in STAT_NAMES[1:]
+                )
+                item = f"{column}:{scope}"
+                if self.stats_tree.exists(item):
+                    self.stats_tree.item(item, values=values)
+                else:
+                    self.stats_tree.insert("", "end", iid=item, values=values)
+        self.stats_updated = time.perf_counter()
+
+    @staticmethod
+    def _format_statistic(value):
+        return "-" if np.isnan(value) else f"{value:.6g}"
+
     def _on_series_setting_change(self, series_index):
         self._on_setting_change()
 
@@ -342,6 +465,101 @@ class GraphTab:
         else:
             self.pause_button.config(text=t("ui.graph_tab.pause"))
 
+    def is_view_zoomed(self):
+        return self.view_span is not None or self.view_end is not None
+
+    def _view_range(self, default_span):
+        """Return the (start, end) sample range currently shown."""
+        first, total = self.data_tab.history.retained_range()
+        span = self.view_span or default_span
+        end = total if self.view_end is None else self.view_end
+        end = min(total, max(end, first + span))
+        return max(first, end - span), end
+
+    def _current_span(self):
+        data_window_str = self.data_window_entry.get_value()
+        data_window = int(data_window_str) if data_window_str.isdigit() else 0
+        return self.view_span or data_window or len(self.data_tab.data_buffer)
+
+    def _set_view(self, span, end):
+        first, total = self.data_tab.history.retained_range()
+        self.view_span = max(MIN_VIEW_SPAN, min(int(span), max(total - first, 1)))
+        end = int(end)
+        # Reaching the newest sample resumes live follow
+        self.view_end = None if end >= total else max(end, first + self.view_span)
+        self._schedule_view_redraw()
+
+    def _reset_view(self):
+        self.view_span = None
+        self.view_end = None
+        self._schedule_view_redraw()
+
+    def _schedule_view_redraw(self):
+        # Coalesce bursts of wheel and motion events into one redraw
+        if self._view_redraw_id is None:
+            self._view_redraw_id = self.frame.after_idle(self._view_redraw)
+
+    def _view_redraw(self):
+        self._view_redraw_id = None
+        self.plot_graph()
+
+    def _axes_fraction(self, event):
+        bbox = self.graph_manager.ax.bbox
+        return min(1.0, max(0.0, (event.x - bbox.x0) / max(bbox.width, 1)))
+
+    def _on_view_zoom(self, event):
+        """Mouse wheel zooms around the cursor."""
+        if event.inaxes is not self.graph_manager.ax:
+            return
+        span = self._current_span()
+        if not span:
+            return
+        start, end = self._view_range(span)
+        factor = ZOOM_STEP if event.button == "up" else 1 / ZOOM_STEP
+        anchor = start + self._axes_fraction(event) * (end - start)
+        new_span = max(MIN_VIEW_SPAN, span * factor)
+        self._set_view(new_span, anchor + (end - anchor) * new_span / span)
+
+    def _on_view_press(self, event):
+        if event.button == 1 and event.inaxes is self.graph_manager.ax:
+            span = self._current_span()
+            self._drag = (event.x, span, self._view_range(span)[1])
+
+    def _on_view_drag(self, event):
+        if self._drag is None or event.x is None:
+            return
+        x, span, end = self._drag
+        width = max(self.graph_manager.ax.bbox.width, 1)
+        self._set_view(span, end - (event.x - x) / width * span)
+
+    def _on_view_release(self, event):
+        self._drag = None
+
+    def _on_view_scroll(self, action, amount, unit=None):
+        """Scrollbar command: moveto fraction, or scroll by units/pages."""
+        span = self._current_span()
+        if not span:
+            return
+        first, total = self.data_tab.history.retained_range()
+        start, end = self._view_range(span)
+        if action == "moveto":
+            start = first + float(amount) * (total - first)
+        elif unit == "pages":
+            start += int(amount) * span
+        else:
+            start += int(amount) * max(1, span // 10)
+        self._set_view(span, start + span)
+
+    def _update_view_scrollbar(self, start, end):
+        first, total = self.data_tab.history.retained_range()
+        if total <= first:
+            self.view_scrollbar.set(0.0, 1.0)
+            return
+        self.view_scrollbar.set(
+            (max(start, first) - first) / (total - first),
+            (end - first) / (total - first),
+        )
+
     def _save_chart(self):
         """Save the current chart as PNG by directly saving the existing figure"""
         from tkinter import filedialog
@@ -364,21 +582,19 @@ class GraphTab:
                 self.data_tab.add_message(t("ui.data_tab.error_saving").format(error=e))
 
     def _save_data(self):
-        """Save the current data to a file using the same logic as data tab"""
-        valid_lines = [
-            item["value"] for item in self.data_tab.data if item["type"] == "data"
-        ]
-        if valid_lines:
-            file_path = FileManager.save_data_to_file(valid_lines)
-            if file_path:
-                self.data_tab.add_message(
-                    t("ui.data_tab.data_saved").format(path=file_path)
-                )
+        """Export the lines of the graph window through the data tab's export."""
+        data_window_str = self.data_window_entry.get_value()
+        data_window = int(data_window_str) if data_window_str.isdigit() else 0
+        end = self.data_tab.lines_total
+        count = data_window or len(self.data_tab.data_buffer)
+        self.data_tab.export_lines(max(0, end - count), end)
 
     def _on_setting_change(self, event=None):
-        pass
+        self._rendered_sequence = None
 
     def plot_graph(self):
+        frame_start = time.perf_counter()
+        sequence = self.data_tab.lines_total
         try:
             if (
                 not hasattr(self, "x_column_entry")
@@ -401,26 +617,59 @@ class GraphTab:
             if x_col < 0:
                 raise ValueError(t("ui.graph_tab.positive_numbers"))
 
-            data_lines = self.data_tab.get_data()
-            if not data_lines:
+            buffered = len(self.data_tab.data_buffer)
+            if not buffered:
                 return
 
             data_window_str = self.data_window_entry.get_value()
             data_window = int(data_window_str) if data_window_str else 0
-            if data_window > 0:
-                data_lines = data_lines[-data_window:]
-
-            x_data, _ = DataParser.extract_columns(data_lines, x_col, 0)
-            if not x_data:
-                self.data_tab.add_message(t("ui.graph_tab.could_not_extract_data"))
-                return
-
             group = self.group_combobox.get_value()
 
-            if group == "stacked":
-                self._plot_stacked_chart(x_data, data_lines, x_col)
+            # Zoomed or panned views and windows longer than the text buffer
+            # are served by the history pyramid
+            history = self.data_tab.history
+            if group != "stacked" and (
+                self.is_view_zoomed()
+                or (data_window > buffered and history.total > buffered)
+            ):
+                start, end = self._view_range(data_window or buffered)
+                self._plot_history_chart(x_col, start, end)
+                self._update_view_scrollbar(start, end)
             else:
-                self._plot_time_series_chart(x_data, data_lines, x_col)
+                self._update_view_scrollbar(
+                    history.total - min(buffered, data_window or buffered),
+                    history.total,
+                )
+                # Rows come from the parse cache shared with the other tabs
+                values, end = self.data_tab.get_values_with_end(data_window or None)
+                self._values_generation = (end, len(values))
+
+                x_data, _ = DataParser.select_columns(values, x_col, 0)
+                if not x_data:
+                    self.data_tab.add_message(t("ui.graph_tab.could_not_extract_data"))
+                    return
+
+                if group == "stacked":
+                    self._plot_stacked_chart(x_data, values, x_col)
+                else:
+                    self._plot_time_series_chart(x_data, values, x_col)
+
+            if (
+                self.stats_visible
+                and time.perf_counter() - self.stats_updated >= STATS_INTERVAL
+            ):
+                self._update_statistics()
+
+            get_latency_tracker().record_frame(
+                "graph",
+                frame_start,
+                self.graph_manager,
+                self.data_tab.last_arrival_time,
+            )
+            get_metrics().observe(
+                "render", time.perf_counter() - frame_start, tab="graph"
+            )
+            self._rendered_sequence = sequence
 
         except tk.TclError as e:
             pass
@@ -429,25 +678,69 @@ class GraphTab:
         except Exception as e:
             self.data_tab.add_message(t("ui.graph_tab.graph_error").format(error=e))
 
-    def _plot_time_series_chart(self, x_data, data_lines, x_col):
+    def _commit_expression(self, index):
+        self.y_expressions[index] = self.y_entries[index].get_value().strip()
+        self._on_setting_change()
+
+    def _series_spec(self, index):
+        """Y entry text; an expression applies only once committed, not per keystroke."""
+        text = self.y_entries[index].get_value().strip()
+        if is_expression(text):
+            return self.y_expressions[index]
+        return text
+
+    def _extract_series(self, values, x_col, spec):
+        """Y values for a series entry: a column number or a derived expression."""
+        if not is_expression(spec):
+            y_col = int(spec) - 1
+            if y_col < 0:
+                return []
+            _, y_data = DataParser.select_columns(values, x_col, y_col)
+            return y_data
+
+        # Results are shared by every entry while the data is unchanged
+        generation = self._values_generation
+        if values.ndim != 2 or values.shape[1] <= x_col:
+            return []
+
+        y_values = self._evaluate_expression(spec, values, generation)
+        if y_values is None:
+            return []
+        # Keep the rows extract_columns keeps for the X axis
+        valid = ~(np.isnan(values[:, x_col]) | np.isnan(values[:, 0]))
+        return y_values[valid].tolist()
+
+    def _evaluate_expression(self, expression, values, generation):
+        try:
+            return get_derived_channels().evaluate(expression, values, generation)
+        except ValueError as e:
+            # Report a broken expression once rather than on every frame
+            if expression not in self._expression_errors:
+                self._expression_errors.add(expression)
+                self.data_tab.add_message(
+                    t("ui.graph_tab.expression_error").format(
+                        expression=expression, error=e
+                    )
+                )
+            return None
+
+    def _plot_time_series_chart(self, x_data, values, x_col):
         """Plot time series chart using preference widgets for value access."""
         y_series_data = []
         settings_list = []
         has_data = False
 
-        for i, y_entry in enumerate(self.y_entries):
-            y_col_str = y_entry.get_value().strip()
+        for i in range(len(self.y_entries)):
+            y_col_str = self._series_spec(i)
             if y_col_str:
                 try:
-                    y_col = int(y_col_str) - 1
-                    if y_col >= 0:
-                        _, y_data = DataParser.extract_columns(data_lines, x_col, y_col)
-                        if y_data:
-                            y_series_data.append(y_data)
-                            settings = self._get_series_settings(i)
-                            settings["has_data"] = True
-                            settings_list.append(settings)
-                            has_data = True
+                    y_data = self._extract_series(values, x_col, y_col_str)
+                    if y_data:
+                        y_series_data.append(y_data)
+                        settings = self._get_series_settings(i)
+                        settings["has_data"] = True
+                        settings_list.append(settings)
+                        has_data = True
                 except ValueError:
                     pass
 
@@ -468,27 +761,77 @@ class GraphTab:
             x_data, y_series_data, settings_list, x_col, title, xlabel, ylabel
         )
 
-    def _plot_stacked_chart(self, x_data, data_lines, x_col):
+    def _plot_history_chart(self, x_col, start, end):
+        """Plot samples [start, end) from the aggregation pyramid."""
+        level, _, values = self.data_tab.history.query(
+            start, end, self.graph_manager.plot_width()
+        )
+        if values.shape[1] == 0 or values.shape[2] <= x_col:
+            return
+
+        x_data = values[2, :, x_col]
+        y_series_data = []
+        envelopes = []
+        settings_list = []
+
+        for i in range(len(self.y_entries)):
+            y_col_str = self._series_spec(i)
+            if not y_col_str:
+                continue
+            if is_expression(y_col_str):
+                # Evaluated over the block means, so no min/max band
+                y_data = self._evaluate_expression(
+                    y_col_str, values[2], (self.data_tab.history.total, start, end)
+                )
+                if y_data is None:
+                    continue
+                y_series_data.append(y_data)
+                envelopes.append(None)
+            else:
+                y_col = int(y_col_str) - 1
+                if y_col < 0 or y_col >= values.shape[2]:
+                    continue
+                y_series_data.append(values[2, :, y_col])
+                envelopes.append(
+                    (values[0, :, y_col], values[1, :, y_col]) if level else None
+                )
+            settings = self._get_series_settings(i)
+            settings["has_data"] = True
+            settings_list.append(settings)
+
+        if not settings_list:
+            return
+
+        settings_list[0]["min_y"] = self.min_y_entry.get_value().strip()
+        settings_list[0]["max_y"] = self.max_y_entry.get_value().strip()
+
+        self.graph_manager.plot_multi_series(
+            x_data,
+            y_series_data,
+            settings_list,
+            x_col,
+            t("ui.graph_tab.chart_title"),
+            t("ui.graph_tab.chart_xlabel").format(column=x_col + 1),
+            t("ui.graph_tab.chart_ylabel").format(column="Multi"),
+            envelopes=envelopes,
+        )
+
+    def _plot_stacked_chart(self, x_data, values, x_col):
         y_series_data = []
         colors = []
         has_data = False
 
-        for i, y_entry in enumerate(self.y_entries):
-            y_col_str = y_entry.get_value().strip()
+        for i in range(len(self.y_entries)):
+            y_col_str = self._series_spec(i)
             if y_col_str:
                 try:
-                    y_col = int(y_col_str) - 1
-                    if y_col >= 0:
-                        _, y_data = DataParser.extract_columns(data_lines, x_col, y_col)
-                        if y_data:
-                            y_series_data.append(y_data)
-
-                            color = self._get_stacked_color(i)
-                            colors.append(color)
-                            has_data = True
-                        else:
-                            y_series_data.append([])
-                            colors.append("#cccccc")
+                    y_data = self._extract_series(values, x_col, y_col_str)
+                    if y_data:
+                        y_series_data.append(y_data)
+
+                        color = self._get_stacked_color(i)
+                        colors.append(color)
+                        has_data = True
                     else:
                         y_series_data.append([])
                         colors.append("#cccccc")
@@ -559,7 +902,7 @@ class GraphTab:
             )
             self.dot_type_combobox.set(translated_marker)
 
-        if self.data_tab.get_data() and not self.is_paused:
+        if self.data_tab.data_buffer and not self.is_paused:
             self.plot_graph()
 
     def _get_translated_graph_types(self):
@@ -838,49 +1181,16 @@ class GraphTab:
 
         self._on_setting_change()
 
-    def _start_refresh_timer(self):
-        self._refresh_chart()
-
-    def _refresh_chart(self):
-        try:
-            if not self.is_paused:
-                data_lines = self.data_tab.get_data()
-                if data_lines:
-                    if self.debug_refresh:
-                        self.refresh_counter += 1
-                        fps_actual = 1000 / self.refresh_rate_ms
-                        print(
-                            f"Chart refresh #{self.refresh_counter}: {fps_actual:.1f} FPS ({self.refresh_rate_ms}ms) - Fixed Rate"
-                        )
-
-                    self.plot_graph()
-                else:
-                    pass
-            else:
-                pass
-
-        except Exception as e:
-            if self.debug_refresh:
-                print(f"Chart refresh error: {e}")
-        finally:
-            if hasattr(self, "frame") and self.frame.winfo_exists():
-                self.refresh_timer_id = self.frame.after(
-                    self.refresh_rate_ms, self._refresh_chart
-                )
-
-    def _stop_refresh_timer(self):
-        if self.refresh_timer_id:
-            try:
-                self.frame.after_cancel(self.refresh_timer_id)
-            except:
-                pass
-            self.refresh_timer_id = None
-
     def _set_refresh_rate(self, fps):
         self.refresh_rate_ms = int(1000 / fps)
 
     def cleanup(self):
-        self._stop_refresh_timer()
+        if self._view_redraw_id is not None:
+            try:
+                self.frame.after_cancel(self._view_redraw_id)
+            except tk.TclError:
+                pass
+            self._view_redraw_id = None
 
     def __del__(self):
         try:
@@ -904,17 +1214,29 @@ class GraphTab:
         except ValueError:
             pass
 
+    def set_latency_hud(self, enabled):
+        """Show or hide the latency overlay on the chart."""
+        if enabled:
+            self.graph_manager.set_overlay(
+                lambda: get_latency_tracker().format_hud("graph")
+            )
+        else:
+            self.graph_manager.set_overlay(None)
+
     def set_tab_active(self, is_active):
-        """Set whether this tab is currently active (optimization for rendering)."""
+        """Render only while visible; becoming visible draws one catch-up frame.
+
+        Frames are driven by the main window's loop through should_render_now.
+        """
         self.is_tab_active = is_active
-        if not is_active:
-            self._stop_refresh_timer()
-        else:
-            if hasattr(self, "frame") and self.frame.winfo_exists():
-                self._start_refresh_timer()
+        if is_active and not self.is_paused and self.frame.winfo_exists():
+            self.render_frame()
 
     def should_render_now(self, current_time):
-        if self.is_paused or not getattr(self, "is_tab_active", True):
+        if self.is_paused or not self.is_tab_active:
+            return False
+        # Nothing new to draw: no lines arrived and no setting changed
+        if self._rendered_sequence == self.data_tab.lines_total:
             return False
 
         refresh_interval = self.refresh_rate_ms / 1000.0
@@ -925,8 +1247,7 @@ class GraphTab:
         import time
 
         try:
-            data_lines = self.data_tab.get_data()
-            if data_lines:
+            if self.data_tab.data_buffer:
                 self.refresh_counter += 1
 
                 if self.debug_refresh:
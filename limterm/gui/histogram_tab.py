@@ -0,0 +1,320 @@
+"""
+Histogram tab: live value distribution of one or more columns.
+
+New samples are read from the parsed history by position and added to one
+IncrementalHistogram per column, so each refresh bins only what arrived
+since the previous one. Bars are created once and their heights updated in
+place; they are rebuilt only when the bin edges change.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+import time
+import numpy as np
+from ..core import GraphManager, get_latency_tracker, get_metrics
+from ..core.histogram import DEFAULT_BINS, IncrementalHistogram
+from ..i18n import t
+from .preference_widgets import PrefEntry, PrefCombobox
+
+REFRESH_MS = 100
+BAR_COLORS = ("#1760ff", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd")
+
+
+class HistogramTab:
+    def __init__(self, parent, data_tab):
+        self.frame = ttk.Frame(parent)
+        self.data_tab = data_tab
+        self.is_paused = False
+        self.is_tab_active = False
+        self.refresh_timer_id = None
+
+        self.histograms = {}
+        self._bars = {}
+        self._position = None
+
+        self._create_widgets()
+
+    def _create_widgets(self):
+        toolbar_frame = ttk.Frame(self.frame)
+        toolbar_frame.grid(column=0, row=0, sticky="ew", padx=10, pady=(10, 5))
+
+        self.pause_button = ttk.Button(
+            toolbar_frame, text=t("ui.histogram_tab.pause"), command=self._toggle_pause
+        )
+        self.pause_button.pack(side="left", padx=(0, 10))
+
+        self.reset_button = ttk.Button(
+            toolbar_frame, text=t("ui.histogram_tab.reset"), command=self._reset
+        )
+        self.reset_button.pack(side="left", padx=(0, 10))
+
+        settings_frame = ttk.LabelFrame(self.frame, text=t("ui.histogram_tab.settings"))
+        settings_frame.grid(column=0, row=1, padx=10, pady=5, sticky="ew")
+
+        ttk.Label(settings_frame, text=t("ui.histogram_tab.columns_label")).grid(
+            column=0, row=0, padx=5, pady=5, sticky="w"
+        )
+        self.columns_entry = PrefEntry(
+            settings_frame,
+            pref_key="histogram.columns",
+            default_value="2",
+            width=12,
+            on_change=self._reset,
+        )
+        self.columns_entry.grid(column=1, row=0, padx=5, pady=5, sticky="w")
+
+        ttk.Label(settings_frame, text=t("ui.histogram_tab.bins_label")).grid(
+            column=2, row=0, padx=5, pady=5, sticky="w"
+        )
+        self.bins_entry = PrefEntry(
+            settings_frame,
+            pref_key="histogram.bins",
+            default_value=str(DEFAULT_BINS),
+            width=6,
+            on_change=self._reset,
+        )
+        self.bins_entry.grid(column=3, row=0, padx=5, pady=5, sticky="w")
+
+        ttk.Label(settings_frame, text=t("ui.histogram_tab.range_label")).grid(
+            column=4, row=0, padx=5, pady=5, sticky="w"
+        )
+        self.range_mode = PrefCombobox(
+            settings_frame,
+            pref_key="histogram.range_mode",
+            default_value="auto",
+            state="readonly",
+            values=[
+                t("ui.histogram_tab.range_modes.auto"),
+                t("ui.histogram_tab.range_modes.fixed"),
+            ],
+            value_mapping={
+                t("ui.histogram_tab.range_modes.auto"): "auto",
+                t("ui.histogram_tab.range_modes.fixed"): "fixed",
+            },
+            width=8,
+            on_change=self._reset,
+        )
+        self.range_mode.grid(column=5, row=0, padx=5, pady=5, sticky="w")
+
+        self.min_entry = PrefEntry(
+            settings_frame,
+            pref_key="histogram.min",
+            default_value="0",
+            width=8,
+            on_change=self._reset,
+        )
+        self.min_entry.grid(column=6, row=0, padx=5, pady=5, sticky="w")
+        self.max_entry = PrefEntry(
+            settings_frame,
+            pref_key="histogram.max",
+            default_value="100",
+            width=8,
+            on_change=self._reset,
+        )
+        self.max_entry.grid(column=7, row=0, padx=5, pady=5, sticky="w")
+
+        ttk.Label(settings_frame, text=t("ui.histogram_tab.mode_label")).grid(
+            column=0, row=1, padx=5, pady=5, sticky="w"
+        )
+        self.count_mode = PrefCombobox(
+            settings_frame,
+            pref_key="histogram.mode",
+            default_value="cumulative",
+            state="readonly",
+            values=[
+                t("ui.histogram_tab.modes.cumulative"),
+                t("ui.histogram_tab.modes.decaying"),
+            ],
+            value_mapping={
+                t("ui.histogram_tab.modes.cumulative"): "cumulative",
+                t("ui.histogram_tab.modes.decaying"): "decaying",
+            },
+            width=12,
+            on_change=self._reset,
+        )
+        self.count_mode.grid(column=1, row=1, padx=5, pady=5, sticky="w")
+
+        ttk.Label(settings_frame, text=t("ui.histogram_tab.half_life_label")).grid(
+            column=2, row=1, padx=5, pady=5, sticky="w"
+        )
+        self.half_life_entry = PrefEntry(
+            settings_frame,
+            pref_key="histogram.half_life",
+            default_value="1000",
+            width=8,
+            on_change=self._reset,
+        )
+        self.half_life_entry.grid(column=3, row=1, padx=5, pady=5, sticky="w")
+
+        self.graph_manager = GraphManager(self.frame)
+        self.graph_manager.get_widget().grid(
+            column=0, row=2, padx=10, pady=10, sticky="nsew"
+        )
+
+        self.frame.rowconfigure(2, weight=1)
+        self.frame.columnconfigure(0, weight=1)
+
+    def _toggle_pause(self):
+        self.is_paused = not self.is_paused
+        if self.is_paused:
+            self.pause_button.config(text=t("ui.histogram_tab.resume"))
+        else:
+            self.pause_button.config(text=t("ui.histogram_tab.pause"))
+
+    def _reset(self, event=None):
+        """Start counting again with the current settings."""
+        self.histograms = {}
+        self._bars = {}
+        self._position = None
+
+    def _get_columns(self):
+        columns = []
+        for token in self.columns_entry.get_value().replace(",", " ").split():
+            if token.isdigit() and int(token) > 0:
+                columns.append(int(token) - 1)
+        return columns
+
+    def _create_histogram(self):
+        bins = int(self.bins_entry.get_value())
+        value_range = None
+        if self.range_mode.get_value() == "fixed":
+            low = float(self.min_entry.get_value())
+            high = float(self.max_entry.get_value())
+            if high <= low:
+                raise ValueError(t("ui.histogram_tab.invalid_range"))
+            value_range = (low, high)
+        half_life = None
+        if self.count_mode.get_value() == "decaying":
+            half_life = max(1.0, float(self.half_life_entry.get_value()))
+        return IncrementalHistogram(bins, value_range, half_life)
+
+    def update_histograms(self):
+        """Bin the samples that arrived since the last refresh."""
+        history = self.data_tab.history
+        total = history.total
+        if self._position is None:
+            # A new histogram starts from the lines still in the buffer
+            self._position = max(0, total - self.data_tab.data_buffer.maxlen)
+        start = max(self._position, total - history.raw_capacity)
+        self._position = total
+        if total <= start:
+            return False
+
+        columns = self._get_columns()
+        for column in columns:
+            if column not in self.histograms:
+                self.histograms[column] = self._create_histogram()
+
+        level, _, values = history.query(start, total, total - start)
+        if level != 0:
+            return False
+        changed = False
+        for column in columns:
+            if column < values.shape[2]:
+                if self.histograms[column].add(values[0, :, column]):
+                    self._bars.pop(column, None)
+                changed = True
+        return changed
+
+    def plot_histograms(self):
+        ax = self.graph_manager.ax
+        columns = [c for c in self._get_columns() if c in self.histograms]
+        histograms = [
+            (c, self.histograms[c])
+            for c in columns
+            if self.histograms[c].low is not None
+        ]
+        if not histograms:
+            return
+
+        # Bars are rebuilt only when a column's bin edges moved
+        stale = any(
+            column not in self._bars or self._bars[column][0] not in ax.patches
+            for column, _ in histograms
+        )
+        if stale:
+            self.graph_manager.clear()
+            self._bars = {}
+            for index, (column, histogram) in enumerate(histograms):
+                edges = histogram.edges
+                container = ax.bar(
+                    edges[:-1],
+                    histogram.counts,
+                    width=np.diff(edges),
+                    align="edge",
+                    color=BAR_COLORS[index % len(BAR_COLORS)],
+                    alpha=0.6,
+                    label=t("ui.histogram_tab.column_label", column=column + 1),
+                )
+                self._bars[column] = list(container)
+            if len(histograms) > 1:
+                ax.legend(loc="upper right")
+            self.graph_manager.set_labels(
+                title=t("ui.histogram_tab.chart_title"),
+                xlabel=t("ui.histogram_tab.value_label"),
+                ylabel=t("ui.histogram_tab.count_label"),
+            )
+        else:
+            for column, histogram in histograms:
+                for rectangle, height in zip(self._bars[column], histogram.counts):
+                    rectangle.set_height(height)
+
+        low = min(h.low for _, h in histograms)
+        high = max(h.high for _, h in histograms)
+        peak = max(h.counts.max() for _, h in histograms)
+        ax.set_xlim(low, high)
+        ax.set_ylim(0, peak * 1.05 if peak > 0 else 1)
+        self.graph_manager.update()
+
+    def _refresh(self):
+        try:
+            if not self.is_paused:
+                frame_start = time.perf_counter()
+                if self.update_histograms():
+                    self.plot_histograms()
+                    get_latency_tracker().record_frame(
+                        "histogram",
+                        frame_start,
+                        self.graph_manager,
+                        self.data_tab.last_arrival_time,
+                    )
+                    get_metrics().observe(
+                        "render", time.perf_counter() - frame_start, tab="histogram"
+                    )
+        except ValueError as e:
+            self.data_tab.add_message(t("ui.histogram_tab.parameter_error", error=e))
+            self.is_paused = True
+            self.pause_button.config(text=t("ui.histogram_tab.resume"))
+        except tk.TclError:
+            return
+        self.refresh_timer_id = self.frame.after(REFRESH_MS, self._refresh)
+
+    def _stop_refresh(self):
+        if self.refresh_timer_id:
+            try:
+                self.frame.after_cancel(self.refresh_timer_id)
+            except tk.TclError:
+                pass
+            self.refresh_timer_id = None
+
+    def set_latency_hud(self, enabled):
+        """Show or hide the latency overlay on the histogram."""
+        if enabled:
+            self.graph_manager.set_overlay(
+                lambda: get_latency_tracker().format_hud("histogram")
+            )
+        else:
+            self.graph_manager.set_overlay(None)
+
+    def set_tab_active(self, is_active):
+        """Refresh only while visible; samples missed meanwhile are binned on return."""
+        self.is_tab_active = is_active
+        self._stop_refresh()
+        if is_active:
+            self._refresh()
+
+    def get_frame(self):
+        return self.frame
+
+    def cleanup(self):
+        self._stop_refresh()
@@ -0,0 +1,136 @@
+"""
+Virtual list view for the Data tab preview.
+
+The Text widget only ever holds the rows that fit on screen. The scrollbar
+is driven by hand from the row range the view is given, so scrolling or
+jumping anywhere in millions of rows costs one fetch of a screenful of rows
+and keeps memory constant.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+import tkinter.font as tkfont
+
+
+class VirtualLineView(ttk.Frame):
+    def __init__(self, parent, row_range, fetch_rows, height=15):
+        """
+        `row_range()` returns the (first, end) row numbers available and
+        `fetch_rows(start, end)` the text of rows [start, end), one string per
+        row (a row may carry extra lines, such as messages, after its own).
+        """
+        super().__init__(parent)
+        self.row_range = row_range
+        self.fetch_rows = fetch_rows
+        self.rows = height
+        # None follows the newest rows; otherwise the first row shown
+        self.top = None
+        self.highlight_row = None
+        self._shown = None
+
+        self.text = tk.Text(self, wrap="none", height=height, state="disabled")
+        self.text.tag_configure("highlight", background="#fff3a0")
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scroll)
+        self.text.pack(side="left", expand=1, fill="both")
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.text.bind("<Configure>", self._on_resize)
+        self.text.bind("<MouseWheel>", self._on_wheel)
+        self.text.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.text.bind("<Button-5>", lambda e: self._scroll_by(3))
+        self.text.bind("<Prior>", lambda e: self._scroll_by(-self.rows))
+        self.text.bind("<Next>", lambda e: self._scroll_by(self.rows))
+        self.text.bind("<Control-Home>", lambda e: self.goto(self.row_range()[0]))
+        self.text.bind("<Control-End>", lambda e: self.follow())
+
+    @property
+    def following(self):
+        return self.top is None
+
+    def follow(self):
+        """Show the newest rows and keep showing them as rows arrive."""
+        self.top = None
+        self.highlight_row = None
+        self.refresh()
+
+    def goto(self, row):
+        """Show `row` near the top of the view and highlight it."""
+        first, end = self.row_range()
+        row = min(max(row, first), max(end - 1, first))
+        self.highlight_row = row
+        self.top = max(first, row - self.rows // 4)
+        if self.top + self.rows >= end:
+            self.top = max(first, end - self.rows)
+        self.refresh(force=True)
+        return True
+
+    def reset(self):
+        self._shown = None
+        self.refresh()
+
+    def refresh(self, force=False):
+        """Redraw the visible rows if the rows shown or their content changed."""
+        first, end = self.row_range()
+        if self.top is None:
+            top = max(first, end - self.rows)
+        else:
+            top = min(max(self.top, first), max(first, end - self.rows))
+            self.top = top
+        bottom = min(end, top + self.rows)
+
+        key = (top, bottom, self.highlight_row)
+        if force or key != self._shown:
+            self._shown = key
+            self._draw(top, bottom)
+        self._update_scrollbar(first, end, top, bottom)
+
+    def _draw(self, top, bottom):
+        rows = self.fetch_rows(top, bottom)
+        self.text.config(state="normal")
+        self.text.delete("1.0", "end")
+        for row, content in enumerate(rows, top):
+            tags = ("highlight",) if row == self.highlight_row else ()
+            self.text.insert("end", content + "\n", tags)
+        self.text.config(state="disabled")
+        if self.top is None:
+            self.text.see("end")
+
+    def _update_scrollbar(self, first, end, top, bottom):
+        total = end - first
+        if total <= 0:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set((top - first) / total, (bottom - first) / total)
+
+    def _scroll_by(self, rows):
+        first, end = self.row_range()
+        current = max(first, end - self.rows) if self.top is None else self.top
+        self._scroll_to(current + rows, first, end)
+        return "break"
+
+    def _scroll_to(self, top, first, end):
+        # Reaching the newest rows resumes following them
+        if top >= end - self.rows:
+            self.top = None
+        else:
+            self.top = max(first, int(top))
+        self.refresh()
+
+    def _on_scroll(self, action, amount, unit=None):
+        first, end = self.row_range()
+        if action == "moveto":
+            self._scroll_to(first + float(amount) * (end - first), first, end)
+        elif action == "scroll":
+            step = self.rows if unit == "pages" else 1
+            self._scroll_by(int(amount) * step)
+
+    def _on_wheel(self, event):
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_resize(self, event):
+        font = tkfont.Font(font=self.text.cget("font"))
+        rows = max(1, event.height // max(1, font.metrics("linespace")))
+        if rows != self.rows:
+            self.rows = rows
+            self._shown = None
+            self.refresh()
@@ -2,13 +2,15 @@ import tkinter as tk
 from tkinter import ttk
 import time
 from ..config import DEFAULT_GEOMETRY
-from ..core import SerialManager
-from ..i18n import t, get_available_languages, set_language
+from ..core import DeviceHub, SerialManager, get_latency_tracker
+from ..i18n import t, get_available_languages, set_language, get_config_manager
+from ..utils import SessionProfiler, get_line_parser
 from ..utils.signal_handler import SignalHandler
 from .config_tab import ConfigTab
 from .data_tab import DataTab
 from .graph_tab import GraphTab
 from .osc_tab import OscTab
+from .histogram_tab import HistogramTab
 
 
 class MainWindow:
@@ -23,6 +25,8 @@ class MainWindow:
 
         self.root.protocol("WM_DELETE_WINDOW", self._on_window_close)
 
+        self.profiler = SessionProfiler()
+
         self._setup_serial_manager()
         self._create_menu()
         self._create_tabs()
@@ -32,6 +36,11 @@ class MainWindow:
         self.serial_manager = SerialManager(
             data_callback=self._on_data_received, error_callback=self._on_error
         )
+        self.device_hub = DeviceHub(
+            data_callback=self._on_data_received,
+            error_callback=self._on_error,
+            layout_callback=self._on_device_layout,
+        )
 
     def _create_menu(self):
         menubar = tk.Menu(self.root)
@@ -58,9 +67,29 @@ class MainWindow:
             label=t("ui.main_window.osc_tab_shortcut"),
             command=lambda: self._switch_to_tab(3),
         )
+        self.view_menu.add_command(
+            label=t("ui.main_window.histogram_tab_shortcut"),
+            command=lambda: self._switch_to_tab(4),
+        )
 
         self.view_menu.add_separator()
 
+        self.latency_hud_var = tk.BooleanVar(
+            value=get_config_manager().load_setting("view.latency_hud", False)
+        )
+        self.view_menu.add_checkbutton(
+            label=t("ui.main_window.latency_hud_shortcut"),
+            variable=self.latency_hud_var,
+            command=self._apply_latency_hud,
+        )
+
+        self.profiler_var = tk.BooleanVar(value=False)
+        self.view_menu.add_checkbutton(
+            label=t("ui.main_window.profiler_shortcut"),
+            variable=self.profiler_var,
+            command=self._apply_profiler,
+        )
+
         self.language_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Language", menu=self.language_menu)
 
@@ -102,11 +131,17 @@ class MainWindow:
         self.tab_control = ttk.Notebook(self.root)
 
         self.config_tab = ConfigTab(
-            self.tab_control, self.serial_manager, self.signal_handler
+            self.tab_control,
+            self.serial_manager,
+            self.signal_handler,
+            device_hub=self.device_hub,
         )
         self.data_tab = DataTab(self.tab_control)
         self.graph_tab = GraphTab(self.tab_control, self.data_tab, None)
         self.osc_tab = OscTab(self.tab_control, self.data_tab)
+        self.histogram_tab = HistogramTab(self.tab_control, self.data_tab)
+
+        get_line_parser().detect_callback = self._on_line_format_detected
 
         self.tab_control.add(
             self.config_tab.get_frame(), text=t("ui.tabs.configuration")
@@ -114,13 +149,78 @@ class MainWindow:
         self.tab_control.add(self.data_tab.get_frame(), text=t("ui.tabs.data"))
         self.tab_control.add(self.graph_tab.get_frame(), text=t("ui.tabs.graph"))
         self.tab_control.add(self.osc_tab.get_frame(), text=t("ui.tabs.oscilloscope"))
+        self.tab_control.add(
+            self.histogram_tab.get_frame(), text=t("ui.tabs.histogram")
+        )
 
         self.tab_control.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         self.tab_control.pack(expand=1, fill="both")
 
+        self._apply_latency_hud()
         self._update_active_tab()
 
+    def _toggle_latency_hud(self):
+        self.latency_hud_var.set(not self.latency_hud_var.get())
+        self._apply_latency_hud()
+
+    def _apply_latency_hud(self):
+        """Enable stage timing and the overlay on the graph and oscilloscope tabs."""
+        enabled = self.latency_hud_var.get()
+        get_config_manager().save_setting("view.latency_hud", enabled)
+
+        tracker = get_latency_tracker()
+        tracker.enabled = enabled
+        if not enabled:
+            tracker.reset()
+
+        self.graph_tab.set_latency_hud(enabled)
+        self.osc_tab.set_latency_hud(enabled)
+        self.histogram_tab.set_latency_hud(enabled)
+
+    def _toggle_profiler(self):
+        self.profiler_var.set(not self.profiler_var.get())
+        self._apply_profiler()
+
+    def _apply_profiler(self):
+        """Start or stop cProfile/tracemalloc sampling and report to the Data tab."""
+        try:
+            if self.profiler_var.get():
+                self.profiler.start()
+                self.data_tab.add_message(t("ui.profiler.started"))
+            else:
+                summary = self.profiler.stop()
+                if summary:
+                    self._report_profile(summary)
+        except Exception as e:
+            self.profiler_var.set(self.profiler.is_running)
+            self.data_tab.add_message(t("ui.profiler.error", error=str(e)))
+
+    def _report_profile(self, summary):
+        self.data_tab.add_message(
+            t(
+                "ui.profiler.stopped",
+                seconds=f"{summary['seconds']:.1f}",
+                prof=summary["prof_path"],
+                report=summary["report_path"],
+            )
+        )
+        if summary["top_function"]:
+            function, seconds = summary["top_function"]
+            self.data_tab.add_message(
+                t(
+                    "ui.profiler.top_function",
+                    function=function,
+                    seconds=f"{seconds:.3f}",
+                )
+            )
+        self.data_tab.add_message(
+            t(
+                "ui.profiler.peak_memory",
+                peak=f"{summary['peak_bytes'] / 1024 / 1024:.2f}",
+            )
+        )
+
     def _on_tab_changed(self, event):
         """Handle tab change for rendering optimization."""
         self._update_active_tab()
@@ -134,6 +234,8 @@ class MainWindow:
                 self.graph_tab.set_tab_active(False)
             if hasattr(self.osc_tab, "set_tab_active"):
                 self.osc_tab.set_tab_active(False)
+            self.histogram_tab.set_tab_active(False)
+            self.data_tab.set_tab_active(active_tab_index == 1)
 
             if active_tab_index == 2:
                 if hasattr(self.graph_tab, "set_tab_active"):
@@ -141,16 +243,35 @@ class MainWindow:
             elif active_tab_index == 3:
                 if hasattr(self.osc_tab, "set_tab_active"):
                     self.osc_tab.set_tab_active(True)
+            elif active_tab_index == 4:
+                self.histogram_tab.set_tab_active(True)
 
         except:
             pass
 
-    def _on_data_received(self, line):
-        self.data_tab.add_data(line)
+    def _on_data_received(self, line, arrival_time=None):
+        self.data_tab.add_data(line, arrival_time)
 
     def _on_error(self, error_message):
         self.data_tab.add_message(error_message)
 
+    def _on_line_format_detected(self, name):
+        self.data_tab.add_message(
+            t(
+                "ui.data_tab.line_format_detected",
+                format=t(f"ui.config_tab.line_formats.{name}"),
+            )
+        )
+
+    def _on_device_layout(self, layout):
+        columns = [
+            t("ui.config_tab.merged_device_columns", first=first, last=last, port=port)
+            for first, last, port in layout
+        ]
+        self.data_tab.add_message(
+            t("ui.config_tab.merged_layout", columns=", ".join(columns))
+        )
+
     def run(self):
         import time
 
@@ -167,15 +288,27 @@ class MainWindow:
         finally:
             self._running = False
 
+            if self.profiler.is_running:
+                self.profiler.stop()
+
+            if hasattr(self, "config_tab"):
+                self.config_tab.cleanup()
+
             if hasattr(self, "data_tab"):
                 self.data_tab.cleanup()
 
             if hasattr(self, "osc_tab"):
                 self.osc_tab.cleanup()
 
+            if hasattr(self, "histogram_tab"):
+                self.histogram_tab.cleanup()
+
             if hasattr(self, "serial_manager"):
                 self.serial_manager.disconnect()
 
+            if hasattr(self, "device_hub"):
+                self.device_hub.disconnect()
+
     def _game_loop(self):
         if not self._running:
             return
@@ -220,11 +353,16 @@ class MainWindow:
         self.root.bind("<Control-2>", lambda e: self._switch_to_tab(1))
         self.root.bind("<Control-3>", lambda e: self._switch_to_tab(2))
         self.root.bind("<Control-4>", lambda e: self._switch_to_tab(3))
+        self.root.bind("<Control-5>", lambda e: self._switch_to_tab(4))
 
         self.root.bind("<Control-Key-1>", lambda e: self._switch_to_tab(0))
         self.root.bind("<Control-Key-2>", lambda e: self._switch_to_tab(1))
         self.root.bind("<Control-Key-3>", lambda e: self._switch_to_tab(2))
         self.root.bind("<Control-Key-4>", lambda e: self._switch_to_tab(3))
+        self.root.bind("<Control-Key-5>", lambda e: self._switch_to_tab(4))
+
+        self.root.bind("<Control-l>", lambda e: self._toggle_latency_hud())
+        self.root.bind("<Control-p>", lambda e: self._toggle_profiler())
 
         self.root.focus_set()
         self.root.focus_force()
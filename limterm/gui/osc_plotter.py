@@ -4,8 +4,11 @@ Oscilloscope plotting and visualization utilities.
 This module provides plotting functionality for the oscilloscope tab.
 """
 
+import numpy as np
+from ..core.autoscale import AutoScale, SweepExtents
 from ..i18n import t
 from ..matplotlib_optimizations import get_optimized_figure_params
+from ..utils import DataParser
 import matplotlib.pyplot as plt
 
 
@@ -31,6 +34,11 @@ class OscPlotter:
         self.capture_sets = []
         self.current_set_index = 0
 
+        # Bounds are kept per stored sweep; the axes follow them with hysteresis
+        self.extents = SweepExtents(self.set_buffer_size)
+        self.x_scale = AutoScale(margin=0.05, min_margin=1)
+        self.y_scale = AutoScale(margin=0.1, min_margin=0.1)
+
     def plot_realtime_data(self, trigger_data):
         """Plot captured data during real-time capture using optimized blitting."""
         if not trigger_data or not hasattr(self, "graph_manager"):
@@ -78,6 +86,7 @@ class OscPlotter:
             self.capture_sets.append(None)
 
         self.capture_sets[self.current_set_index] = (x_data, y_data)
+        self.extents.set(self.current_set_index, x_data, y_data)
 
         self.current_set_index = (self.current_set_index + 1) % self.set_buffer_size
 
@@ -120,14 +129,9 @@ class OscPlotter:
         """Add static elements like trigger level line and labels."""
         trigger_level = float(self.trigger_level.get_value())
 
-        all_x = []
-        for capture_set in self.capture_sets:
-            if capture_set is not None:
-                x_data, _ = capture_set
-                all_x.extend(x_data)
-
-        if all_x:
-            min_x, max_x = min(all_x), max(all_x)
+        x_bounds = self.extents.x_bounds()
+        if x_bounds:
+            min_x, max_x = x_bounds
         else:
             min_x, max_x = 0, int(self.window_size.get_value())
 
@@ -147,36 +151,23 @@ class OscPlotter:
         self.graph_manager.ax.grid(True, alpha=1.0, linewidth=0.5, color="lightgray")
 
     def _update_axis_limits(self):
-        """Update axis limits to fit all buffered data automatically with optimized calculations."""
-        all_x = []
-        all_y = []
-
-        for capture_set in self.capture_sets:
-            if capture_set is not None:
-                x_data, y_data = capture_set
-                all_x.extend(x_data)
-                all_y.extend(y_data)
-
-        if not all_x or not all_y:
+        """Fit the axes to the buffered sweeps from their stored bounds."""
+        x_bounds = self.extents.x_bounds()
+        y_bounds = self.extents.y_bounds()
+        if not x_bounds or not y_bounds:
             self.graph_manager.ax.set_xlim(0, int(self.window_size.get_value()))
             return
 
-        min_x, max_x = min(all_x), max(all_x)
-        min_y, max_y = min(all_y), max(all_y)
-
-        x_range = max_x - min_x
-        y_range = max_y - min_y
-
-        x_margin = max(1, x_range * 0.05)
-        y_margin = max(0.1, y_range * 0.1)
-
-        self.graph_manager.ax.set_xlim(min_x - x_margin, max_x + x_margin)
-        self.graph_manager.ax.set_ylim(min_y - y_margin, max_y + y_margin)
+        self.graph_manager.ax.set_xlim(*self.x_scale.update(*x_bounds))
+        self.graph_manager.ax.set_ylim(*self.y_scale.update(*y_bounds))
 
     def clear_all_data(self):
         """Clear all plotting data and reset for new session."""
         self.capture_sets = []
         self.current_set_index = 0
+        self.extents.reset()
+        self.x_scale.reset()
+        self.y_scale.reset()
         self.data_line = None
         self.trigger_level_line = None
         self.trigger_point_line = None
@@ -187,17 +178,10 @@ class OscPlotter:
             self.graph_manager.clear()
 
     def _extract_plot_data(self, trigger_data, trigger_col):
-        """Extract X and Y data from trigger data for plotting."""
-        x_data = []
-        y_data = []
-
-        for i, line in enumerate(trigger_data):
-            try:
-                values = line.split()
-                if trigger_col < len(values):
-                    x_data.append(i)
-                    y_data.append(float(values[trigger_col]))
-            except (ValueError, IndexError):
-                continue
-
-        return x_data, y_data
+        """Extract X and Y data from trigger data for plotting, with one parse."""
+        values = DataParser.parse_lines(trigger_data)
+        if values.ndim != 2 or values.shape[1] <= trigger_col:
+            return [], []
+        column = values[:, trigger_col]
+        valid = ~np.isnan(column)
+        return np.flatnonzero(valid).tolist(), column[valid].tolist()
@@ -8,12 +8,25 @@ from tkinter import ttk
 import time
 import os
 import logging
-from ..core import GraphManager
+import numpy as np
+from ..core import ExportJob, GraphManager, get_latency_tracker, get_metrics
+from ..core.autoscale import column_bounds, combine_bounds, data_bounds
+from ..core.spectrum import Spectrogram, SpectrumWorker
 from ..i18n import t, get_config_manager
+from .export_window import ExportWindow, ask_export_path
 from .preference_widgets import PrefEntry, PrefCombobox
+from .osc_trigger import (
+    extract_recent_rows,
+    extract_recent_values,
+    find_trigger_windows,
+)
 
 logger = logging.getLogger(__name__)
 
+TRIGGER_LOOKBACK = 200
+WATERFALL_RANGE_DB = 80
+CHANNEL_COLORS = ("#1760ff", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b")
+
 
 class OscTab:
     """Oscilloscope-inspired data capture and visualization tab."""
@@ -25,6 +38,8 @@ class OscTab:
 
         self.is_armed = False
         self.trigger_sets = []
+        # (lows, highs) per channel of each entry of trigger_sets
+        self.sweep_bounds = []
         self.max_sets = 4  # Keep only up to 4 sets as requested
 
         self.update_interval_ms = 33  # 1/30 seconds = ~33ms for direct updates
@@ -33,6 +48,21 @@ class OscTab:
         # For tracking incomplete (most recent) set
         self.most_recent_trigger_idx = None
         self.current_values = []
+        self._last_trigger_position = -1
+        # Lines received and settings when the last sweep frame was drawn
+        self._frame_key = None
+
+        # Each sweep is a (samples, channels) array of the displayed columns
+        self.channels = []
+
+        # Spectrum view: sweeps are computed on the worker thread and only
+        # the result line is updated here
+        self.spectrum_worker = SpectrumWorker()
+        self._spectrum_line = None
+        self._spectrum_position = None
+        self._spectrogram = None
+        self._waterfall_image = None
+        self._waterfall_position = None
 
         self._create_widgets()
         self._start_update_loop()
@@ -58,6 +88,26 @@ class OscTab:
         )
         self.status_label.pack(side="left")
 
+        self.display_mode = PrefCombobox(
+            controls_right,
+            pref_key="osc.display.mode",
+            default_value="time",
+            state="readonly",
+            values=[
+                t("ui.osc_tab.display_modes.time"),
+                t("ui.osc_tab.display_modes.spectrum"),
+                t("ui.osc_tab.display_modes.waterfall"),
+            ],
+            value_mapping={
+                t("ui.osc_tab.display_modes.time"): "time",
+                t("ui.osc_tab.display_modes.spectrum"): "spectrum",
+                t("ui.osc_tab.display_modes.waterfall"): "waterfall",
+            },
+            width=12,
+            on_change=self._reset_spectrum,
+        )
+        self.display_mode.pack(side="left", padx=(0, 10))
+
         self.settings_button = ttk.Button(
             controls_right,
             text=t("ui.osc_tab.show_settings"),
@@ -176,9 +226,36 @@ class OscTab:
         )
         self.window_size.grid(column=1, row=0, padx=5, pady=2)
 
+        ttk.Label(capture_frame, text=t("ui.osc_tab.channels")).grid(
+            column=0, row=1, padx=5, pady=2, sticky="w"
+        )
+        self.channels_entry = PrefEntry(
+            capture_frame,
+            pref_key="osc.capture.channels",
+            default_value="",
+            width=12,
+            on_change=self._clear_display,
+        )
+        self.channels_entry.grid(column=1, row=1, padx=5, pady=2)
+
+        ttk.Label(capture_frame, text=t("ui.osc_tab.offsets")).grid(
+            column=0, row=2, padx=5, pady=2, sticky="w"
+        )
+        self.offsets_entry = PrefEntry(
+            capture_frame,
+            pref_key="osc.capture.offsets",
+            default_value="",
+            width=12,
+        )
+        self.offsets_entry.grid(column=1, row=2, padx=5, pady=2)
+
+        ttk.Label(
+            capture_frame, text=t("ui.osc_tab.channels_hint"), foreground="gray"
+        ).grid(column=0, row=3, columnspan=2, padx=5, sticky="w")
+
         save_controls_frame = ttk.Frame(capture_frame)
         save_controls_frame.grid(
-            column=0, row=1, columnspan=2, padx=5, pady=5, sticky="ew"
+            column=0, row=4, columnspan=2, padx=5, pady=5, sticky="ew"
         )
 
         self.save_png_button = ttk.Button(
@@ -196,8 +273,102 @@ class OscTab:
         )
         self.clear_button.pack(side="left", padx=2)
 
+        self._create_spectrum_widgets(settings_container)
+
         settings_container.columnconfigure(0, weight=1)
         settings_container.columnconfigure(1, weight=1)
+        settings_container.columnconfigure(2, weight=1)
+
+    def _create_spectrum_widgets(self, settings_container):
+        spectrum_frame = ttk.LabelFrame(
+            settings_container, text=t("ui.osc_tab.spectrum")
+        )
+        spectrum_frame.grid(column=2, row=0, padx=(5, 0), pady=5, sticky="new")
+
+        def add_combobox(row, label, pref_key, default_value, options):
+            ttk.Label(spectrum_frame, text=t(label)).grid(
+                column=0, row=row, padx=5, pady=2, sticky="w"
+            )
+            combobox = PrefCombobox(
+                spectrum_frame,
+                pref_key=pref_key,
+                default_value=default_value,
+                state="readonly",
+                values=[t(text) for text in options.values()],
+                value_mapping={t(text): value for value, text in options.items()},
+                width=10,
+                on_change=self._reset_spectrum,
+            )
+            combobox.grid(column=1, row=row, padx=5, pady=2)
+            return combobox
+
+        def add_entry(row, label, pref_key, default_value):
+            ttk.Label(spectrum_frame, text=t(label)).grid(
+                column=0, row=row, padx=5, pady=2, sticky="w"
+            )
+            entry = PrefEntry(
+                spectrum_frame,
+                pref_key=pref_key,
+                default_value=default_value,
+                width=8,
+                on_change=self._reset_spectrum,
+            )
+            entry.grid(column=1, row=row, padx=5, pady=2)
+            return entry
+
+        self.spectrum_source = add_combobox(
+            0,
+            "ui.osc_tab.spectrum_source",
+            "osc.spectrum.source",
+            "free",
+            {
+                "free": "ui.osc_tab.spectrum_sources.free",
+                "trigger": "ui.osc_tab.spectrum_sources.trigger",
+            },
+        )
+        self.spectrum_window = add_combobox(
+            1,
+            "ui.osc_tab.spectrum_window",
+            "osc.spectrum.window",
+            "hann",
+            {
+                "hann": "ui.osc_tab.spectrum_windows.hann",
+                "hamming": "ui.osc_tab.spectrum_windows.hamming",
+                "flattop": "ui.osc_tab.spectrum_windows.flattop",
+                "rectangular": "ui.osc_tab.spectrum_windows.rectangular",
+            },
+        )
+        self.spectrum_averaging = add_combobox(
+            2,
+            "ui.osc_tab.spectrum_averaging",
+            "osc.spectrum.averaging",
+            "linear",
+            {
+                "none": "ui.osc_tab.spectrum_averaging_modes.none",
+                "linear": "ui.osc_tab.spectrum_averaging_modes.linear",
+                "rms": "ui.osc_tab.spectrum_averaging_modes.rms",
+                "peak": "ui.osc_tab.spectrum_averaging_modes.peak",
+            },
+        )
+        self.spectrum_scale = add_combobox(
+            3,
+            "ui.osc_tab.spectrum_scale",
+            "osc.spectrum.scale",
+            "db",
+            {
+                "db": "ui.osc_tab.spectrum_scales.db",
+                "linear": "ui.osc_tab.spectrum_scales.linear",
+            },
+        )
+        self.spectrum_averages = add_entry(
+            4, "ui.osc_tab.spectrum_averages", "osc.spectrum.averages", "8"
+        )
+        self.spectrum_block = add_entry(
+            5, "ui.osc_tab.spectrum_block", "osc.spectrum.block_size", "1024"
+        )
+        self.spectrum_rate = add_entry(
+            6, "ui.osc_tab.spectrum_rate", "osc.spectrum.sample_rate", ""
+        )
 
     def _toggle_settings(self):
         """Toggle the visibility of the settings frame."""
@@ -221,9 +392,26 @@ class OscTab:
 
         try:
             # Always process and plot every 1/30s when armed
-            if self.is_armed:
+            display_mode = self.display_mode.get_value()
+            if self.is_armed and display_mode == "spectrum":
+                self._process_spectrum()
+            elif self.is_armed and display_mode == "waterfall":
+                self._process_waterfall()
+            elif self.is_armed and self._frame_key != self._current_frame_key():
+                # Frames are drawn only when new lines or setting changes arrived
+                self._frame_key = self._current_frame_key()
+                frame_start = time.perf_counter()
                 self._process_data_directly()
                 self._plot_sets()  # Always plot after processing
+                get_latency_tracker().record_frame(
+                    "osc",
+                    frame_start,
+                    self.graph_manager,
+                    self.data_tab.last_arrival_time,
+                )
+                get_metrics().observe(
+                    "render", time.perf_counter() - frame_start, tab="osc"
+                )
 
             # Schedule next update
             self.update_timer_id = self.frame.after(
@@ -232,12 +420,23 @@ class OscTab:
         except tk.TclError:
             self.is_armed = False
 
+    def _current_frame_key(self):
+        return (
+            self.data_tab.lines_total,
+            self.trigger_source.get_value(),
+            self.trigger_level.get_value(),
+            self.trigger_edge.get_value(),
+            self.window_size.get_value(),
+            self.channels_entry.get_value(),
+            self.offsets_entry.get_value(),
+        )
+
     def _process_data_directly(self):
         """Simple direct processing: read buffer, find triggers, manage complete and incomplete sets."""
         try:
-            # Read buffer
-            data_lines = self.data_tab.get_data()
-            if not data_lines or len(data_lines) < 10:
+            # Parsed rows of the recent lines, shared with the other tabs
+            recent_rows, end = self.data_tab.get_values_with_end(TRIGGER_LOOKBACK)
+            if len(recent_rows) < 10:
                 return
 
             # Get settings
@@ -249,92 +448,333 @@ class OscTab:
             except (ValueError, AttributeError):
                 return
 
-            # Extract values from recent data
-            values = []
-            for line in reversed(data_lines[-200:]):  # Look at recent data only
-                try:
-                    parts = line.strip().split()
-                    if len(parts) > column:
-                        value = float(parts[column])
-                        values.append(value)
-                except (ValueError, IndexError):
-                    continue
+            channels = self._get_channels(column)
+            trigger_values, channel_values, row_indices = extract_recent_rows(
+                recent_rows, column, channels
+            )
+            values = trigger_values.tolist()
+            # Line number of each kept row, from the same read as the rows
+            positions = row_indices + (end - len(recent_rows))
 
             if len(values) < window_size + 5:  # Need enough data for trigger detection
                 return
 
-            values.reverse()  # Back to chronological order
-
             # Find triggers and separate complete/incomplete sets
-            complete_sets = []
-            most_recent_trigger_idx = None
-
-            i = 1
-            while i < len(values) - 1:  # Look through all data
-                # Check for trigger condition
-                triggered = False
-                if (
-                    trigger_edge == "rising"
-                    and values[i - 1] <= trigger_level < values[i]
-                ):
-                    triggered = True
-                elif (
-                    trigger_edge == "falling"
-                    and values[i - 1] >= trigger_level > values[i]
-                ):
-                    triggered = True
-                elif trigger_edge == "both" and (
-                    (values[i - 1] <= trigger_level < values[i])
-                    or (values[i - 1] >= trigger_level > values[i])
-                ):
-                    triggered = True
-
-                if triggered:
-                    most_recent_trigger_idx = i  # Track the most recent trigger
-
-                    # Check if we can create a complete set
-                    if i + window_size <= len(values):
-                        # Complete set available
-                        window_data = values[i : i + window_size]
-                        complete_sets.append(window_data)
-                        i += (
-                            window_size // 2
-                        )  # Skip ahead to avoid overlapping triggers
-                    else:
-                        # This trigger is too close to the end - it will be the incomplete set
-                        break
-                else:
-                    i += 1
+            trigger_indices, most_recent_trigger_idx = find_trigger_windows(
+                values, trigger_level, trigger_edge, window_size
+            )
+            # Sweeps already captured in an earlier scan are not added again
+            new_indices = self._count_new_triggers(trigger_indices, positions)
+            complete_sets = [
+                channel_values[i : i + window_size].copy() for i in new_indices
+            ]
+            if channels != self.channels:
+                # Sweeps of a different channel set cannot be drawn together
+                self._clear_sweeps()
+                self.channels = channels
 
             # Update complete sets (keep only most recent ones)
             if complete_sets:
                 self.trigger_sets.extend(complete_sets)
+                # Bounds are taken once per sweep, not on every frame
+                self.sweep_bounds.extend(column_bounds(s) for s in complete_sets)
                 # Keep only most recent complete sets (leave room for incomplete set)
                 if len(self.trigger_sets) > self.max_sets - 1:
                     self.trigger_sets = self.trigger_sets[-(self.max_sets - 1) :]
+                    self.sweep_bounds = self.sweep_bounds[-(self.max_sets - 1) :]
 
             # Store the incomplete set info for plotting
             self.most_recent_trigger_idx = most_recent_trigger_idx
-            self.current_values = values
+            self.current_values = channel_values
 
         except Exception as e:
             logger.error(f"Error in direct data processing: {e}")
 
+    def _count_new_triggers(self, trigger_indices, positions):
+        """Count triggers not seen in earlier scans of the same recent lines.
+
+        `positions` holds the line number of each value scanned. Returns the
+        indices of the new triggers.
+        """
+        new_indices = [
+            i for i in trigger_indices if positions[i] > self._last_trigger_position
+        ]
+        if new_indices:
+            get_metrics().inc("osc_triggers_total", len(new_indices))
+            self._last_trigger_position = int(positions[new_indices[-1]])
+        return new_indices
+
+    def _reset_spectrum(self, event=None):
+        """Restart averaging and rebuild the plot after a setting change."""
+        self._frame_key = None
+        self.spectrum_worker.reset()
+        self._spectrum_line = None
+        self._spectrum_position = None
+        self._spectrogram = None
+        self._waterfall_image = None
+        self._waterfall_position = None
+        if self.is_armed and self._is_widget_valid("status_label"):
+            self.status_label.config(text=t("ui.osc_tab.armed"), foreground="orange")
+
+    def _estimate_sample_rate(self, count):
+        """Sample rate from the entry, or from line arrival times when blank."""
+        try:
+            rate = float(self.spectrum_rate.get_value())
+            if rate > 0:
+                return rate
+        except ValueError:
+            pass
+
+        arrival_times = self.data_tab.arrival_times
+        count = min(count, len(arrival_times))
+        if count > 1:
+            elapsed = arrival_times[-1] - arrival_times[-count]
+            if elapsed > 0:
+                return (count - 1) / elapsed
+        return 1.0
+
+    def _process_spectrum(self):
+        """Queue new sample blocks for the worker and draw the newest spectrum."""
+        try:
+            column = int(self.trigger_source.get_value())
+            averages = max(1, int(self.spectrum_averages.get_value()))
+            block_size = max(8, int(self.spectrum_block.get_value()))
+        except (ValueError, AttributeError):
+            return
+
+        options = {
+            "window": self.spectrum_window.get_value(),
+            "averaging": self.spectrum_averaging.get_value(),
+            "averages": averages,
+            "scale": self.spectrum_scale.get_value(),
+        }
+        lines_total = self.data_tab.lines_total
+
+        if self.spectrum_source.get_value() == "trigger":
+            # One sweep per newly completed trigger window
+            try:
+                trigger_level = float(self.trigger_level.get_value())
+                window_size = int(self.window_size.get_value())
+            except ValueError:
+                return
+            recent_rows, end = self.data_tab.get_values_with_end(
+                max(TRIGGER_LOOKBACK, window_size * 4)
+            )
+            trigger_values, _, row_indices = extract_recent_rows(
+                recent_rows, column, []
+            )
+            values = trigger_values.tolist()
+            positions = row_indices + (end - len(recent_rows))
+            trigger_indices, _ = find_trigger_windows(
+                values, trigger_level, self.trigger_edge.get_value(), window_size
+            )
+            rate = self._estimate_sample_rate(len(values))
+            for i in self._count_new_triggers(trigger_indices, positions):
+                self.spectrum_worker.submit(
+                    values[i : i + window_size], rate, **options
+                )
+        elif (
+            self._spectrum_position is None
+            or lines_total - self._spectrum_position >= block_size // 2
+        ):
+            # Free-running blocks overlap by half, as usual for Hann windows
+            values = extract_recent_values(self.data_tab.get_values(block_size), column)
+            if len(values) >= 8:
+                self._spectrum_position = lines_total
+                self.spectrum_worker.submit(
+                    values, self._estimate_sample_rate(block_size), **options
+                )
+
+        result = self.spectrum_worker.result()
+        if result is not None:
+            frame_start = time.perf_counter()
+            self._plot_spectrum(*result, scale=options["scale"])
+            get_latency_tracker().record_frame(
+                "osc", frame_start, self.graph_manager, self.data_tab.last_arrival_time
+            )
+            get_metrics().observe(
+                "render", time.perf_counter() - frame_start, tab="osc"
+            )
+
+    def _process_waterfall(self):
+        """Feed samples that arrived since the last frame to the spectrogram.
+
+        Samples come from the parsed history, so no text is parsed again.
+        """
+        try:
+            column = int(self.trigger_source.get_value())
+            block_size = max(8, int(self.spectrum_block.get_value()))
+        except (ValueError, AttributeError):
+            return
+
+        history = self.data_tab.history
+        total = history.total
+        if self._spectrogram is None:
+            self._spectrogram = Spectrogram(
+                block_size, window=self.spectrum_window.get_value()
+            )
+            self._waterfall_position = max(0, total - block_size)
+        spectrogram = self._spectrogram
+
+        # Catching up never needs more than one full image of samples
+        backlog = min(
+            spectrogram.columns * spectrogram.hop + block_size, history.raw_capacity
+        )
+        start = max(self._waterfall_position, total - backlog)
+        self._waterfall_position = total
+        if total <= start:
+            return
+        level, _, values = history.query(start, total, total - start)
+        if level != 0 or values.shape[2] <= column:
+            return
+        if not spectrogram.feed(values[0, :, column]):
+            return
+
+        frame_start = time.perf_counter()
+        self._plot_waterfall(spectrogram)
+        get_latency_tracker().record_frame(
+            "osc", frame_start, self.graph_manager, self.data_tab.last_arrival_time
+        )
+        get_metrics().observe("render", time.perf_counter() - frame_start, tab="osc")
+
+    def _plot_waterfall(self, spectrogram):
+        ax = self.graph_manager.ax
+        image = spectrogram.image()
+        if self._waterfall_image is None or self._waterfall_image not in ax.images:
+            self.graph_manager.clear()
+            self._waterfall_image = ax.imshow(
+                image,
+                aspect="auto",
+                origin="lower",
+                interpolation="nearest",
+                cmap="viridis",
+            )
+            self.graph_manager.set_labels(
+                title=t("ui.osc_tab.waterfall_title"),
+                xlabel=t("ui.osc_tab.time_ago_label"),
+                ylabel=t("ui.osc_tab.frequency_label"),
+            )
+        else:
+            self._waterfall_image.set_data(image)
+
+        rate = self._estimate_sample_rate(spectrogram.block_size)
+        duration = spectrogram.columns * spectrogram.hop / rate
+        self._waterfall_image.set_extent((-duration, 0, 0, rate / 2))
+        # Colours span a fixed dynamic range below the loudest bin on screen
+        finite = image[np.isfinite(image)]
+        if finite.size:
+            top = float(finite.max())
+            self._waterfall_image.set_clim(top - WATERFALL_RANGE_DB, top)
+        self.graph_manager.update()
+
+    def _plot_spectrum(self, frequencies, values, sweeps, scale="db"):
+        ax = self.graph_manager.ax
+        if self._spectrum_line is None or self._spectrum_line not in ax.lines:
+            self.graph_manager.clear()
+            (self._spectrum_line,) = ax.plot([], [], color="#1760ff", linewidth=0.8)
+            ax.grid(True, alpha=1.0, linewidth=0.5, color="lightgray")
+            self.graph_manager.set_labels(
+                title=t("ui.osc_tab.spectrum_title"),
+                xlabel=t("ui.osc_tab.frequency_label"),
+                ylabel=t(
+                    "ui.osc_tab.magnitude_db_label"
+                    if scale == "db"
+                    else "ui.osc_tab.magnitude_label"
+                ),
+            )
+
+        self._spectrum_line.set_data(frequencies, values)
+        ax.relim()
+        ax.autoscale_view()
+
+        # Skip the DC bin when looking for the dominant component
+        if len(values) > 1:
+            peak = int(values[1:].argmax()) + 1
+            self.status_label.config(
+                text=t(
+                    "ui.osc_tab.spectrum_peak",
+                    frequency=f"{frequencies[peak]:.4g}",
+                    value=f"{values[peak]:.4g}",
+                    sweeps=sweeps,
+                )
+            )
+        self.graph_manager.update()
+
+    def _get_channels(self, trigger_column):
+        """Columns to display, in the trigger source numbering; default the trigger."""
+        channels = []
+        for token in self.channels_entry.get_value().replace(",", " ").split():
+            if token.isdigit() and int(token) not in channels:
+                channels.append(int(token))
+        return channels or [trigger_column]
+
+    def _get_offsets(self, count):
+        """Vertical offset per displayed channel; missing entries are 0."""
+        offsets = []
+        for token in self.offsets_entry.get_value().replace(",", " ").split():
+            try:
+                offsets.append(float(token))
+            except ValueError:
+                offsets.append(0.0)
+        return (offsets + [0.0] * count)[:count]
+
+    def _clear_sweeps(self):
+        self.trigger_sets.clear()
+        self.sweep_bounds.clear()
+
+    def _stored_bounds(self, offsets):
+        """Y bounds of the stored sweeps as drawn with `offsets`, or None."""
+        if not self.sweep_bounds:
+            return None
+        lows = np.min([lows for lows, _ in self.sweep_bounds], axis=0) + offsets
+        highs = np.max([highs for _, highs in self.sweep_bounds], axis=0) + offsets
+        drawn = np.isfinite(lows) & np.isfinite(highs)
+        if not drawn.any():
+            return None
+        return float(lows[drawn].min()), float(highs[drawn].max())
+
+    def _plot_channels(self, window_data, offsets, alpha, labels=False):
+        """Plot one sweep, a (samples, channels) array, one color per channel.
+
+        Returns the values as drawn, offsets included.
+        """
+        x_data = list(range(len(window_data)))
+        shifted = window_data + np.asarray(offsets)
+        for index, column in enumerate(self.channels):
+            label = None
+            if labels:
+                label = t("ui.osc_tab.channel_label", column=column)
+                if offsets[index]:
+                    label += f" ({offsets[index]:+g})"
+            self.graph_manager.ax.plot(
+                x_data,
+                shifted[:, index],
+                color=CHANNEL_COLORS[index % len(CHANNEL_COLORS)],
+                marker="o",
+                alpha=alpha,
+                label=label,
+            )
+        return shifted
+
     def _plot_sets(self):
         """Plot all current trigger sets simply and directly: complete sets + incomplete set for real-time."""
         try:
             self.graph_manager.clear()
 
-            # Plot complete sets in blue
+            offsets = self._get_offsets(len(self.channels))
+            shown = []
+
+            # Complete sets are drawn lighter than the live one
             for window_data in self.trigger_sets:
-                x_data = list(range(len(window_data)))
-                self.graph_manager.plot_line(x_data, window_data, color="blue")
+                self._plot_channels(window_data, offsets, alpha=0.5)
 
             # Plot the most recent incomplete set for real-time visualization
             if hasattr(self, "most_recent_trigger_idx") and hasattr(
                 self, "current_values"
             ):
-                if self.most_recent_trigger_idx is not None and self.current_values:
+                if self.most_recent_trigger_idx is not None and len(
+                    self.current_values
+                ):
                     # Get incomplete data from most recent trigger to current point
                     incomplete_data = self.current_values[
                         self.most_recent_trigger_idx :
@@ -349,10 +789,10 @@ class OscTab:
                         pass  # Use full data if can't get window size
 
                     if len(incomplete_data) > 1:  # Only plot if we have meaningful data
-                        x_data = list(range(len(incomplete_data)))
-                        # Plot in cyan to distinguish from complete sets
-                        self.graph_manager.plot_line(
-                            x_data, incomplete_data, color="#1760ff"
+                        shown.append(
+                            self._plot_channels(
+                                incomplete_data, offsets, alpha=1.0, labels=True
+                            )
                         )
 
             # Add trigger level line
@@ -386,9 +826,26 @@ class OscTab:
                 if all_lengths:
                     max_length = max(all_lengths)
                     if max_length > 0:
+                        # Drawn on the trigger channel's offset when it is displayed
+                        column = int(self.trigger_source.get_value())
+                        if column in self.channels:
+                            trigger_level += offsets[self.channels.index(column)]
                         trigger_x = [0, max_length - 1]
                         trigger_y = [trigger_level, trigger_level]
                         self.graph_manager.plot_line(trigger_x, trigger_y, color="red")
+                        shown.append(trigger_y)
+
+            # Stored sweeps add their kept bounds, so only the live sweep and
+            # the trigger line are scanned; hysteresis keeps the axis steady
+            self.graph_manager.autoscale_y_bounds(
+                combine_bounds(self._stored_bounds(offsets), data_bounds(*shown))
+            )
+
+            if (
+                len(self.channels) > 1
+                and self.graph_manager.ax.get_legend_handles_labels()[0]
+            ):
+                self.graph_manager.ax.legend(loc="upper right")
 
             self.graph_manager.set_labels(
                 title=t("ui.osc_tab.oscilloscope_capture_title"),
@@ -425,8 +882,17 @@ class OscTab:
         except tk.TclError:
             return False
 
+    def set_latency_hud(self, enabled):
+        """Show or hide the latency overlay on the oscilloscope plot."""
+        if enabled:
+            self.graph_manager.set_overlay(
+                lambda: get_latency_tracker().format_hud("osc")
+            )
+        else:
+            self.graph_manager.set_overlay(None)
+
     def set_tab_active(self, is_active):
-        """Handle tab activation/deactivation."""
+        """Run the update loop only while visible; showing the tab draws a catch-up frame."""
         self.is_active = is_active
         if not is_active:
             self._stop_update_loop()
@@ -436,10 +902,12 @@ class OscTab:
     def _clear_display(self):
         """Clear the oscilloscope display and accumulated trigger sets."""
         try:
-            self.trigger_sets.clear()
+            self._reset_spectrum()
+            self._clear_sweeps()
             self.most_recent_trigger_idx = None
             self.current_values = []
             if hasattr(self, "graph_manager"):
+                self.graph_manager.y_autoscale.reset()
                 self.graph_manager.clear()
                 self.graph_manager.update()
         except Exception as e:
@@ -479,23 +947,32 @@ class OscTab:
                 os.makedirs(capture_dir)
 
             timestamp = time.strftime("%Y%m%d_%H%M%S")
-            data_filename = os.path.join(capture_dir, f"osc_capture_{timestamp}.txt")
-
-            with open(data_filename, "w", encoding="utf-8") as f:
-                for i, trigger_set in enumerate(self.trigger_sets):
-                    f.write(f"# Trigger Set {i+1}\n")
-                    for j, value in enumerate(trigger_set):
-                        f.write(f"{j}\t{value}\n")
-                    f.write("\n")
+            file_path = ask_export_path(capture_dir, f"osc_capture_{timestamp}.txt")
+            if not file_path:
+                return
 
-            self.data_tab.add_message(
-                t("ui.osc_tab.data_saved", filename=f"osc_capture_{timestamp}.txt")
+            trigger_sets = list(self.trigger_sets)
+            columns = ["set", "sample"] + [f"col{column}" for column in self.channels]
+            job = ExportJob(
+                file_path,
+                self._export_chunks(trigger_sets),
+                sum(len(trigger_set) for trigger_set in trigger_sets),
+                columns=columns,
             )
+            ExportWindow(self.frame, job, self.data_tab.add_message)
 
         except Exception as e:
             logger.error(f"Save data error: {e}")
             self.data_tab.add_message(t("ui.osc_tab.save_error", error=str(e)))
 
+    @staticmethod
+    def _export_chunks(trigger_sets):
+        # One chunk per trigger set: set number, sample index, then the channels
+        for number, trigger_set in enumerate(trigger_sets, 1):
+            rows = np.asarray(trigger_set, dtype=float).reshape(len(trigger_set), -1)
+            samples = np.arange(len(rows))
+            yield np.column_stack([np.full(len(rows), number), samples, rows])
+
     def _toggle_arm(self):
         """Toggle armed state."""
         if self.is_armed:
@@ -509,11 +986,12 @@ class OscTab:
             return
 
         self.is_armed = True
+        self._frame_key = None
 
         trigger_mode = self.trigger_mode.get_value()
         if trigger_mode == "single":
             self.graph_manager.clear()
-            self.trigger_sets.clear()
+            self._clear_sweeps()
             self.most_recent_trigger_idx = None
             self.current_values = []
 
@@ -539,6 +1017,7 @@ class OscTab:
         """Clean up resources."""
         self._stop_update_loop()
         self.is_armed = False
+        self.spectrum_worker.stop()
 
         if hasattr(self, "trigger_sets"):
-            self.trigger_sets.clear()
+            self._clear_sweeps()
@@ -5,9 +5,81 @@ This module provides trigger detection logic for the oscilloscope tab.
 """
 
 import time
+import numpy as np
 from ..i18n import t
 
 
+def edge_crossed(last_value, current_value, trigger_level, trigger_edge):
+    """Return True when the step from last_value to current_value crosses the level."""
+    if trigger_edge == "rising":
+        return last_value <= trigger_level < current_value
+    elif trigger_edge == "falling":
+        return last_value >= trigger_level > current_value
+    elif trigger_edge == "both":
+        return (last_value <= trigger_level < current_value) or (
+            last_value >= trigger_level > current_value
+        )
+    return False
+
+
+def extract_recent_values(values, column):
+    """Numeric values of a column from parsed rows (see DataTab.get_values), oldest first."""
+    if values.ndim != 2 or values.shape[1] <= column:
+        return []
+    column_values = values[:, column]
+    return column_values[~np.isnan(column_values)].tolist()
+
+
+def extract_recent_rows(values, trigger_column, columns):
+    """
+    Split parsed rows into (trigger_values, channel_values, row_indices).
+
+    trigger_values holds the trigger column and channel_values one column per
+    entry of `columns` (NaN where a line has no such column), both keeping
+    only the rows where the trigger column is numeric so they stay aligned.
+    row_indices gives the index in `values` of each row kept.
+    """
+    if values.ndim != 2 or values.shape[1] <= trigger_column:
+        return np.empty(0), np.empty((0, len(columns))), np.empty(0, dtype=np.int64)
+    row_indices = np.flatnonzero(~np.isnan(values[:, trigger_column]))
+    rows = values[row_indices]
+
+    channel_values = np.full((len(rows), len(columns)), np.nan)
+    for index, column in enumerate(columns):
+        if 0 <= column < rows.shape[1]:
+            channel_values[:, index] = rows[:, column]
+    return rows[:, trigger_column], channel_values, row_indices
+
+
+def find_trigger_windows(values, trigger_level, trigger_edge, window_size):
+    """
+    Scan values for trigger events.
+
+    Returns a tuple (trigger_indices, most_recent_trigger_idx): every trigger
+    with a full window after it contributes its start index, and the scan
+    stops at the first trigger too close to the end, which becomes the
+    incomplete set.
+    """
+    trigger_indices = []
+    most_recent_trigger_idx = None
+
+    i = 1
+    while i < len(values) - 1:
+        if edge_crossed(values[i - 1], values[i], trigger_level, trigger_edge):
+            most_recent_trigger_idx = i
+
+            if i + window_size <= len(values):
+                trigger_indices.append(i)
+                # Skip ahead to avoid overlapping triggers
+                i += window_size // 2
+            else:
+                break
+        else:
+            i += 1
+
+    return trigger_indices, most_recent_trigger_idx
+
+
 class OscTrigger:
     """Handles oscilloscope trigger detection and logic."""
 
@@ -45,19 +117,19 @@ class OscTrigger:
             return False
 
         try:
-            data_lines = self.data_tab.get_data()
-            if not data_lines:
+            values = self.data_tab.get_values(1)
+            if not len(values):
                 return False
 
             trigger_col = int(self.trigger_source.get_value()) - 1
             trigger_level = float(self.trigger_level.get_value())
             trigger_edge = self.trigger_edge.get_value()
 
-            latest_line = data_lines[-1]
             try:
-                values = latest_line.split()
-                if trigger_col < len(values):
-                    current_value = float(values[trigger_col])
+                if trigger_col < values.shape[1] and not np.isnan(
+                    values[-1, trigger_col]
+                ):
+                    current_value = float(values[-1, trigger_col])
 
                     if self.last_sample_value is not None:
                         triggered = self._check_edge_condition(
@@ -68,7 +140,7 @@ class OscTrigger:
                         )
 
                         if triggered and not self.is_triggered:
-                            self._trigger_detected(data_lines)
+                            self._trigger_detected(len(self.data_tab.data_buffer))
                             return True
 
                     self.last_sample_value = current_value
@@ -85,20 +157,12 @@ class OscTrigger:
         self, last_value, current_value, trigger_level, trigger_edge
     ):
         """Check if edge condition is met."""
-        if trigger_edge == "rising":
-            return last_value <= trigger_level < current_value
-        elif trigger_edge == "falling":
-            return last_value >= trigger_level > current_value
-        elif trigger_edge == "both":
-            return (last_value <= trigger_level < current_value) or (
-                last_value >= trigger_level > current_value
-            )
-        return False
+        return edge_crossed(last_value, current_value, trigger_level, trigger_edge)
 
-    def _trigger_detected(self, data_lines):
+    def _trigger_detected(self, buffer_length):
         """Handle trigger detection."""
         self.is_triggered = True
-        self.trigger_point_index = len(data_lines)
+        self.trigger_point_index = buffer_length
 
     def get_trigger_point_index(self):
         """Get the index where trigger was detected."""
@@ -7,10 +7,10 @@ expensive rendering features while maintaining visual quality.
 import matplotlib
 
 
-def configure_matplotlib_performance():
+def configure_matplotlib_performance(backend="TkAgg"):
     """Configure matplotlib for optimal performance."""
 
-    matplotlib.use("TkAgg")
+    matplotlib.use(backend)
 
     matplotlib.rcParams["lines.antialiased"] = False
     matplotlib.rcParams["patch.antialiased"] = False
@@ -1,11 +1,27 @@
 from .serial_utils import SerialPortManager, DataParser
+from .line_parsers import LineParser, ParserSelector, get_line_parser
+from .derived_channels import (
+    DerivedChannel,
+    DerivedChannels,
+    get_derived_channels,
+    is_expression,
+)
 from .file_utils import FileManager
 from .mock_serial import MockSerial, SyntheticDataGenerator
+from .profiler import SessionProfiler
 
 __all__ = [
     "SerialPortManager",
     "DataParser",
+    "LineParser",
+    "ParserSelector",
+    "get_line_parser",
+    "DerivedChannel",
+    "DerivedChannels",
+    "get_derived_channels",
+    "is_expression",
     "FileManager",
     "MockSerial",
     "SyntheticDataGenerator",
+    "SessionProfiler",
 ]
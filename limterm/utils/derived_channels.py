@@ -0,0 +1,127 @@
+"""
+Derived channels: expressions over parsed columns, for example "c3*c4/1000".
+
+Columns are named c1, c2, ... with the same 1-based numbering as the column
+entries. An expression is parsed once with asteval, the safe interpreter
+synthetic mode uses, and then evaluated over whole NumPy column arrays
+instead of line by line.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+import numpy as np
+from asteval import Interpreter
+
+COLUMN_PATTERN = re.compile(r"\bc(\d+)\b")
+CACHE_SIZE = 32
+
+
+def is_expression(text):
+    """True when a series entry holds an expression rather than a column number."""
+    text = text.strip()
+    return bool(text) and not text.isdigit()
+
+
+class DerivedChannel:
+    def __init__(self, expression):
+        self.expression = expression.strip()
+        self.columns = sorted(
+            {int(number) for number in COLUMN_PATTERN.findall(self.expression)}
+        )
+        self._interpreter = Interpreter()
+        try:
+            self._node = self._interpreter.parse(self.expression)
+        except SyntaxError:
+            raise ValueError(self._error_message()) from None
+
+    def _error_message(self):
+        errors = self._interpreter.error
+        self._interpreter.error = []
+        if not errors:
+            return self.expression
+        _, message = errors[-1].get_error()
+        return message.strip().splitlines()[-1]
+
+    def evaluate(self, values):
+        """Evaluate over a 2-D (rows, columns) float array; returns one value per row.
+
+        Returns None when the data does not have every referenced column yet.
+        """
+        if values.ndim != 2 or any(number < 1 for number in self.columns):
+            return None
+        if self.columns and self.columns[-1] > values.shape[1]:
+            return None
+
+        symtable = self._interpreter.symtable
+        for number in self.columns:
+            symtable[f"c{number}"] = values[:, number - 1]
+        try:
+            result = self._interpreter.run(self._node, with_raise=True)
+        except Exception:
+            raise ValueError(self._error_message()) from None
+
+        result = np.asarray(result, dtype=float)
+        return np.broadcast_to(result, (values.shape[0],)).copy()
+
+
+class DerivedChannels:
+    """Compiled expressions plus their results for the current data generation.
+
+    The generation is any hashable key that changes when the data does (for
+    example the number of lines received and the window shown), so a frame
+    that redraws unchanged data reuses the previous results. Only the
+    `CACHE_SIZE` most recently used expressions are kept compiled; one that
+    does not compile is never stored.
+    """
+
+    def __init__(self):
+        self._channels = OrderedDict()
+        self._generation = None
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def get(self, expression):
+        expression = expression.strip()
+        with self._lock:
+            channel = self._channels.get(expression)
+            if channel is None:
+                # Raises for an expression that does not compile, keeping it out
+                channel = DerivedChannel(expression)
+                self._channels[expression] = channel
+                while len(self._channels) > CACHE_SIZE:
+                    self._channels.popitem(last=False)
+            else:
+                self._channels.move_to_end(expression)
+            return channel
+
+    def evaluate(self, expression, values, generation):
+        channel = self.get(expression)
+        with self._lock:
+            if generation != self._generation:
+                self._generation = generation
+                self._results = {}
+            if channel.expression in self._results:
+                return self._results[channel.expression]
+
+        result = channel.evaluate(values)
+        with self._lock:
+            if generation == self._generation:
+                self._results[channel.expression] = result
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._channels = OrderedDict()
+            self._generation = None
+            self._results = {}
+
+
+_derived_channels = None
+
+
+def get_derived_channels():
+    global _derived_channels
+    if _derived_channels is None:
+        _derived_channels = DerivedChannels()
+    return _derived_channels
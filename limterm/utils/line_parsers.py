@@ -0,0 +1,259 @@
+"""
+Line parsers for the text wire formats a device may send.
+
+Every parser turns a line into a list of column tokens and a batch of lines
+into a 2-D float array with one row per line (NaN where a column is missing
+or not numeric, so a blank line gives a row of NaN). The whitespace and CSV
+parsers convert a whole batch with one numpy.loadtxt call and only fall back
+to per-line parsing for ragged or non-numeric batches.
+
+All consumers share one ParserSelector, which either uses the format picked
+by the user or detects it from the first lines received after connecting.
+"""
+
+import json
+import re
+import threading
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+def _to_float(token):
+    try:
+        return float(token)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class LineParser(ABC):
+    name = None
+
+    @abstractmethod
+    def matches(self, line):
+        """Return True when the line looks like this format."""
+
+    @abstractmethod
+    def parse_line(self, line):
+        """Split a line into its column tokens."""
+
+    def parse_lines(self, lines):
+        """Convert a batch of lines into a 2-D float array, one row per line."""
+        rows = [[_to_float(token) for token in self.parse_line(line)] for line in lines]
+        width = max((len(row) for row in rows), default=0)
+        values = np.full((len(rows), width), np.nan)
+        for index, row in enumerate(rows):
+            values[index, : len(row)] = row
+        return values
+
+    def reset(self):
+        pass
+
+
+class WhitespaceParser(LineParser):
+    name = "whitespace"
+    delimiter = None
+
+    def matches(self, line):
+        tokens = self.parse_line(line)
+        return bool(tokens) and all(not np.isnan(_to_float(v)) for v in tokens)
+
+    def parse_line(self, line):
+        return line.strip().split()
+
+    def parse_lines(self, lines):
+        if not lines:
+            return np.empty((0, 0))
+        try:
+            values = np.loadtxt(
+                lines, delimiter=self.delimiter, comments=None, ndmin=2, dtype=float
+            )
+        except ValueError:
+            return super().parse_lines(lines)
+        if len(values) == len(lines):
+            return values
+
+        # loadtxt skips blank lines; give them rows of NaN again
+        present = [index for index, line in enumerate(lines) if line.strip()]
+        if len(present) != len(values):
+            return super().parse_lines(lines)
+        rows = np.full((len(lines), values.shape[1]), np.nan)
+        rows[present] = values
+        return rows
+
+
+class CsvParser(WhitespaceParser):
+    name = "csv"
+    delimiter = ","
+
+    def matches(self, line):
+        return "," in line and super().matches(line)
+
+    def parse_line(self, line):
+        return [token.strip() for token in line.strip().split(",")]
+
+
+class KeyedParser(LineParser):
+    """Base for formats with named fields; columns follow first-seen key order."""
+
+    def __init__(self):
+        self.keys = []
+        self._columns = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self.keys = []
+            self._columns = {}
+
+    @abstractmethod
+    def fields(self, line):
+        """The (key, value) pairs of a line, in the order they appear."""
+
+    def parse_line(self, line):
+        fields = self.fields(line)
+        if not fields:
+            return []
+
+        if any(key not in self._columns for key, _ in fields):
+            with self._lock:
+                for key, _ in fields:
+                    if key not in self._columns:
+                        self._columns[key] = len(self.keys)
+                        self.keys.append(key)
+
+        tokens = ["nan"] * len(self.keys)
+        for key, value in fields:
+            tokens[self._columns[key]] = str(value)
+        return tokens
+
+
+class KeyValueParser(KeyedParser):
+    name = "keyvalue"
+    pattern = re.compile(r"([A-Za-z_][\w.\-]*)\s*=\s*([^\s,;]+)")
+
+    def matches(self, line):
+        return bool(self.pattern.search(line))
+
+    def fields(self, line):
+        return self.pattern.findall(line)
+
+
+class JsonParser(KeyedParser):
+    name = "json"
+
+    def matches(self, line):
+        line = line.strip()
+        if not line.startswith(("{", "[")):
+            return False
+        try:
+            json.loads(line)
+            return True
+        except ValueError:
+            return False
+
+    def fields(self, line):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return []
+
+        if isinstance(record, list):
+            record = {str(index): value for index, value in enumerate(record)}
+        if not isinstance(record, dict):
+            return []
+        return [
+            (key, value)
+            for key, value in record.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        ]
+
+
+PARSERS = {
+    "whitespace": WhitespaceParser,
+    "csv": CsvParser,
+    "keyvalue": KeyValueParser,
+    "json": JsonParser,
+}
+
+# Most specific first: a JSON or key=value line may also contain commas
+DETECTION_ORDER = ("json", "keyvalue", "csv", "whitespace")
+
+
+def detect_format(lines, threshold=0.8):
+    """Return the name of the format most of the sample lines match."""
+    lines = [line for line in lines if line.strip()]
+    if not lines:
+        return None
+
+    for name in DETECTION_ORDER:
+        parser = PARSERS[name]()
+        matched = sum(1 for line in lines if parser.matches(line))
+        if matched >= threshold * len(lines):
+            return name
+    return None
+
+
+class ParserSelector:
+    """The parser shared by all consumers, fixed or auto-detected."""
+
+    def __init__(self, mode="auto", sample_size=20):
+        self.sample_size = sample_size
+        self.detect_callback = None
+        self.mode = mode
+        self.parser = WhitespaceParser()
+        self._samples = []
+        self.set_mode(mode)
+
+    @property
+    def name(self):
+        return self.parser.name
+
+    @property
+    def detecting(self):
+        return self.mode == "auto" and self._samples is not None
+
+    def set_mode(self, mode):
+        self.mode = mode if mode in PARSERS else "auto"
+        if self.mode != "auto":
+            self.parser = PARSERS[self.mode]()
+        self.reset()
+
+    def reset(self):
+        """Start over, e.g. after connecting to a different device."""
+        self.parser.reset()
+        self._samples = [] if self.mode == "auto" else None
+
+    def observe(self, line):
+        """Feed a received line to format detection while it is still running."""
+        if not self.detecting:
+            return
+
+        self._samples.append(line)
+        name = detect_format(self._samples)
+        if name and name != self.parser.name:
+            parser = PARSERS[name]()
+            # Seed named columns in arrival order before consumers see them
+            for sample in self._samples:
+                parser.parse_line(sample)
+            self.parser = parser
+
+        if len(self._samples) >= self.sample_size:
+            self._samples = None
+            if self.detect_callback:
+                self.detect_callback(self.parser.name)
+
+    def parse_line(self, line):
+        return self.parser.parse_line(line)
+
+    def parse_lines(self, lines):
+        return self.parser.parse_lines(lines)
+
+
+_line_parser = None
+
+
+def get_line_parser():
+    global _line_parser
+    if _line_parser is None:
+        _line_parser = ParserSelector()
+    return _line_parser
@@ -0,0 +1,117 @@
+"""
+On-demand cProfile and tracemalloc sampling of the running application.
+
+cProfile only sees the thread that enabled it, which is the Tk thread where
+parsing and rendering run; tracemalloc covers allocations from every thread.
+"""
+
+import cProfile
+import datetime
+import io
+import os
+import pstats
+import time
+import tracemalloc
+from ..config import CAPTURE_DIR
+
+
+class SessionProfiler:
+    def __init__(self, output_dir=CAPTURE_DIR, top_count=25):
+        self.output_dir = output_dir
+        self.top_count = top_count
+        self._profile = None
+        self._owns_tracemalloc = False
+        self._started_at = None
+
+    @property
+    def is_running(self):
+        return self._profile is not None
+
+    def start(self):
+        if self.is_running:
+            return
+
+        profile = cProfile.Profile()
+        self._owns_tracemalloc = not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start(10)
+        tracemalloc.reset_peak()
+
+        try:
+            profile.enable()
+        except ValueError:
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+            raise
+
+        self._profile = profile
+        self._started_at = time.time()
+
+    def stop(self):
+        """Stop sampling, write the reports and return a summary dict."""
+        if not self.is_running:
+            return None
+
+        profile = self._profile
+        profile.disable()
+        self._profile = None
+        elapsed = time.time() - self._started_at
+
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+
+        if not os.path.exists(self.output_dir):
+            os.makedirs(self.output_dir)
+
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        prof_path = os.path.join(self.output_dir, f"profile_{timestamp}.prof")
+        report_path = os.path.join(self.output_dir, f"profile_{timestamp}.txt")
+
+        profile.dump_stats(prof_path)
+
+        stats_stream = io.StringIO()
+        stats = pstats.Stats(profile, stream=stats_stream)
+        stats_stream.write("## Top functions by cumulative time (Tk thread)\n")
+        stats.sort_stats("cumulative").print_stats(self.top_count)
+        stats_stream.write("## Top functions by own time (Tk thread)\n")
+        stats.sort_stats("tottime").print_stats(self.top_count)
+
+        allocations = snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ]
+        ).statistics("lineno")[: self.top_count]
+
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(f"# Profile {timestamp} ({elapsed:.1f} s)\n\n")
+            f.write(stats_stream.getvalue())
+            f.write(f"\n## Top allocations (peak {peak / 1024 / 1024:.2f} MiB)\n")
+            for stat in allocations:
+                f.write(f"{stat}\n")
+
+        return {
+            "seconds": elapsed,
+            "prof_path": prof_path,
+            "report_path": report_path,
+            "peak_bytes": peak,
+            "top_function": self._top_function(stats),
+        }
+
+    @staticmethod
+    def _top_function(stats):
+        """Return (name, own seconds) of the function with the most own time."""
+        best = None
+        for (filename, line, name), (_, _, own_time, _, _) in stats.stats.items():
+            if "_lsprof.Profiler" in name:
+                continue
+            if best is None or own_time > best[1]:
+                label = (
+                    name
+                    if filename == "~"
+                    else f"{os.path.basename(filename)}:{line}({name})"
+                )
+                best = (label, own_time)
+        return best
@@ -2,6 +2,8 @@ import serial
 import serial.tools.list_ports
 import glob
 import platform
+import numpy as np
+from .line_parsers import get_line_parser
 
 
 class SerialPortManager:
@@ -27,20 +29,26 @@ class SerialPortManager:
 class DataParser:
     @staticmethod
     def parse_line(line):
-        return line.strip().split()
+        return get_line_parser().parse_line(line)
+
+    @staticmethod
+    def parse_lines(data_lines):
+        """Return the lines as a 2-D float array, NaN where a value is missing."""
+        return get_line_parser().parse_lines(list(data_lines))
 
     @staticmethod
     def extract_columns(data_lines, x_col, y_col):
-        x_data = []
-        y_data = []
-
-        for line in data_lines:
-            try:
-                columns = DataParser.parse_line(line)
-                if len(columns) > max(x_col, y_col):
-                    x_data.append(float(columns[x_col]))
-                    y_data.append(float(columns[y_col]))
-            except (ValueError, IndexError):
-                continue
-
-        return x_data, y_data
+        return DataParser.select_columns(
+            DataParser.parse_lines(data_lines), x_col, y_col
+        )
+
+    @staticmethod
+    def select_columns(values, x_col, y_col):
+        """Rows of two columns of an already parsed array where both are numeric."""
+        if values.ndim != 2 or values.shape[1] <= max(x_col, y_col):
+            return [], []
+
+        x_values = values[:, x_col]
+        y_values = values[:, y_col]
+        valid = ~(np.isnan(x_values) | np.isnan(y_values))
+        return x_values[valid].tolist(), y_values[valid].tolist()